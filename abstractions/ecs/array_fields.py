@@ -0,0 +1,278 @@
+"""
+Array Fields: Zero-Copy Numeric Array Support for Entities
+
+This module provides first-class support for entity fields holding numeric arrays
+(embeddings, feature vectors, time series) without paying per-element Python
+overhead in the versioning machinery.
+
+Features:
+- NDArray field type for pydantic entities (validated, frozen, JSON-serializable)
+- Read-only buffers shared between stored versions instead of deep copies
+- Content hashing for change detection in find_modified_entities
+- Copy-on-write helper for functions that need to mutate an array in place
+
+NumPy is an optional dependency: when it is not installed the helpers degrade to
+plain equality semantics and NDArray fields raise ImportError on validation.
+"""
+
+import hashlib
+from typing import Annotated, Any, Dict, Optional, Tuple, Type, get_args
+
+from pydantic_core import core_schema
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def numpy_available() -> bool:
+    """Return True when numpy can be used for array fields."""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for array-valued entity fields (pip install numpy)")
+
+
+if np is not None:
+
+    class SharedArray(np.ndarray):
+        """
+        Read-only ndarray whose buffer is shared instead of copied.
+
+        Deep copies of a frozen SharedArray return the array itself, so
+        ``model_copy(deep=True)`` on trees and entities (used by the registry for
+        every stored snapshot) shares one buffer across all versions. Writable
+        instances (e.g. arithmetic results) copy like a normal ndarray.
+        """
+
+        def __deepcopy__(self, memo: Dict[int, Any]) -> "np.ndarray":
+            if not self.flags.writeable:
+                memo[id(self)] = self
+                return self
+            return super().__deepcopy__(memo)
+
+        def __copy__(self) -> "np.ndarray":
+            if not self.flags.writeable:
+                return self
+            return super().__copy__()
+
+else:  # pragma: no cover - numpy is optional
+    SharedArray = None  # type: ignore[assignment,misc]
+
+
+def is_array(value: Any) -> bool:
+    """Check whether a value is a numpy array (False when numpy is missing)."""
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _buffer_frozen(array: "np.ndarray") -> bool:
+    """True if nothing in the view chain of an array can write to its buffer."""
+    current: Any = array
+    while isinstance(current, np.ndarray):
+        if current.flags.writeable:
+            return False
+        current = current.base
+    if isinstance(current, memoryview):
+        return current.readonly
+    return current is None or isinstance(current, bytes)
+
+
+def freeze_array(value: Any) -> "np.ndarray":
+    """
+    Convert an array-like value into a read-only SharedArray.
+
+    Frozen SharedArrays whose whole view chain is read-only are returned as is.
+    A buffer is shared only when nobody can write to it (read-only all the way
+    down, or freshly built from a Python sequence); anything the caller could
+    still write through is copied first.
+    """
+    _require_numpy()
+    if isinstance(value, SharedArray) and _buffer_frozen(value):
+        return value
+    array = np.asarray(value)
+    if _buffer_frozen(array):
+        # Immutable down to the underlying buffer: share it
+        frozen = array.view(SharedArray)
+    elif array.base is None and not isinstance(value, np.ndarray):
+        # Freshly built from a Python sequence: nobody else holds this buffer
+        array.flags.writeable = False
+        frozen = array.view(SharedArray)
+    else:
+        # Caller-owned buffer (or a read-only view of one): take a private copy so
+        # later writes by the caller cannot leak into stored versions
+        private = np.array(array, copy=True)
+        private.flags.writeable = False
+        frozen = private.view(SharedArray)
+    frozen.flags.writeable = False
+    return frozen
+
+
+def array_content_hash(array: "np.ndarray") -> Optional[str]:
+    """
+    Compute a content hash over dtype, shape and raw bytes of an array.
+
+    Hashes of frozen SharedArrays are cached on the instance, so repeated change
+    detection against the same stored buffer costs a single pass over the data.
+    Returns None for object arrays, which have no stable byte representation.
+    """
+    if array.dtype.hasobject:
+        return None
+    cached = getattr(array, "_content_hash", None) if isinstance(array, SharedArray) else None
+    if cached is not None:
+        return cached
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array.dtype.str.encode())
+    digest.update(repr(array.shape).encode())
+    digest.update(np.ascontiguousarray(array).data)
+    content_hash = digest.hexdigest()
+    if isinstance(array, SharedArray) and not array.flags.writeable:
+        array._content_hash = content_hash
+    return content_hash
+
+
+def arrays_differ(array1: "np.ndarray", array2: "np.ndarray") -> bool:
+    """Compare two arrays by identity, shape/dtype and then content hash."""
+    if array1 is array2:
+        return False
+    if array1.shape != array2.shape or array1.dtype != array2.dtype:
+        return True
+    hash1 = array_content_hash(array1)
+    hash2 = array_content_hash(array2)
+    if hash1 is None or hash2 is None:
+        return not bool(np.array_equal(array1, array2))
+    return hash1 != hash2
+
+
+def values_differ(value1: Any, value2: Any) -> bool:
+    """
+    Array-aware inequality used by change detection.
+
+    Plain values use ``!=``; arrays (also nested inside lists, tuples and dicts)
+    are compared with arrays_differ, avoiding the ambiguous truth value of an
+    element-wise ``!=``.
+    """
+    if value1 is value2:
+        return False
+    if is_array(value1) or is_array(value2):
+        if not (is_array(value1) and is_array(value2)):
+            return True
+        return arrays_differ(value1, value2)
+    try:
+        return bool(value1 != value2)
+    except ValueError:
+        # Containers holding arrays: compare element by element
+        if isinstance(value1, (list, tuple)) and isinstance(value2, (list, tuple)):
+            if type(value1) != type(value2) or len(value1) != len(value2):
+                return True
+            return any(values_differ(v1, v2) for v1, v2 in zip(value1, value2))
+        if isinstance(value1, dict) and isinstance(value2, dict):
+            if value1.keys() != value2.keys():
+                return True
+            return any(values_differ(value1[k], value2[k]) for k in value1)
+        raise
+
+
+class _ArrayFieldAnnotation:
+    """Pydantic annotation marker turning ndarray fields into frozen SharedArrays."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, when_used="json-unless-none"
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: Any) -> Dict[str, Any]:
+        return {"type": "array", "items": {}}
+
+    @staticmethod
+    def _validate(value: Any) -> "np.ndarray":
+        try:
+            return freeze_array(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"cannot convert value to a numpy array: {e}")
+
+    @staticmethod
+    def _serialize(value: "np.ndarray") -> Any:
+        return value.tolist()
+
+
+# Field annotation for array-valued entity fields:
+#     class Embedding(Entity):
+#         vector: NDArray
+NDArray = Annotated[Any if np is None else np.ndarray, _ArrayFieldAnnotation]
+
+
+_array_field_cache: Dict[Type[Any], Tuple[str, ...]] = {}
+
+
+def _annotation_has_marker(annotation: Any) -> bool:
+    if annotation is _ArrayFieldAnnotation or isinstance(annotation, _ArrayFieldAnnotation):
+        return True
+    metadata = getattr(annotation, "__metadata__", ())
+    if any(item is _ArrayFieldAnnotation for item in metadata):
+        return True
+    return any(_annotation_has_marker(arg) for arg in get_args(annotation))
+
+
+def array_field_names(entity_class: Type[Any]) -> Tuple[str, ...]:
+    """Names of the fields declared as NDArray on an entity class (cached per class)."""
+    cached = _array_field_cache.get(entity_class)
+    if cached is not None:
+        return cached
+    names = []
+    for field_name, field_info in getattr(entity_class, "model_fields", {}).items():
+        if any(item is _ArrayFieldAnnotation for item in field_info.metadata) or \
+                _annotation_has_marker(field_info.annotation):
+            names.append(field_name)
+    result = tuple(names)
+    _array_field_cache[entity_class] = result
+    return result
+
+
+def freeze_array_fields(entity: Any) -> None:
+    """
+    Re-freeze NDArray fields of an entity before it is stored.
+
+    Arrays replaced or made writable by ensure_writable are swapped for frozen
+    copies, so the stored version shares its buffer with every later snapshot
+    while the caller's array stays writable.
+    """
+    if np is None:
+        return
+    for field_name in array_field_names(type(entity)):
+        value = getattr(entity, field_name, None)
+        if is_array(value):
+            frozen = freeze_array(value)
+            if frozen is not value:
+                object.__setattr__(entity, field_name, frozen)
+
+
+def ensure_writable(entity: Any, field_name: str) -> "np.ndarray":
+    """
+    Copy-on-write access to an array field.
+
+    Returns a writable array for ``entity.field_name``: if the current buffer is
+    read-only (shared with stored versions) it is copied and the copy is assigned
+    to the field, so in-place mutation never touches other versions. Change
+    detection then picks the modification up through the content hash.
+
+    Example:
+        vector = ensure_writable(embedding, "vector")
+        vector *= 2.0
+    """
+    _require_numpy()
+    value = getattr(entity, field_name)
+    if not is_array(value):
+        raise ValueError(f"Field '{field_name}' of {type(entity).__name__} does not hold an array")
+    if value.flags.writeable:
+        return value
+    writable = np.array(value, copy=True)
+    object.__setattr__(entity, field_name, writable)
+    return writable
@@ -0,0 +1,414 @@
+"""
+Bulk Ingest: Columnar Entity Construction and Batched Registration
+
+This module creates large numbers of flat entities from columnar data without
+paying one full pydantic validation plus one promote_to_root per row.
+
+Features:
+- Columnar input from dict-of-lists, CSV files and JSON Lines files
+- One validation pass per column (TypeAdapter over the whole column slice,
+  including the field's own constraints)
+- Classes with custom validators are validated row by row with model_validate
+- Entities assembled with model_construct and pre-initialized attribute_source
+- Batched registration through EntityRegistry.register_entities_batch
+- Bounded memory for files: rows are processed in fixed-size batches
+
+Only fields that do not hold entities can be ingested this way; nested entity
+trees still go through the regular constructor and promote_to_root.
+"""
+
+import copy
+import csv
+import json
+from enum import Enum
+from uuid import UUID
+from typing import Annotated, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.lineage_io import open_text
+
+
+class BulkEntityFactory:
+    """
+    Batched constructor for Entity subclasses fed with columnar data.
+
+    Example:
+        students = BulkEntityFactory.from_columns(Student, {
+            "name": ["Alice", "Bob"],
+            "gpa": [3.8, 3.2],
+        })
+    """
+
+    # Cache of column validators per (entity class, field name)
+    _adapter_cache: Dict[Tuple[Type[Entity], str], TypeAdapter] = {}
+    # Cache of ingestible field names per entity class
+    _field_cache: Dict[Type[Entity], Dict[str, Any]] = {}
+    # Cache of per-field default builders per entity class (None when model_construct must be used)
+    _default_cache: Dict[Type[Entity], Optional[List[Tuple[str, Callable[[], Any]]]]] = {}
+    # Cache of whether an entity class declares validators beyond Entity's own
+    _validator_cache: Dict[Type[Entity], bool] = {}
+
+    DEFAULT_BATCH_SIZE = 10_000
+
+    @classmethod
+    def _ingestible_fields(cls, entity_class: Type[Entity]) -> Dict[str, Any]:
+        """Map of field name -> annotation for fields that can be filled from columns."""
+        cached = cls._field_cache.get(entity_class)
+        if cached is not None:
+            return cached
+        fields = {
+            name: field_info.annotation
+            for name, field_info in entity_class.model_fields.items()
+            if name not in Entity.model_fields and not _annotation_mentions_entity(field_info.annotation)
+        }
+        cls._field_cache[entity_class] = fields
+        return fields
+
+    @classmethod
+    def is_flat(cls, entity_class: Type[Entity]) -> bool:
+        """True if no field of the class can hold an entity (single-node trees)."""
+        return all(
+            not _annotation_mentions_entity(field_info.annotation)
+            for field_info in entity_class.model_fields.values()
+        )
+
+    @classmethod
+    def has_custom_validators(cls, entity_class: Type[Entity]) -> bool:
+        """True if the class declares field, model or root validators that Entity does not."""
+        cached = cls._validator_cache.get(entity_class)
+        if cached is not None:
+            return cached
+        decorators = entity_class.__pydantic_decorators__
+        inherited = Entity.__pydantic_decorators__
+        result = any(
+            name not in getattr(inherited, kind)
+            for kind in ("validators", "field_validators", "root_validators", "model_validators")
+            for name in getattr(decorators, kind)
+        )
+        cls._validator_cache[entity_class] = result
+        return result
+
+    @classmethod
+    def _default_builders(cls, entity_class: Type[Entity]) -> Optional[List[Tuple[str, Callable[[], Any]]]]:
+        """
+        Precompute one zero-argument default builder per field.
+
+        model_construct re-inspects every default factory signature per instance,
+        which dominates bulk construction; resolving the builders once per class
+        removes that cost. Returns None for models needing model_construct
+        (aliases, private attributes, post-init hooks, extra fields) or full
+        validation (custom validators).
+        """
+        if entity_class in cls._default_cache:
+            return cls._default_cache[entity_class]
+        builders: Optional[List[Tuple[str, Callable[[], Any]]]] = []
+        if entity_class.__private_attributes__ or entity_class.__pydantic_post_init__ or \
+                entity_class.model_config.get("extra") == "allow" or cls.has_custom_validators(entity_class):
+            builders = None
+        else:
+            for name, field_info in entity_class.model_fields.items():
+                if field_info.alias is not None or field_info.validation_alias is not None or \
+                        getattr(field_info, "default_factory_takes_data", False):
+                    builders = None
+                    break
+                if field_info.default_factory is not None:
+                    builders.append((name, field_info.default_factory))
+                elif field_info.is_required():
+                    builders.append((name, _missing_value))
+                elif isinstance(field_info.default, _IMMUTABLE_DEFAULTS) or field_info.default is None:
+                    builders.append((name, _constant(field_info.default)))
+                else:
+                    builders.append((name, _deep_copier(field_info.default)))
+        cls._default_cache[entity_class] = builders
+        return builders
+
+    @classmethod
+    def _column_adapter(cls, entity_class: Type[Entity], field_name: str, annotation: Any) -> TypeAdapter:
+        key = (entity_class, field_name)
+        adapter = cls._adapter_cache.get(key)
+        if adapter is None:
+            # Keep the field's constraints (ge/le/pattern/...) attached to the item type
+            metadata = entity_class.model_fields[field_name].metadata
+            item_type = Annotated[(annotation, *metadata)] if metadata else annotation
+            adapter = TypeAdapter(List[item_type])  # type: ignore[valid-type]
+            cls._adapter_cache[key] = adapter
+        return adapter
+
+    @classmethod
+    def _check_columns(cls, entity_class: Type[Entity], column_names: Iterable[str]) -> Dict[str, Any]:
+        fields = cls._ingestible_fields(entity_class)
+        column_names = list(column_names)
+        unknown = [name for name in column_names if name not in fields]
+        if unknown:
+            raise ValueError(
+                f"Columns {unknown} cannot be ingested into {entity_class.__name__}; "
+                f"valid columns are: {sorted(fields)}"
+            )
+        missing = [
+            name for name in fields
+            if name not in column_names and entity_class.model_fields[name].is_required()
+        ]
+        if missing:
+            raise ValueError(f"Missing required columns for {entity_class.__name__}: {missing}")
+        return fields
+
+    @classmethod
+    def _build_batch(
+        cls,
+        entity_class: Type[Entity],
+        columns: Mapping[str, Sequence[Any]],
+        fields: Dict[str, Any],
+        row_count: int,
+        row_offset: int = 0
+    ) -> List[Entity]:
+        """Validate each column once and assemble row_count entities."""
+        if cls.has_custom_validators(entity_class):
+            return cls._validate_rows(entity_class, columns, row_count, row_offset)
+
+        # Step 1: One validation pass per column
+        validated: Dict[str, List[Any]] = {}
+        for field_name, column in columns.items():
+            adapter = cls._column_adapter(entity_class, field_name, fields[field_name])
+            try:
+                validated[field_name] = adapter.validate_python(list(column))
+            except ValidationError as e:
+                first_error = e.errors()[0]
+                row = first_error["loc"][0] if first_error["loc"] else 0
+                raise ValueError(
+                    f"Column '{field_name}' of {entity_class.__name__} failed validation at row "
+                    f"{row_offset + int(row)}: {first_error['msg']}"
+                )
+
+        # Step 2: Assemble entities without re-validating; attribute_source is initialized
+        # by Entity itself, the same way validate_attribute_source does for Python values
+        column_items = list(validated.items())
+        builders = cls._default_builders(entity_class)
+        if builders is not None:
+            builders = [(name, builder) for name, builder in builders if name not in validated]
+        fields_set = set(validated)
+        entities: List[Entity] = []
+        for row in range(row_count):
+            if builders is None:
+                entity = entity_class.model_construct(**{name: values[row] for name, values in column_items})
+                entity.__dict__["attribute_source"] = entity_class.initial_attribute_source(entity.__dict__)
+            else:
+                values_dict = {name: builder() for name, builder in builders}
+                for name, values in column_items:
+                    values_dict[name] = values[row]
+                entity = entity_class.from_validated_values(values_dict, fields_set)
+            entities.append(entity)
+        return entities
+
+    @classmethod
+    def _validate_rows(
+        cls,
+        entity_class: Type[Entity],
+        columns: Mapping[str, Sequence[Any]],
+        row_count: int,
+        row_offset: int = 0
+    ) -> List[Entity]:
+        """Build entities one row at a time through model_validate (runs every validator)."""
+        column_items = list(columns.items())
+        entities: List[Entity] = []
+        for row in range(row_count):
+            try:
+                entities.append(entity_class.model_validate({name: values[row] for name, values in column_items}))
+            except ValidationError as e:
+                first_error = e.errors()[0]
+                location = ".".join(str(part) for part in first_error["loc"]) or "row"
+                raise ValueError(
+                    f"Row {row_offset + row} of {entity_class.__name__} failed validation "
+                    f"({location}): {first_error['msg']}"
+                )
+        return entities
+
+    @classmethod
+    def from_columns(
+        cls,
+        entity_class: Type[Entity],
+        columns: Mapping[str, Sequence[Any]],
+        register: bool = True,
+        batch_size: Optional[int] = None
+    ) -> List[Entity]:
+        """
+        Create entities from a dict of equally long columns.
+
+        Args:
+            entity_class: Entity subclass to instantiate
+            columns: Mapping of field name -> column of values
+            register: Promote and register every entity as a root (batched)
+            batch_size: Rows validated and registered per batch
+
+        Returns:
+            List of created entities in row order
+        """
+        fields = cls._check_columns(entity_class, columns.keys())
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got lengths {sorted(lengths)}")
+        row_count = lengths.pop() if lengths else 0
+        batch_size = batch_size or cls.DEFAULT_BATCH_SIZE
+        flat = cls.is_flat(entity_class)
+
+        entities: List[Entity] = []
+        for start in range(0, row_count, batch_size):
+            stop = min(start + batch_size, row_count)
+            batch_columns = {name: column[start:stop] for name, column in columns.items()}
+            batch = cls._build_batch(entity_class, batch_columns, fields, stop - start, row_offset=start)
+            if register:
+                EntityRegistry.register_entities_batch(batch, flat=flat)
+            entities.extend(batch)
+        return entities
+
+    @classmethod
+    def iter_from_records(
+        cls,
+        entity_class: Type[Entity],
+        records: Iterable[Mapping[str, Any]],
+        register: bool = True,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[Entity]]:
+        """
+        Stream row records into entities, yielding one list per batch.
+
+        Rows are pivoted into columns batch by batch, so memory stays bounded
+        by batch_size regardless of the input size.
+        """
+        batch_size = batch_size or cls.DEFAULT_BATCH_SIZE
+        fields: Optional[Dict[str, Any]] = None
+        column_names: List[str] = []
+        flat = cls.is_flat(entity_class)
+        rows: List[Mapping[str, Any]] = []
+        row_offset = 0
+
+        def flush() -> List[Entity]:
+            columns = {name: [row[name] for row in rows] for name in column_names}
+            batch = cls._build_batch(entity_class, columns, fields, len(rows), row_offset=row_offset)
+            if register:
+                EntityRegistry.register_entities_batch(batch, flat=flat)
+            return batch
+
+        for record in records:
+            if fields is None:
+                column_names = list(record.keys())
+                fields = cls._check_columns(entity_class, column_names)
+            elif len(record) != len(column_names) or any(name not in record for name in column_names):
+                raise ValueError(
+                    f"Row {row_offset + len(rows)} has columns {sorted(record)}, expected {sorted(column_names)}"
+                )
+            rows.append(record)
+            if len(rows) >= batch_size:
+                yield flush()
+                row_offset += len(rows)
+                rows = []
+        if rows:
+            yield flush()
+
+    @classmethod
+    def from_records(
+        cls,
+        entity_class: Type[Entity],
+        records: Iterable[Mapping[str, Any]],
+        register: bool = True,
+        batch_size: Optional[int] = None
+    ) -> List[Entity]:
+        """Create entities from an iterable of row dicts (all rows share the same keys)."""
+        entities: List[Entity] = []
+        for batch in cls.iter_from_records(entity_class, records, register=register, batch_size=batch_size):
+            entities.extend(batch)
+        return entities
+
+    @classmethod
+    def from_csv(
+        cls,
+        entity_class: Type[Entity],
+        source: Union[str, TextIO],
+        register: bool = True,
+        batch_size: Optional[int] = None,
+        **reader_kwargs: Any
+    ) -> List[Entity]:
+        """
+        Create entities from a CSV file with a header row naming the fields.
+
+        Empty cells become None for optional fields, and cells of container
+        fields (lists, dicts, tuples, sets) are parsed as JSON.
+        """
+        handle, owned = open_text(source, "r", newline="")
+        try:
+            reader = csv.DictReader(handle, **reader_kwargs)
+            fields = cls._check_columns(entity_class, reader.fieldnames or [])
+            nullable = {name for name in reader.fieldnames or [] if _accepts_none(fields[name])}
+            json_fields = {name for name in reader.fieldnames or [] if _is_container(fields[name])}
+
+            def decoded_rows() -> Iterator[Dict[str, Any]]:
+                for row in reader:
+                    for name in nullable:
+                        if row[name] == "":
+                            row[name] = None
+                    for name in json_fields:
+                        if row[name]:
+                            row[name] = json.loads(row[name])
+                    yield row
+
+            return cls.from_records(entity_class, decoded_rows(), register=register, batch_size=batch_size)
+        finally:
+            if owned:
+                handle.close()
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        entity_class: Type[Entity],
+        source: Union[str, TextIO],
+        register: bool = True,
+        batch_size: Optional[int] = None
+    ) -> List[Entity]:
+        """Create entities from a JSON Lines file with one object per row."""
+        handle, owned = open_text(source, "r")
+        try:
+            records = (json.loads(line) for line in handle if line.strip())
+            return cls.from_records(entity_class, records, register=register, batch_size=batch_size)
+        finally:
+            if owned:
+                handle.close()
+
+
+_IMMUTABLE_DEFAULTS = (str, int, float, bool, bytes, tuple, frozenset, Enum, UUID)
+
+
+def _missing_value() -> Any:
+    raise ValueError("required field has no column and no default")
+
+
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
+def _deep_copier(value: Any) -> Callable[[], Any]:
+    return lambda: copy.deepcopy(value)
+
+
+def _annotation_mentions_entity(annotation: Any) -> bool:
+    """True if an annotation (or any of its type arguments) is an Entity subclass."""
+    if isinstance(annotation, type):
+        try:
+            return issubclass(annotation, Entity)
+        except TypeError:
+            return False
+    return any(_annotation_mentions_entity(arg) for arg in get_args(annotation))
+
+
+def _accepts_none(annotation: Any) -> bool:
+    return annotation is None or annotation is type(None) or annotation is Any or \
+        any(arg is type(None) for arg in get_args(annotation))
+
+
+def _is_container(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin in (list, dict, tuple, set, frozenset):
+        return True
+    if origin is Union:
+        return any(_is_container(arg) for arg in get_args(annotation))
+    return annotation in (list, dict, tuple, set, frozenset)
@@ -11,22 +11,34 @@ using all our proven patterns:
 - Complete provenance via attribute_source
 """
 
-from typing import Dict, Any, Callable, Optional, List, Union, get_type_hints, Type, Set, Tuple
+from typing import Dict, Any, Callable, Optional, List, Union, get_type_hints, Type, Set, Tuple, Iterable, Iterator, AsyncIterable, AsyncIterator, MutableMapping
 from pydantic import create_model, BaseModel
-from inspect import signature, iscoroutinefunction, getdoc
+from inspect import signature, iscoroutinefunction, isasyncgenfunction, getdoc
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import asyncio
+import contextvars
+import threading
 import time
+import tracemalloc
+from contextlib import contextmanager
 from uuid import UUID, uuid4
 import hashlib
 from functools import partial
+from collections import OrderedDict, deque
+import collections.abc
 
-from abstractions.ecs.entity import Entity, EntityRegistry, build_entity_tree, find_modified_entities, FunctionExecution, ConfigEntity, create_dynamic_entity_class, EntityFactory
+from abstractions.ecs.entity import Entity, EntityRegistry, EntityTree, build_entity_tree, find_modified_entities, FunctionExecution, ConfigEntity, create_dynamic_entity_class, EntityFactory
 from abstractions.ecs.ecs_address_parser import EntityReferenceResolver, InputPatternClassifier, ECSAddressParser
 from abstractions.ecs.functional_api import create_composite_entity, resolve_data_with_tracking, create_composite_entity_with_pattern_detection, borrow_from_address
 from abstractions.ecs.return_type_analyzer import ReturnTypeAnalyzer, QuickPatternDetector
 from abstractions.ecs.entity_unpacker import EntityUnpacker, ContainerReconstructor
+from abstractions.ecs.type_safe_unpacker import CompiledUnpacker
+from abstractions.ecs.bulk_ingest import BulkEntityFactory
+from abstractions.ecs.process_execution import pack_value, unpack_value, unwrap_partial, ensure_process_compatible, ensure_picklable, process_entry
+from abstractions.ecs.recompute import RecomputeEngine, content_digest
+from abstractions.ecs.provenance_index import ProvenanceIndex
+from abstractions.ecs.execution_log import ExecutionLog
 import concurrent.futures
 
 def extract_entity_uuids(kwargs: Dict[str, Any]) -> Tuple[List[UUID], List[str]]:
@@ -79,6 +91,7 @@ def propagate_execution_context(context: Dict[str, Any], event_data: Dict[str, A
 
 # Event system imports for automatic event emission
 from abstractions.events.events import emit_events, ProcessingEvent, ProcessedEvent
+from abstractions.events.background_loop import run_sync
 from abstractions.events.callable_events import (
     FunctionExecutionEvent, FunctionExecutedEvent,
     StrategyDetectionEvent, StrategyDetectedEvent,
@@ -211,6 +224,452 @@ class FunctionSignatureCache:
         }
 
 
+class ConfigEntityClassCache:
+    """Bounded LRU cache of the dynamic ConfigEntity classes built for primitive parameters.
+    
+    Keyed by (function name, parameter names, parameter types) so repeated executions
+    only instantiate an existing class instead of calling create_model on every call.
+    """
+    
+    _classes: "OrderedDict[Tuple[str, Tuple[Tuple[str, type], ...]], Type[ConfigEntity]]" = OrderedDict()
+    max_size: int = 256
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    
+    @classmethod
+    def get_or_create(cls, function_name: str, primitive_params: Dict[str, Any]) -> Type[ConfigEntity]:
+        """Return the cached ConfigEntity class for this parameter shape, creating it on a miss."""
+        key = (function_name, tuple((name, type(value)) for name, value in primitive_params.items()))
+        
+        config_class = cls._classes.get(key)
+        if config_class is not None:
+            cls._hits += 1
+            cls._classes.move_to_end(key)
+            return config_class
+        
+        cls._misses += 1
+        # Fields are required: values always come from the call, never from a cached default
+        field_definitions = {name: (param_type, ...) for name, param_type in key[1]}
+        config_class = ConfigEntity.create_config_entity_class(
+            f"{function_name}Config",
+            field_definitions,
+            module_name="__callable_registry__"
+        )
+        cls._classes[key] = config_class
+        while len(cls._classes) > cls.max_size:
+            cls._classes.popitem(last=False)
+            cls._evictions += 1
+        return config_class
+    
+    @classmethod
+    def set_max_size(cls, max_size: int) -> None:
+        """Change the cache bound, evicting least recently used classes if needed."""
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        cls.max_size = max_size
+        while len(cls._classes) > cls.max_size:
+            cls._classes.popitem(last=False)
+            cls._evictions += 1
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached classes and reset statistics."""
+        cls._classes.clear()
+        cls._hits = cls._misses = cls._evictions = 0
+    
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = cls._hits + cls._misses
+        return {
+            "cache_size": len(cls._classes),
+            "max_size": cls.max_size,
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "evictions": cls._evictions,
+            "hit_rate": cls._hits / lookups if lookups else 0.0
+        }
+
+
+@dataclass
+class ExecutionPlan:
+    """Precomputed dispatch tables for a registered function.
+    
+    Built once at registration from the signature and type hints. Per-call
+    dispatch reduces the kwargs to a shape key (one kind per parameter:
+    "entity", "config_entity", "address" or "primitive") and looks up the
+    strategy, the input pattern classification, the partial signature and
+    the partial function metadata cached for that shape.
+    """
+    function_name: str
+    param_names: Tuple[str, ...]
+    param_types: Dict[str, Any]
+    config_slots: Dict[str, Type[ConfigEntity]]
+    
+    # Per-shape decision tables, filled on first use of each shape
+    strategy_table: Dict[Tuple[Tuple[str, str], ...], str] = field(default_factory=dict)
+    pattern_table: Dict[Tuple[Tuple[str, str], ...], Tuple[str, Dict[str, str]]] = field(default_factory=dict)
+    partial_signatures: Dict[Tuple[Tuple[str, str], ...], str] = field(default_factory=dict)
+    partial_metadata: Dict[Tuple[Tuple[Tuple[str, str], ...], Optional[type]], 'FunctionMetadata'] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    
+    @property
+    def expects_config_entity(self) -> bool:
+        return bool(self.config_slots)
+    
+    @classmethod
+    def from_function(cls, name: str, func: Callable, type_hints: Optional[Dict[str, Any]] = None) -> 'ExecutionPlan':
+        """Build the parameter classification table and config slots of a function."""
+        if type_hints is None:
+            type_hints = get_type_hints(func)
+        param_names = tuple(signature(func).parameters)
+        param_types = {param_name: type_hints.get(param_name) for param_name in param_names}
+        config_slots = {
+            param_name: param_type for param_name, param_type in param_types.items()
+            if is_top_level_config_entity(param_type)
+        }
+        return cls(
+            function_name=name,
+            param_names=param_names,
+            param_types=param_types,
+            config_slots=config_slots
+        )
+    
+    @staticmethod
+    def value_kind(value: Any) -> str:
+        """Classify a single argument value."""
+        if isinstance(value, ConfigEntity):
+            return "config_entity"
+        if isinstance(value, Entity):
+            return "entity"
+        if isinstance(value, str) and ECSAddressParser.is_ecs_address(value):
+            return "address"
+        return "primitive"
+    
+    def shape_of(self, kwargs: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        """Shape key of a call: (parameter name, value kind) in argument order."""
+        value_kind = self.value_kind
+        return tuple((param_name, value_kind(value)) for param_name, value in kwargs.items())
+    
+    def split_kwargs(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Split kwargs into (entity, config, primitive) parameters using the config slots."""
+        entity_params: Dict[str, Any] = {}
+        config_params: Dict[str, Any] = {}
+        primitive_params: Dict[str, Any] = {}
+        for param_name, value in kwargs.items():
+            if param_name in self.config_slots:
+                config_params[param_name] = value
+            elif isinstance(value, Entity) and not isinstance(value, ConfigEntity):
+                entity_params[param_name] = value
+            else:
+                primitive_params[param_name] = value
+        return entity_params, config_params, primitive_params
+    
+    def strategy_for(self, kwargs: Dict[str, Any]) -> str:
+        """Execution strategy for these kwargs (cached per shape)."""
+        shape = self.shape_of(kwargs)
+        strategy = self.strategy_table.get(shape)
+        if strategy is not None:
+            self.hits += 1
+            return strategy
+        self.misses += 1
+        strategy = self.strategy_table[shape] = self._decide_strategy(shape)
+        return strategy
+    
+    def pattern_for(self, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        """InputPatternClassifier.classify_kwargs result for these kwargs (cached per shape)."""
+        shape = self.shape_of(kwargs)
+        cached = self.pattern_table.get(shape)
+        if cached is None:
+            cached = self.pattern_table[shape] = InputPatternClassifier.classify_kwargs(kwargs)
+        pattern_type, classification = cached
+        return pattern_type, dict(classification)
+    
+    def partial_signature(self, kwargs: Dict[str, Any], partial_func: Callable) -> str:
+        """Signature string of the partial bound for this shape, computed once."""
+        shape = self.shape_of(kwargs)
+        signature_str = self.partial_signatures.get(shape)
+        if signature_str is None:
+            signature_str = self.partial_signatures[shape] = str(signature(partial_func))
+        return signature_str
+    
+    def partial_metadata_for(
+        self,
+        kwargs: Dict[str, Any],
+        metadata: 'FunctionMetadata',
+        partial_func: Callable,
+        input_entity_class: Optional[Type[Entity]]
+    ) -> 'FunctionMetadata':
+        """
+        Metadata of the partial bound for this shape and input class, built once.
+        
+        The cached metadata holds an unbound partial of the function; each call
+        passes its own partial to _execute_transactional.
+        """
+        key = (self.shape_of(kwargs), input_entity_class)
+        partial_metadata = self.partial_metadata.get(key)
+        if partial_metadata is None:
+            partial_metadata = self.partial_metadata[key] = FunctionMetadata(
+                name=f"{metadata.name}_partial",
+                signature_str=self.partial_signature(kwargs, partial_func),
+                docstring=metadata.docstring,
+                is_async=metadata.is_async,
+                original_function=partial(metadata.original_function),
+                input_entity_class=input_entity_class,
+                output_entity_class=metadata.output_entity_class,
+                input_pattern="single_entity_direct",
+                output_pattern=metadata.output_pattern,
+                serializable_signature={},
+                unpacker=metadata.unpacker,
+                execution_target=metadata.execution_target,
+                executor=metadata.executor
+            )
+        # shutdown_executors replaces dedicated executors
+        partial_metadata.executor = metadata.executor
+        return partial_metadata
+    
+    def _decide_strategy(self, shape: Tuple[Tuple[str, str], ...]) -> str:
+        """Strategy decision for a shape, following the recasting rules."""
+        entity_count = 0
+        has_config = False
+        has_primitives = False
+        for param_name, kind in shape:
+            if param_name in self.config_slots:
+                has_config = True
+            elif kind == "entity":
+                entity_count += 1
+            else:
+                has_primitives = True
+        
+        if entity_count == 1 and not has_primitives and not self.expects_config_entity and not has_config:
+            return "single_entity_direct"       # Pure single entity, no recasting needed
+        elif entity_count >= 2:
+            return "multi_entity_composite"     # 2+ entities (+ anything) → 1 unified entity (highest priority)
+        elif self.expects_config_entity or has_config:
+            return "single_entity_with_config"  # Config entity handling (after multi-entity check)
+        elif entity_count == 1 and has_primitives:
+            return "single_entity_with_config"  # 1 entity + primitives → 1 entity + config (primitives become config)
+        elif entity_count == 0 and not has_primitives:
+            return "no_inputs"                  # No inputs → execute function directly
+        else:
+            return "pure_borrowing"             # Address-based borrowing and mixed patterns (fallback)
+    
+    def get_plan_stats(self) -> Dict[str, Any]:
+        """Get plan statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "cached_shapes": len(self.strategy_table),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+class ExecutionLimiter:
+    """FIFO admission control for one registered function.
+    
+    At most max_concurrency executions run at once; further callers wait in
+    arrival order. Waiters are futures of their own event loop, so the limiter
+    works across the separate loops created by execute() and from several threads.
+    """
+    
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.admitted = 0
+        self.queued = 0
+        self.max_queue_depth = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+    
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+    
+    async def acquire(self) -> None:
+        """Wait for an execution slot (slots are handed over in FIFO order)."""
+        with self._lock:
+            if self.active < self.max_concurrency and not self._waiters:
+                self.active += 1
+                self.admitted += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        
+        start = time.perf_counter()
+        try:
+            await waiter
+        except BaseException:
+            with self._lock:
+                handed_over = waiter not in self._waiters
+                if not handed_over:
+                    self._waiters.remove(waiter)
+            if handed_over:
+                # The slot was already transferred to this waiter: pass it on
+                self.release()
+            raise
+        
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.admitted += 1
+            self.total_wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+    
+    def release(self) -> None:
+        """Release a slot, handing it directly to the oldest live waiter."""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                waiter_loop = waiter.get_loop()
+                if waiter.done() or waiter_loop.is_closed():
+                    continue
+                waiter_loop.call_soon_threadsafe(_wake_waiter, waiter)
+                return
+            self.active -= 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "avg_wait_ms": self.total_wait_time / self.queued * 1000 if self.queued else 0.0,
+            "max_wait_ms": self.max_wait_time * 1000
+        }
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ExecutionResultCache:
+    """LRU/TTL cache of execution results for one pure registered function.
+    
+    Keys are digests of (function name, input ecs_ids and content digests,
+    frozen config values); values are the (root_ecs_id, ecs_id) references of the
+    registered outputs as strings plus a "single" flag, so a hit resolves to
+    stored versions and a persistent backend (any MutableMapping[str, Any], e.g.
+    a shelve or a JSON store) only has to hold plain JSON values.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None, backend: Optional[MutableMapping[str, Any]] = None):
+        if max_size < 1:
+            raise ValueError("cache max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str, resolve: Optional[Callable[[Any], Optional[Any]]] = None) -> Optional[Any]:
+        """
+        Output references for a key, or None (expired entries count as misses).
+        
+        resolve maps the stored references to the value returned; when it returns
+        None the entry is stale, so it is dropped and the lookup counts as a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.backend is not None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                self._store(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, refs = entry
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self.invalidate(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        if resolve is not None:
+            refs = resolve(refs)
+            if refs is None:
+                self.invalidate(key)
+                self.misses += 1
+                return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return refs
+    
+    def put(self, key: str, refs: Any) -> None:
+        entry = [time.time(), refs]
+        self._store(key, entry)
+        if self.backend is not None:
+            self.backend[key] = entry
+    
+    def _store(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self.backend is not None:
+            self.backend.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries (including the backend) and reset statistics."""
+        self._entries.clear()
+        if self.backend is not None:
+            self.backend.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "cache_size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "persistent": self.backend is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def _freeze_cache_value(value: Any) -> Any:
+    """Hashable, order-independent representation of a cache key component."""
+    if isinstance(value, ConfigEntity):
+        # Config entities are keyed by their values: a fresh instance with equal values hits
+        return ("config", type(value).__name__, _freeze_cache_value(value.model_dump(exclude=set(Entity.model_fields))))
+    if isinstance(value, Entity):
+        # Stored trees can alias live objects, so an unversioned in-place edit keeps the
+        # ecs_id: the content digest makes such an edit a different key
+        return ("entity", value.ecs_id, content_digest(value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((repr(k), _freeze_cache_value(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze_cache_value(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(repr(_freeze_cache_value(v)) for v in value)))
+    if isinstance(value, BaseModel):
+        return ("model", type(value).__name__, value.model_dump_json())
+    return value
+
+
 def create_entity_from_function_signature(
     func: Callable,
     entity_type: str,  # "Input" or "Output"
@@ -307,6 +766,24 @@ class FunctionMetadata:
     serializable_signature: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
+    # Precomputed dispatch tables (None for temporary partial metadata)
+    execution_plan: Optional[ExecutionPlan] = None
+    
+    # Result unpacking plan compiled from the return annotation (None = dynamic analysis)
+    unpacker: Optional[CompiledUnpacker] = None
+    
+    # Where sync functions run: "inline" | "thread" | "process"
+    execution_target: str = "thread"
+    
+    # Async generator yielding output entities one at a time (see aexecute_stream)
+    is_async_generator: bool = False
+    
+    # Admission control and dedicated executor (None = unbounded / shared executor)
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None          # Seconds per call, including queue wait (None = no limit)
+    executor_workers: Optional[int] = None
+    executor: Optional[concurrent.futures.Executor] = None
+    
     # ConfigEntity support flags
     uses_config_entity: bool = field(init=False)
     config_entity_types: List[Type[ConfigEntity]] = field(default_factory=list, init=False)
@@ -341,6 +818,220 @@ class FunctionMetadata:
 
 
 
+@dataclass
+class ExecutionOutcome:
+    """Result of aexecute_detailed with how it was obtained."""
+    result: Any = None
+    cached: bool = False      # Served from the result cache
+    coalesced: bool = False   # Shared from a concurrent identical execution (single-flight)
+
+
+# Outcome slot of the current aexecute_detailed call
+_execution_outcome: contextvars.ContextVar[Optional[ExecutionOutcome]] = contextvars.ContextVar(
+    'execution_outcome', default=None
+)
+
+
+class ExecutionTimeoutError(TimeoutError):
+    """A registered function did not complete within its timeout."""
+    
+    def __init__(self, function_name: str, timeout: float, abandoned_target: Optional[str] = None):
+        self.function_name = function_name
+        self.timeout = timeout
+        self.abandoned_target = abandoned_target
+        detail = f"; its {abandoned_target} job was abandoned" if abandoned_target else ""
+        super().__init__(f"Function '{function_name}' timed out after {timeout}s{detail}")
+
+
+@dataclass
+class ExecutionJournal:
+    """Registry entries created for one execution, rolled back if it times out."""
+    registered_roots: List[UUID] = field(default_factory=list)   # Input-only roots (composites, configs)
+    running_target: Optional[str] = None                          # "thread" | "process" while a job runs there
+
+
+# Journal of the running aexecute call, and the timeout requested by aexecute_with_timeout
+_execution_journal: contextvars.ContextVar[Optional[ExecutionJournal]] = contextvars.ContextVar(
+    'execution_journal', default=None
+)
+_call_timeout: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    'execution_call_timeout', default=None
+)
+
+
+@dataclass
+class ExecutionSnapshot:
+    """
+    Stored state read by one transactional execution.
+    
+    Divergence checks read the registered trees without copying them; the
+    isolated execution copies come from one deep copy per input root, shared by
+    every input entity of that root.
+    """
+    isolated_trees: Dict[UUID, EntityTree] = field(default_factory=dict)  # root_ecs_id -> copied tree
+    tree_copies: int = 0       # Stored trees deep-copied (at most one per root)
+    entity_copies: int = 0     # Unregistered entities copied with model_copy
+    
+    def stored_tree(self, root_ecs_id: UUID) -> Optional[EntityTree]:
+        """Registered tree for read-only comparisons (no copy)."""
+        return EntityRegistry.tree_registry.get(root_ecs_id)
+    
+    def isolated_entity(self, root_ecs_id: UUID, ecs_id: UUID) -> Optional[Entity]:
+        """Entity from this execution's private copy of its stored tree."""
+        tree = self.isolated_trees.get(root_ecs_id)
+        if tree is None:
+            tree = EntityRegistry.get_stored_tree(root_ecs_id)
+            if tree is None:
+                return None
+            self.tree_copies += 1
+            self.isolated_trees[root_ecs_id] = tree
+        return tree.get_entity(ecs_id)
+    
+    def detached_copy(self, entity: Entity) -> Entity:
+        """Isolated copy of an entity that has no stored tree."""
+        self.entity_copies += 1
+        copy = entity.model_copy(deep=True)
+        copy.live_id = uuid4()
+        return copy
+
+
+@dataclass
+class PhaseTimer:
+    """
+    Per-phase timing of one execution, measured with time.perf_counter.
+    
+    Phases are exclusive: entering a nested phase pauses the enclosing one, so
+    phase totals add up to the instrumented part of the execution. With
+    track_memory, tracemalloc deltas are accumulated per phase the same way.
+    """
+    function_name: str
+    track_memory: bool = False
+    started_at: float = field(default_factory=time.perf_counter)
+    phases: Dict[str, float] = field(default_factory=dict)          # seconds per phase
+    memory_deltas: Dict[str, int] = field(default_factory=dict)     # traced bytes per phase
+    counters: Dict[str, int] = field(default_factory=dict)          # e.g. snapshot copies made
+    _stack: List[List[Any]] = field(default_factory=list, repr=False)  # [phase, resumed_at, memory_at]
+    
+    def _traced_memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.track_memory and tracemalloc.is_tracing() else 0
+    
+    def _pause(self, frame: List[Any], now: float, memory: int) -> None:
+        name, resumed_at, memory_at = frame
+        self.phases[name] = self.phases.get(name, 0.0) + (now - resumed_at)
+        if self.track_memory:
+            self.memory_deltas[name] = self.memory_deltas.get(name, 0) + (memory - memory_at)
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the time spent inside the block to a phase."""
+        now, memory = time.perf_counter(), self._traced_memory()
+        if self._stack:
+            self._pause(self._stack[-1], now, memory)
+        self._stack.append([name, now, memory])
+        try:
+            yield
+        finally:
+            now, memory = time.perf_counter(), self._traced_memory()
+            self._pause(self._stack.pop(), now, memory)
+            if self._stack:
+                self._stack[-1][1] = now
+                self._stack[-1][2] = memory
+    
+    def elapsed(self) -> float:
+        """Seconds since the execution started."""
+        return time.perf_counter() - self.started_at
+    
+    def phase_ms(self, *names: str) -> float:
+        """Milliseconds spent so far in the given phases (including a running one)."""
+        total = sum(self.phases.get(name, 0.0) for name in names)
+        if self._stack and self._stack[-1][0] in names:
+            total += time.perf_counter() - self._stack[-1][1]
+        return total * 1000
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot suitable for FunctionExecution.performance_metrics."""
+        total_ms = self.elapsed() * 1000
+        phases_ms = {name: self.phase_ms(name) for name in self.phases}
+        if self._stack and self._stack[-1][0] not in phases_ms:
+            phases_ms[self._stack[-1][0]] = self.phase_ms(self._stack[-1][0])
+        metrics: Dict[str, Any] = {
+            "clock": "perf_counter",
+            "total_ms": total_ms,
+            "phases_ms": phases_ms,
+            "unaccounted_ms": max(total_ms - sum(phases_ms.values()), 0.0)
+        }
+        if self.track_memory:
+            metrics["memory_delta_bytes"] = dict(self.memory_deltas)
+        if self.counters:
+            metrics["counters"] = dict(self.counters)
+        return metrics
+
+
+# Timer of the execution running in the current context, and of the last one completed
+_phase_timer: contextvars.ContextVar[Optional[PhaseTimer]] = contextvars.ContextVar(
+    'execution_phase_timer', default=None
+)
+_completed_phase_timer: contextvars.ContextVar[Optional[PhaseTimer]] = contextvars.ContextVar(
+    'completed_execution_phase_timer', default=None
+)
+
+
+@contextmanager
+def execution_phase(name: str) -> Iterator[None]:
+    """Time a block as a phase of the current execution (no-op outside executions)."""
+    timer = _phase_timer.get()
+    if timer is None:
+        yield
+    else:
+        with timer.phase(name):
+            yield
+
+
+@contextmanager
+def _timer_scope(timer: PhaseTimer) -> Iterator[None]:
+    """Make timer the current execution's timer for a block (never held across a yield)."""
+    token = _phase_timer.set(timer)
+    try:
+        yield
+    finally:
+        _phase_timer.reset(token)
+
+
+def count_execution_event(name: str, amount: int = 1) -> None:
+    """Add to a named counter of the current execution (no-op outside executions)."""
+    timer = _phase_timer.get()
+    if timer is not None:
+        timer.counters[name] = timer.counters.get(name, 0) + amount
+
+
+def current_phase_ms(*names: str) -> float:
+    """Milliseconds the current execution has spent in the given phases."""
+    timer = _phase_timer.get()
+    return timer.phase_ms(*names) if timer is not None else 0.0
+
+
+def completed_execution_metrics() -> Dict[str, Any]:
+    """Performance metrics of the execution that last completed in this context."""
+    timer = _completed_phase_timer.get()
+    return timer.metrics() if timer is not None else {}
+
+
+@dataclass
+class BatchFunctionMetadata:
+    """Metadata of an element-wise function registered with register_batch."""
+    name: str
+    original_function: Callable
+    is_async: bool
+    input_param: str
+    input_entity_class: Type[Entity]
+    output_entity_class: Type[Entity]
+    input_mode: str = "entities"          # "entities" | "columns"
+    docstring: Optional[str] = None
+    execution_target: str = "thread"
+    executor: Optional[concurrent.futures.Executor] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 class CallableRegistry:
     """
     Clean registry using proven dataclass patterns.
@@ -351,6 +1042,36 @@ class CallableRegistry:
     
     _functions: Dict[str, FunctionMetadata] = {}
     
+    # Execution targets for sync functions and the shared worker process pool
+    EXECUTION_TARGETS = ("inline", "thread", "process")
+    _process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    _process_pool_workers: Optional[int] = None
+    
+    # Per-function admission limiters and default bound for execute_batch
+    _limiters: Dict[str, ExecutionLimiter] = {}
+    
+    # Element-wise functions registered with register_batch
+    _batch_functions: Dict[str, BatchFunctionMetadata] = {}
+    
+    # Result caches of functions registered with cache=True
+    _result_caches: Dict[str, ExecutionResultCache] = {}
+    
+    # Single-flight coalescing: in-flight leader futures keyed by (event loop, call key)
+    _single_flight_functions: Set[str] = set()
+    _inflight: Dict[Tuple[int, str, str], asyncio.Future] = {}
+    _single_flight_stats: Dict[str, Dict[str, int]] = {}
+    batch_concurrency: int = 256
+    
+    # Per-phase tracemalloc deltas in performance_metrics (off by default: tracing is costly)
+    _track_memory: bool = False
+    _started_tracemalloc: bool = False
+    
+    # Columnar execution log replacing registered FunctionExecution entities (off by default)
+    _execution_log: Optional[ExecutionLog] = None
+    
+    # Per-function counts of timed-out executions
+    _timeout_stats: Dict[str, Dict[str, int]] = {}
+    
     # Clear cache on startup to ensure consistent 3-tuple format
     @classmethod
     def _ensure_cache_consistency(cls):
@@ -363,18 +1084,75 @@ class CallableRegistry:
         cls._ensure_cache_consistency()
     
     @classmethod
-    def register(cls, name: str) -> Callable:
-        """Register functions with comprehensive signature caching and analysis."""
+    def register(
+        cls,
+        name: str,
+        execution_target: str = "thread",
+        max_concurrency: Optional[int] = None,
+        executor_workers: Optional[int] = None,
+        cache: bool = False,
+        cache_max_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        cache_backend: Optional[MutableMapping[str, Any]] = None,
+        single_flight: bool = False,
+        timeout: Optional[float] = None
+    ) -> Callable:
+        """
+        Register functions with comprehensive signature caching and analysis.
+        
+        Args:
+            name: Registry name of the function
+            execution_target: Where a sync function runs - "inline" (on the event loop),
+                "thread" (default executor) or "process" (shared worker process pool,
+                for CPU-bound module-level functions)
+            max_concurrency: Maximum simultaneous executions; extra calls queue in FIFO order
+            executor_workers: Size of a dedicated thread (or process) pool for this function
+            cache: Memoize results of this (pure) function by input ecs_ids and config values
+            cache_max_size: Maximum cached results (LRU eviction)
+            cache_ttl: Seconds after which a cached result expires (None = never)
+            cache_backend: Optional persistent MutableMapping holding the cache entries
+            single_flight: Coalesce concurrent identical calls (same inputs and config)
+                into one execution whose result every caller receives
+            timeout: Seconds a call may take (queue wait included) before it is cancelled
+                and recorded as failed; aexecute_with_timeout overrides it per call
+        
+        Async generator functions annotated as AsyncIterator[EntityClass] are
+        registered as streams: aexecute_stream yields each output entity as soon
+        as it is registered, and aexecute collects them into a list.
+        """
+        if execution_target not in cls.EXECUTION_TARGETS:
+            raise ValueError(f"execution_target must be one of {cls.EXECUTION_TARGETS}, got '{execution_target}'")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if executor_workers is not None and executor_workers < 1:
+            raise ValueError("executor_workers must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
         
         def decorator(func: Callable) -> Callable:
             # Validate function has proper type hints
             type_hints = get_type_hints(func)
             if 'return' not in type_hints:
                 raise ValueError(f"Function {func.__name__} must have return type hint")
+            is_async_generator = isasyncgenfunction(func)
+            if execution_target == "process":
+                if iscoroutinefunction(func) or is_async_generator:
+                    raise ValueError(f"Function {func.__name__} is async and cannot use execution_target='process'")
+                ensure_process_compatible(func)
+            if is_async_generator and (cache or single_flight or timeout is not None):
+                raise ValueError(f"Async generator {func.__name__} does not support cache, single_flight or timeout")
             
             # ✅ Use signature caching with Phase 2 return analysis
             input_entity_class, input_pattern = FunctionSignatureCache.get_or_create_input_model(func, name)
-            output_entity_class, output_pattern, return_analysis = FunctionSignatureCache.get_or_create_output_model(func, name)
+            if is_async_generator:
+                # Streams are finalized one yielded entity at a time: the output model is the element class
+                output_entity_class = cls._stream_element_type(type_hints['return'])
+                if output_entity_class is None:
+                    raise ValueError(f"Async generator {func.__name__} must be annotated as AsyncIterator[Entity]")
+                output_pattern = "stream_return"
+                return_analysis = {"pattern": output_pattern, "element_type": output_entity_class.__name__, "expected_entity_count": -1}
+            else:
+                output_entity_class, output_pattern, return_analysis = FunctionSignatureCache.get_or_create_output_model(func, name)
             
             # Extract unpacking metadata from Phase 2 analysis
             supports_unpacking = return_analysis.get('supports_unpacking', False)
@@ -402,20 +1180,438 @@ class CallableRegistry:
                 return_analysis=return_analysis,          # Full Phase 2 analysis metadata
                 supports_unpacking=supports_unpacking,    # Unpacking capability flag
                 expected_output_count=expected_output_count,  # Expected entity count
-                serializable_signature=cls._create_serializable_signature(func)
+                serializable_signature=cls._create_serializable_signature(func),
+                execution_plan=ExecutionPlan.from_function(name, func, type_hints),
+                unpacker=None if is_async_generator else CompiledUnpacker.compile(name, type_hints['return'], return_analysis),
+                execution_target=execution_target,
+                is_async_generator=is_async_generator,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                executor_workers=executor_workers,
+                executor=cls._create_executor(name, execution_target, executor_workers)
             )
             
+            # Replace any previous registration's executor and limiter
+            previous = cls._functions.get(name)
+            if previous is not None and previous.executor is not None:
+                previous.executor.shutdown(wait=False)
             cls._functions[name] = metadata
+            if max_concurrency is not None:
+                cls._limiters[name] = ExecutionLimiter(max_concurrency)
+            else:
+                cls._limiters.pop(name, None)
+            if cache:
+                cls._result_caches[name] = ExecutionResultCache(cache_max_size, cache_ttl, cache_backend)
+            else:
+                cls._result_caches.pop(name, None)
+            if single_flight:
+                cls._single_flight_functions.add(name)
+            else:
+                cls._single_flight_functions.discard(name)
             
             print(f"Registered '{name}' with return analysis (input_pattern: {input_pattern}, output_pattern: {output_pattern}, unpacking: {supports_unpacking})")
             return func
         
         return decorator
     
+    @classmethod
+    def register_batch(
+        cls,
+        name: str,
+        input_mode: str = "entities",
+        input_entity_class: Optional[Type[Entity]] = None,
+        execution_target: str = "thread",
+        executor_workers: Optional[int] = None
+    ) -> Callable:
+        """
+        Register an element-wise function that processes a whole batch per call.
+        
+        The function takes one List[EntityClass] parameter (plus optional config
+        parameters) and returns a List[OutputEntityClass] of the same length:
+        
+            @CallableRegistry.register_batch("analyze_students")
+            def analyze_students(students: List[Student], threshold: float) -> List[GradeAnalysis]:
+                ...
+        
+        Args:
+            name: Registry name used by map()/amap()
+            input_mode: "entities" passes isolated entity copies, "columns" passes
+                {field_name: [values...]} built from the inputs (treat as read-only)
+                to the first parameter
+            input_entity_class: Input entity class (required in "columns" mode)
+            execution_target: "inline" | "thread" | "process", as for register()
+            executor_workers: Size of a dedicated executor for this function
+        """
+        if input_mode not in ("entities", "columns"):
+            raise ValueError(f"input_mode must be 'entities' or 'columns', got '{input_mode}'")
+        if input_mode == "columns" and input_entity_class is None:
+            raise ValueError("input_mode='columns' requires input_entity_class")
+        if execution_target not in cls.EXECUTION_TARGETS:
+            raise ValueError(f"execution_target must be one of {cls.EXECUTION_TARGETS}, got '{execution_target}'")
+        
+        def decorator(func: Callable) -> Callable:
+            type_hints = get_type_hints(func)
+            
+            # Step 1: Find the batch input parameter and the output element class
+            param_names = list(signature(func).parameters)
+            input_param, element_class = None, input_entity_class
+            if input_mode == "columns":
+                input_param = param_names[0] if param_names else None
+            else:
+                for param_name in param_names:
+                    element_type = cls._list_element_type(type_hints.get(param_name))
+                    if element_type is not None:
+                        input_param, element_class = param_name, element_type
+                        break
+            if input_param is None or element_class is None:
+                raise ValueError(f"Batch function {func.__name__} needs a List[Entity] parameter")
+            output_entity_class = cls._list_element_type(type_hints.get('return'))
+            if output_entity_class is None:
+                raise ValueError(f"Batch function {func.__name__} must return List[Entity]")
+            if execution_target == "process":
+                if iscoroutinefunction(func):
+                    raise ValueError(f"Function {func.__name__} is async and cannot use execution_target='process'")
+                ensure_process_compatible(func)
+            
+            # Step 2: Store batch metadata
+            cls._batch_functions[name] = BatchFunctionMetadata(
+                name=name,
+                original_function=func,
+                is_async=iscoroutinefunction(func),
+                input_param=input_param,
+                input_entity_class=element_class,
+                output_entity_class=output_entity_class,
+                input_mode=input_mode,
+                docstring=getdoc(func),
+                execution_target=execution_target,
+                executor=cls._create_executor(name, execution_target, executor_workers)
+            )
+            
+            print(f"Registered batch function '{name}' ({element_class.__name__} -> {output_entity_class.__name__}, input_mode: {input_mode})")
+            return func
+        
+        return decorator
+    
+    @staticmethod
+    def _list_element_type(annotation: Any) -> Optional[Type[Entity]]:
+        """Entity class E of a List[E] annotation, else None."""
+        if getattr(annotation, '__origin__', None) is not list:
+            return None
+        args = getattr(annotation, '__args__', ())
+        if len(args) == 1 and isinstance(args[0], type) and issubclass(args[0], Entity):
+            return args[0]
+        return None
+    
+    @staticmethod
+    def _stream_element_type(annotation: Any) -> Optional[Type[Entity]]:
+        """Entity class E of an AsyncIterator[E] / AsyncIterable[E] / AsyncGenerator[E, ...] annotation, else None."""
+        origin = getattr(annotation, '__origin__', None)
+        if origin not in (collections.abc.AsyncIterator, collections.abc.AsyncIterable, collections.abc.AsyncGenerator):
+            return None
+        args = getattr(annotation, '__args__', ())
+        if args and isinstance(args[0], type) and issubclass(args[0], Entity):
+            return args[0]
+        return None
+    
+    @classmethod
+    def map(cls, func_name: str, inputs: List[Entity], chunk_size: Optional[int] = None, **config) -> List[Entity]:
+        """Apply a batch function to many entities (sync wrapper on the background event loop)."""
+        return run_sync(cls.amap(func_name, inputs, chunk_size=chunk_size, **config))
+    
+    @classmethod
+    async def amap(cls, func_name: str, inputs: List[Entity], chunk_size: Optional[int] = None, **config) -> List[Entity]:
+        """
+        Apply a batch function to many entities with bulk isolation and registration.
+        
+        Inputs are isolated once per item, the function runs once per chunk, and
+        outputs are linked to their inputs, registered in one batch and recorded
+        in a single FunctionExecution per chunk (whose output_entity_ids are the
+        sibling group of that chunk).
+        
+        Args:
+            func_name: Name given to register_batch
+            inputs: Input entities (output i corresponds to input i)
+            chunk_size: Call the function on chunks of this size (default: whole batch)
+            **config: Extra parameters passed unchanged to every call
+        """
+        metadata = cls._batch_functions.get(func_name)
+        if metadata is None:
+            raise ValueError(f"Batch function '{func_name}' not registered")
+        for entity in inputs:
+            if not isinstance(entity, metadata.input_entity_class):
+                raise ValueError(f"Batch function '{func_name}' expects {metadata.input_entity_class.__name__} inputs, got {type(entity).__name__}")
+        
+        # Record primitive config once per call, as the per-item path does per execution
+        config_entities: List[Entity] = []
+        primitive_config = {k: v for k, v in config.items() if not isinstance(v, Entity)}
+        if primitive_config:
+            config_entity = cls.create_config_entity_from_primitives(func_name, primitive_config, expected_config_type=None)
+            config_entity.promote_to_root()
+            config_entities.append(config_entity)
+        config_entities.extend(v for v in config.values() if isinstance(v, ConfigEntity))
+        
+        size = chunk_size or len(inputs) or 1
+        outputs: List[Entity] = []
+        for start in range(0, len(inputs), size):
+            token = _phase_timer.set(PhaseTimer(func_name, track_memory=cls._track_memory))
+            try:
+                outputs.extend(await cls._map_chunk(metadata, inputs[start:start + size], config, config_entities))
+            finally:
+                _phase_timer.reset(token)
+        return outputs
+    
+    @classmethod
+    async def _map_chunk(
+        cls,
+        metadata: BatchFunctionMetadata,
+        inputs: List[Entity],
+        config: Dict[str, Any],
+        config_entities: List[Entity]
+    ) -> List[Entity]:
+        """Isolate, execute, link and register one chunk of a batch map."""
+        execution_id = uuid4()
+        
+        # Step 1: Bulk isolation (copies of the live inputs, or columns)
+        copies: List[Entity] = []
+        with execution_phase("isolation"):
+            if metadata.input_mode == "columns":
+                excluded_fields = {
+                    'ecs_id', 'live_id', 'created_at', 'forked_at',
+                    'previous_ecs_id', 'lineage_id', 'old_ids', 'old_ecs_id',
+                    'root_ecs_id', 'root_live_id', 'from_storage',
+                    'untyped_data', 'attribute_source',
+                    'derived_from_function', 'derived_from_execution_id',
+                    'output_index'
+                }
+                data_fields = [name for name in metadata.input_entity_class.model_fields if name not in excluded_fields]
+                batch_argument: Any = {name: [getattr(entity, name) for entity in inputs] for name in data_fields}
+            else:
+                for entity in inputs:
+                    copy = entity.model_copy(deep=True)
+                    copy.live_id = uuid4()
+                    copies.append(copy)
+                batch_argument = copies
+        
+        # Step 2: One call for the whole chunk
+        try:
+            results = await cls._run_function(metadata, metadata.original_function, {metadata.input_param: batch_argument, **config})
+        except Exception as e:
+            await cls._record_execution_failure(inputs[0] if inputs else None, metadata.name, str(e), execution_id)
+            raise
+        if not isinstance(results, list) or len(results) != len(inputs):
+            raise ValueError(
+                f"Batch function '{metadata.name}' must return a list with one output per input "
+                f"({len(inputs)} expected, got {len(results) if isinstance(results, list) else type(results).__name__})"
+            )
+        
+        # Step 3: Semantics and provenance per output
+        with execution_phase("semantic_detection"):
+            copy_index = {id(copy): index for index, copy in enumerate(copies)}
+            outputs: List[Entity] = []
+            to_register: List[Entity] = []
+            semantics: List[str] = []
+            for index, (result, input_entity) in enumerate(zip(results, inputs)):
+                if not isinstance(result, Entity):
+                    result = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+                if copy_index.get(id(result)) == index:
+                    # Mutation of the isolated copy: new version in the input's lineage
+                    result.update_ecs_ids()
+                    semantic = "mutation"
+                elif result.root_ecs_id is not None and not result.is_root_entity():
+                    # Sub-entity extracted from an input tree
+                    result.detach()
+                    semantic = "detachment"
+                else:
+                    result = await cls._create_output_entity_with_provenance(result, metadata.output_entity_class, input_entity, metadata.name)
+                    semantic = "creation"
+                result.derived_from_function = metadata.name
+                result.derived_from_execution_id = execution_id
+                result.output_index = index
+                if semantic != "detachment":
+                    to_register.append(result)
+                outputs.append(result)
+                semantics.append(semantic)
+        
+        # Step 4: Bulk registration (single-node trees for flat classes) and a single execution record
+        with execution_phase("registration"):
+            flat_classes = {entity_class: BulkEntityFactory.is_flat(entity_class) for entity_class in {type(e) for e in to_register}}
+            EntityRegistry.register_entities_batch([e for e in to_register if flat_classes[type(e)]], flat=True)
+            EntityRegistry.register_entities_batch([e for e in to_register if not flat_classes[type(e)]])
+        
+        config_entity_ids = [entity.ecs_id for entity in config_entities]
+        for input_entity, output in zip(inputs, outputs):
+            ProvenanceIndex.add_execution(metadata.name, [input_entity.ecs_id, *config_entity_ids], [output.ecs_id])
+        cls._store_execution(
+            "batch_map",
+            ecs_id=execution_id,
+            function_name=metadata.name,
+            input_entity_id=inputs[0].ecs_id if inputs else None,
+            output_entity_ids=[entity.ecs_id for entity in outputs],
+            sibling_groups=[[entity.ecs_id for entity in outputs]] if len(outputs) > 1 else [],
+            semantic_classifications=semantics,
+            execution_pattern="batch_map",
+            was_unpacked=True,
+            entity_count_input=len(inputs),
+            entity_count_output=len(outputs),
+            config_entity_ids=config_entity_ids,
+            execution_metadata={
+                "input_entity_ids": [entity.ecs_id for entity in inputs],
+                "input_mode": metadata.input_mode
+            }
+        )
+        
+        return outputs
+    
+    @classmethod
+    async def aexecute_stream(cls, func_name: str, **kwargs) -> AsyncIterator[Entity]:
+        """
+        Execute an async-generator function, yielding each output entity as soon as it is registered.
+        
+        Every yielded entity is finalized (semantic detection, provenance and
+        output_index) and registered before the caller receives it, so nothing
+        is buffered and the first result does not wait for the last. The sibling
+        group is recorded once, on the execution record written when the stream
+        ends (or is closed early, with the outputs produced so far).
+        
+            async for order in CallableRegistry.aexecute_stream("split_orders", batch=batch):
+                ...
+        
+        Args:
+            func_name: Name of a registered async generator function
+            **kwargs: Entity and primitive arguments (addresses are not supported)
+        """
+        metadata = cls._functions.get(func_name)
+        if metadata is None:
+            raise ValueError(f"Function '{func_name}' not registered")
+        if not metadata.is_async_generator:
+            raise ValueError(f"Function '{func_name}' is not an async generator; use aexecute")
+        
+        timer = PhaseTimer(func_name, track_memory=cls._track_memory)
+        limiter = cls._limiters.get(func_name)
+        if limiter is not None:
+            with timer.phase("queue_wait"):
+                await limiter.acquire()
+        stream = cls._stream_outputs(metadata, kwargs, timer)
+        try:
+            async for entity in stream:
+                yield entity
+        finally:
+            await stream.aclose()
+            if limiter is not None:
+                limiter.release()
+            _completed_phase_timer.set(timer)
+    
+    @classmethod
+    async def _stream_outputs(cls, metadata: FunctionMetadata, kwargs: Dict[str, Any], timer: PhaseTimer) -> AsyncIterator[Entity]:
+        """
+        Run an async-generator function on isolated inputs, finalizing each yielded entity.
+        
+        The timer is made current only around the work done between yields, so
+        the consumer's context is left untouched while it holds an entity.
+        """
+        execution_id = uuid4()
+        for param_name, value in kwargs.items():
+            if isinstance(value, str) and ECSAddressParser.is_ecs_address(value):
+                raise ValueError(f"Streaming function '{metadata.name}' takes entities, not addresses (parameter '{param_name}')")
+        
+        # Step 1: Isolated input copies; primitive parameters recorded as one config entity
+        config_entity_ids: List[UUID] = []
+        with _timer_scope(timer):
+            with timer.phase("isolation"):
+                execution_kwargs, original_entities, _, object_identity_map = await cls._prepare_transactional_inputs(kwargs)
+            primitive_config = {k: v for k, v in kwargs.items() if not isinstance(v, Entity)}
+            if primitive_config:
+                with timer.phase("input_resolution"):
+                    config_entity = cls.create_config_entity_from_primitives(metadata.name, primitive_config, expected_config_type=None)
+                with timer.phase("registration"):
+                    cls._register_execution_input(config_entity)
+                config_entity_ids.append(config_entity.ecs_id)
+        
+        # Input versions are captured before a yielded mutation versions the originals
+        input_entity_ids = [entity.ecs_id for entity in original_entities]
+        provenance_inputs = input_entity_ids + config_entity_ids
+        
+        # Step 2: Finalize, register and hand over each entity as it is yielded
+        stream = metadata.original_function(**execution_kwargs)
+        output_ids: List[UUID] = []
+        semantics: List[str] = []
+        closed_early = False
+        try:
+            while True:
+                with _timer_scope(timer):
+                    try:
+                        with timer.phase("function"):
+                            item = await stream.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    entity, semantic = cls._finalize_stream_item(item, metadata, object_identity_map, execution_id, len(output_ids))
+                    ProvenanceIndex.add_execution(metadata.name, provenance_inputs, [entity.ecs_id])
+                output_ids.append(entity.ecs_id)
+                semantics.append(semantic)
+                yield entity
+        except GeneratorExit:
+            # The consumer stopped early: record what was produced
+            closed_early = True
+        except Exception as e:
+            with _timer_scope(timer):
+                await cls._record_execution_failure(original_entities[0] if original_entities else None, metadata.name, str(e), execution_id)
+            raise
+        finally:
+            await stream.aclose()
+        
+        # Step 3: One execution record carrying the sibling group
+        with _timer_scope(timer):
+            cls._store_execution(
+                "stream",
+                ecs_id=execution_id,
+                function_name=metadata.name,
+                input_entity_id=input_entity_ids[0] if input_entity_ids else None,
+                output_entity_ids=output_ids,
+                sibling_groups=[output_ids] if len(output_ids) > 1 else [],
+                semantic_classifications=semantics,
+                execution_pattern="async_generator",
+                was_unpacked=True,
+                entity_count_input=len(original_entities),
+                entity_count_output=len(output_ids),
+                config_entity_ids=config_entity_ids,
+                execution_metadata={
+                    "input_entity_ids": input_entity_ids,
+                    "closed_early": closed_early
+                }
+            )
+    
+    @classmethod
+    def _finalize_stream_item(
+        cls,
+        item: Any,
+        metadata: FunctionMetadata,
+        object_identity_map: Dict[int, Entity],
+        execution_id: UUID,
+        output_index: int
+    ) -> Tuple[Entity, str]:
+        """Classify, link and register one entity yielded by a streaming function."""
+        if not isinstance(item, metadata.output_entity_class):
+            raise TypeError(f"Function {metadata.name} yielded {type(item)}, expected {metadata.output_entity_class}")
+        
+        with execution_phase("semantic_detection"):
+            semantic, original_entity = cls._detect_execution_semantic(item, object_identity_map)
+        
+        # Provenance is set before the first registration, so the entity is never re-versioned for it
+        item.derived_from_function = metadata.name
+        item.derived_from_execution_id = execution_id
+        item.output_index = output_index
+        with execution_phase("registration"):
+            if semantic == "creation" and BulkEntityFactory.is_flat(type(item)):
+                # New entity without entity-valued fields: single-node tree, as in batch maps
+                EntityRegistry.register_entities_batch([item], flat=True)
+            else:
+                cls._register_single_result(item, semantic, original_entity)
+        return item, semantic
+    
     @classmethod
     def execute(cls, func_name: str, **kwargs) -> Union[Entity, List[Entity]]:
-        """Execute function using entity-native patterns (sync wrapper)."""
-        return asyncio.run(cls.aexecute(func_name, **kwargs))
+        """Execute function using entity-native patterns (sync wrapper on the background event loop)."""
+        return run_sync(cls.aexecute(func_name, **kwargs))
     
     @classmethod
     @emit_events(
@@ -446,14 +1642,252 @@ class CallableRegistry:
             execution_strategy="completed",
             output_entity_count=1 if isinstance(result, Entity) else len(result) if isinstance(result, list) else 0,
             semantic_results=[],  # Will be populated during execution
-            execution_duration_ms=0.0,  # Will be calculated during execution
+            execution_duration_ms=completed_execution_metrics().get("total_ms", 0.0),
             total_events_generated=0,  # Will be calculated during execution
-            execution_id=None  # Will be populated during execution
+            execution_id=None,  # Will be populated during execution
+            metadata={"performance_metrics": completed_execution_metrics()}
         )
     )
     async def aexecute(cls, func_name: str, **kwargs) -> Union[Entity, List[Entity]]:
         """Execute function using entity-native patterns (async)."""
-        return await cls._execute_async(func_name, **kwargs)
+        timer = PhaseTimer(func_name, track_memory=cls._track_memory)
+        token = _phase_timer.set(timer)
+        # Dependency tracking for incremental recomputation (inputs captured before they can be versioned);
+        # a re-execution awaited by RecomputeEngine is always recorded and handed its record
+        record_slot = RecomputeEngine.claim_record_slot()
+        snapshot = RecomputeEngine.snapshot_inputs(kwargs) if RecomputeEngine.tracking or record_slot is not None else None
+        # Per-call timeout (claimed so nested executions do not inherit it), else the registered one
+        timeout = _call_timeout.get()
+        if timeout is not None:
+            _call_timeout.set(None)
+        else:
+            metadata = cls._functions.get(func_name)
+            timeout = metadata.timeout if metadata is not None else None
+        try:
+            if timeout is None:
+                result = await cls._execute_admitted(func_name, timer, kwargs)
+            else:
+                result = await cls._execute_with_deadline(func_name, timeout, timer, kwargs)
+            
+            if snapshot is not None:
+                with timer.phase("recording"):
+                    record = RecomputeEngine.record_execution(func_name, snapshot, result)
+                if record_slot is not None:
+                    record_slot.append(record)
+            return result
+        finally:
+            _phase_timer.reset(token)
+            _completed_phase_timer.set(timer)
+    
+    @classmethod
+    async def _execute_admitted(cls, func_name: str, timer: PhaseTimer, kwargs: Dict[str, Any]) -> Union[Entity, List[Entity]]:
+        """Run _execute_async behind the function's admission limiter, if any."""
+        limiter = cls._limiters.get(func_name)
+        if limiter is None:
+            return await cls._execute_async(func_name, **kwargs)
+        # Queue-based admission for functions registered with max_concurrency
+        with timer.phase("queue_wait"):
+            await limiter.acquire()
+        try:
+            return await cls._execute_async(func_name, **kwargs)
+        finally:
+            limiter.release()
+    
+    @classmethod
+    async def _execute_with_deadline(
+        cls,
+        func_name: str,
+        timeout: float,
+        timer: PhaseTimer,
+        kwargs: Dict[str, Any]
+    ) -> Union[Entity, List[Entity]]:
+        """
+        Run an execution that must finish within timeout seconds.
+        
+        On timeout the execution task is cancelled (async functions receive
+        CancelledError at their next await; thread and process jobs are abandoned
+        and finish in the background), entities registered only as its inputs are
+        unregistered, and a failed FunctionExecution is recorded.
+        """
+        journal = ExecutionJournal()
+        journal_token = _execution_journal.set(journal)
+        try:
+            return await asyncio.wait_for(cls._execute_admitted(func_name, timer, kwargs), timeout)
+        except asyncio.TimeoutError:
+            # Step 1: Roll back registry entries created only for this execution
+            rolled_back = sum(1 for root_ecs_id in reversed(journal.registered_roots) if EntityRegistry.unregister_tree(root_ecs_id))
+            
+            # Step 2: Account for the interrupted call
+            stats = cls._timeout_stats.setdefault(func_name, {"timeouts": 0, "abandoned_jobs": 0, "rolled_back_entities": 0})
+            stats["timeouts"] += 1
+            stats["rolled_back_entities"] += rolled_back
+            if journal.running_target is not None:
+                stats["abandoned_jobs"] += 1
+            count_execution_event("rolled_back_entities", rolled_back)
+            
+            # Step 3: Record the failure
+            error = ExecutionTimeoutError(func_name, timeout, journal.running_target)
+            input_entity = next((v for v in kwargs.values() if isinstance(v, Entity) and not isinstance(v, ConfigEntity)), None)
+            cls._store_execution(
+                "",
+                error_message=str(error),
+                function_name=func_name,
+                input_entity_id=input_entity.ecs_id if input_entity else None,
+                execution_pattern="timeout",
+                execution_metadata={
+                    "timeout": timeout,
+                    "abandoned_target": journal.running_target,
+                    "rolled_back_entities": rolled_back
+                }
+            )
+            raise error from None
+        finally:
+            _execution_journal.reset(journal_token)
+    
+    @classmethod
+    def _register_execution_input(cls, entity: Entity) -> None:
+        """Register an entity created as an execution input, journaling it for timeout rollback."""
+        entity.promote_to_root()
+        journal = _execution_journal.get()
+        if journal is not None and entity.root_ecs_id is not None:
+            journal.registered_roots.append(entity.root_ecs_id)
+    
+    @classmethod
+    async def aexecute_with_timeout(cls, func_name: str, timeout: float, **kwargs) -> Union[Entity, List[Entity]]:
+        """
+        Execute like aexecute, failing with ExecutionTimeoutError after timeout seconds.
+        
+        Overrides the timeout the function was registered with for this call.
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        token = _call_timeout.set(timeout)
+        try:
+            return await cls.aexecute(func_name, **kwargs)
+        finally:
+            _call_timeout.reset(token)
+    
+    @classmethod
+    def execute_with_timeout(cls, func_name: str, timeout: float, **kwargs) -> Union[Entity, List[Entity]]:
+        """Sync wrapper of aexecute_with_timeout (runs on the background event loop)."""
+        return run_sync(cls.aexecute_with_timeout(func_name, timeout, **kwargs))
+    
+    @classmethod
+    def get_timeout_stats(cls, func_name: Optional[str] = None) -> Dict[str, Any]:
+        """Timeouts, abandoned executor jobs and rolled-back entities per function."""
+        if func_name is not None:
+            return dict(cls._timeout_stats.get(func_name, {"timeouts": 0, "abandoned_jobs": 0, "rolled_back_entities": 0}))
+        return {name: dict(stats) for name, stats in cls._timeout_stats.items()}
+    
+    @classmethod
+    def set_memory_tracking(cls, enabled: bool = True) -> None:
+        """
+        Record per-phase tracemalloc deltas in performance_metrics.
+        
+        Starts tracemalloc when needed and stops it again on disable if it was
+        started here.
+        """
+        cls._track_memory = enabled
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            cls._started_tracemalloc = True
+        elif not enabled and cls._started_tracemalloc:
+            tracemalloc.stop()
+            cls._started_tracemalloc = False
+    
+    @classmethod
+    def _store_execution(cls, semantic: str, error_message: Optional[str] = None, **fields) -> Optional[FunctionExecution]:
+        """
+        Record one execution from its FunctionExecution fields.
+        
+        The current execution's phase timings are attached, then the record is
+        appended to the execution log when one is enabled (returns None), or
+        registered as a FunctionExecution entity (returned).
+        """
+        timer = _phase_timer.get()
+        if timer is not None:
+            fields["performance_metrics"] = timer.metrics()
+            if fields.get("execution_duration") is None:
+                fields["execution_duration"] = timer.elapsed()
+        if error_message is None:
+            # Same effect as FunctionExecution.mark_as_completed
+            classifications = list(fields.get("semantic_classifications") or [])
+            if semantic not in classifications:
+                classifications.append(semantic)
+            fields.update(execution_status="completed", execution_semantic=semantic, succeeded=True, semantic_classifications=classifications)
+        else:
+            fields.update(execution_status="failed", error_message=error_message, succeeded=False)
+        
+        with execution_phase("recording"):
+            if cls._execution_log is not None:
+                cls._execution_log.append(fields)
+                if error_message is None and fields.get("sibling_groups") and "ecs_id" in fields:
+                    EntityRegistry.register_sibling_group(fields["ecs_id"], fields["sibling_groups"][0])
+                return None
+            fields["execution_timestamp"] = datetime.now(timezone.utc)
+            execution_record = FunctionExecution(**fields)
+            # Registering the record also registers its sibling group (outputs resolve
+            # sibling_output_entities through that one shared list)
+            execution_record.promote_to_root()
+            return execution_record
+    
+    @classmethod
+    def enable_execution_log(cls, segment_dir: Optional[str] = None, batch_size: int = 256, segment_rows: int = 50_000) -> ExecutionLog:
+        """
+        Record executions as rows of a columnar ExecutionLog instead of
+        registering one FunctionExecution entity tree per call.
+        
+        Args:
+            segment_dir: Spill full batches of rows to JSON segment files here
+            batch_size: Queued rows that trigger a (deferred) flush into the columns
+            segment_rows: Rows kept in memory before spilling a segment
+        
+        Returns:
+            The new log; records are materialized with get_execution_record
+        """
+        if cls._execution_log is not None:
+            cls._execution_log.flush()
+        cls._execution_log = ExecutionLog(segment_dir=segment_dir, batch_size=batch_size, segment_rows=segment_rows)
+        return cls._execution_log
+    
+    @classmethod
+    def disable_execution_log(cls) -> Optional[ExecutionLog]:
+        """Go back to registered FunctionExecution entities; returns the flushed log."""
+        log, cls._execution_log = cls._execution_log, None
+        if log is not None:
+            log.flush()
+        return log
+    
+    @classmethod
+    def get_execution_log(cls) -> Optional[ExecutionLog]:
+        return cls._execution_log
+    
+    @classmethod
+    def get_execution_record(cls, execution_id: UUID, register: bool = False) -> Optional[FunctionExecution]:
+        """
+        FunctionExecution of an execution, from the execution log (materialized
+        on demand) or from the registry.
+        """
+        if cls._execution_log is not None:
+            record = cls._execution_log.materialize(execution_id, register=register)
+            if record is not None:
+                return record
+        root_ecs_id = EntityRegistry.ecs_id_to_root_id.get(execution_id)
+        if root_ecs_id is None:
+            return None
+        record = EntityRegistry.get_stored_entity(root_ecs_id, execution_id)
+        return record if isinstance(record, FunctionExecution) else None
+    
+    @classmethod
+    async def aexecute_detailed(cls, func_name: str, **kwargs) -> "ExecutionOutcome":
+        """Execute like aexecute and report whether the result was cached or coalesced."""
+        outcome = ExecutionOutcome()
+        token = _execution_outcome.set(outcome)
+        try:
+            outcome.result = await cls.aexecute(func_name, **kwargs)
+        finally:
+            _execution_outcome.reset(token)
+        return outcome
     
     @classmethod
     async def _create_input_entity_with_borrowing(
@@ -522,47 +1956,198 @@ class CallableRegistry:
         )
     )
     def _detect_execution_strategy(cls, kwargs: Dict[str, Any], metadata: FunctionMetadata) -> str:
-        """Detect execution strategy based on input composition."""
-        
-        sig = signature(metadata.original_function)
-        type_hints = get_type_hints(metadata.original_function)
-        
-        # Count parameter types
-        entity_params = []
-        config_params = []
-        primitive_params = {}
-        
-        # First, classify provided kwargs
-        for param_name, value in kwargs.items():
-            param_type = type_hints.get(param_name)
+        """Detect execution strategy based on input composition (cached per kwargs shape)."""
+        return cls._get_execution_plan(metadata).strategy_for(kwargs)
+    
+    @classmethod
+    def _get_execution_plan(cls, metadata: FunctionMetadata) -> ExecutionPlan:
+        """Execution plan of a function, built on first use for metadata registered without one."""
+        if metadata.execution_plan is None:
+            metadata.execution_plan = ExecutionPlan.from_function(metadata.name, metadata.original_function)
+        return metadata.execution_plan
+    
+    @classmethod
+    async def _run_function(cls, metadata: FunctionMetadata, func: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Call the user function on its execution target (async functions are awaited directly)."""
+        with execution_phase("function"):
+            if metadata.is_async:
+                return await func(**kwargs)
             
-            if is_top_level_config_entity(param_type):
-                config_params.append(param_name)
-            elif isinstance(value, Entity) and not isinstance(value, ConfigEntity):
-                entity_params.append(param_name)
-            else:
-                primitive_params[param_name] = value
+            if metadata.execution_target == "inline":
+                return func(**kwargs)
+            
+            loop = asyncio.get_event_loop()
+            # Jobs on executors cannot be interrupted: a timeout abandons them
+            journal = _execution_journal.get()
+            if journal is not None:
+                journal.running_target = metadata.execution_target
+            cancelled = False
+            try:
+                if metadata.execution_target == "process":
+                    # Ship entities in binary form; argument objects returned by the worker are
+                    # written back into the execution copies so identity-based semantics still apply
+                    plain_func, call_kwargs = unwrap_partial(func, kwargs)
+                    ensure_picklable(plain_func)
+                    packed_kwargs = {name: pack_value(value) for name, value in call_kwargs.items()}
+                    packed_result = await loop.run_in_executor(
+                        metadata.executor or cls._get_process_pool(), process_entry, plain_func, packed_kwargs
+                    )
+                    return unpack_value(packed_result, call_kwargs)
+                
+                return await loop.run_in_executor(metadata.executor, partial(func, **kwargs))
+            except asyncio.CancelledError:
+                cancelled = True  # The job keeps running on its executor, abandoned
+                raise
+            finally:
+                if journal is not None and not cancelled:
+                    journal.running_target = None
+    
+    @classmethod
+    def _create_executor(cls, name: str, execution_target: str, executor_workers: Optional[int]) -> Optional[concurrent.futures.Executor]:
+        """Dedicated executor for a function registered with executor_workers."""
+        if executor_workers is None or execution_target == "inline":
+            return None
+        if execution_target == "process":
+            return concurrent.futures.ProcessPoolExecutor(max_workers=executor_workers)
+        return concurrent.futures.ThreadPoolExecutor(max_workers=executor_workers, thread_name_prefix=f"callable-{name}")
+    
+    @classmethod
+    async def _result_cache_key(cls, func_name: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Digest of (function, input ecs_ids and content, frozen config values), or None if uncacheable.
         
-        # Check if function expects ConfigEntity parameters that weren't provided directly
-        # but could be created from primitive parameters
-        function_expects_config_entity = any(
-            is_top_level_config_entity(type_hints.get(param.name))
-            for param in sig.parameters.values()
+        No divergence pass runs on lookup: an unversioned live edit changes the
+        content digest, so it misses and the execution versions the input.
+        """
+        try:
+            frozen = tuple(sorted((name, _freeze_cache_value(value)) for name, value in kwargs.items()))
+            hash(frozen)
+        except TypeError:
+            return None
+        return hashlib.sha256(repr((func_name, frozen)).encode()).hexdigest()
+    
+    @classmethod
+    async def _get_cached_result(
+        cls,
+        result_cache: ExecutionResultCache,
+        cache_key: str,
+        func_name: str,
+        kwargs: Dict[str, Any]
+    ) -> Optional[Union[Entity, List[Entity]]]:
+        """Resolve a cache hit to stored outputs and record a cached FunctionExecution."""
+        def resolve(entry: Dict[str, Any]) -> Optional[Tuple[bool, List[Entity]]]:
+            outputs = [EntityRegistry.get_stored_entity(UUID(root_ecs_id), UUID(ecs_id)) for root_ecs_id, ecs_id in entry["refs"]]
+            # Outputs no longer registered (e.g. registry reset): a stale entry
+            return None if any(output is None for output in outputs) else (entry["single"], outputs)
+        
+        resolved = result_cache.get(cache_key, resolve)
+        if resolved is None:
+            return None
+        single, outputs = resolved
+        
+        input_entity = next((v for v in kwargs.values() if isinstance(v, Entity) and not isinstance(v, ConfigEntity)), None)
+        cls._store_execution(
+            "cached",
+            function_name=func_name,
+            input_entity_id=input_entity.ecs_id if input_entity else None,
+            output_entity_id=outputs[0].ecs_id if len(outputs) == 1 else None,
+            output_entity_ids=[output.ecs_id for output in outputs],
+            execution_pattern="cached",
+            entity_count_output=len(outputs),
+            config_entity_ids=[v.ecs_id for v in kwargs.values() if isinstance(v, ConfigEntity)],
+            execution_metadata={"cache_hit": True, "cache_key": cache_key}
         )
         
-        # Strategy determination based on correct recasting rules
-        if len(entity_params) == 1 and not primitive_params and not function_expects_config_entity and not config_params:
-            return "single_entity_direct"       # Pure single entity, no recasting needed
-        elif len(entity_params) >= 2:
-            return "multi_entity_composite"     # 2+ entities (+ anything) → 1 unified entity (highest priority)
-        elif function_expects_config_entity or config_params:
-            return "single_entity_with_config"  # Config entity handling (after multi-entity check)
-        elif len(entity_params) == 1 and primitive_params:
-            return "single_entity_with_config"  # 1 entity + primitives → 1 entity + config (primitives become config)
-        elif len(entity_params) == 0 and not primitive_params:
-            return "no_inputs"                  # No inputs → execute function directly
-        else:
-            return "pure_borrowing"             # Address-based borrowing and mixed patterns (fallback)
+        return outputs[0] if single else outputs
+    
+    @classmethod
+    def _store_cached_result(cls, result_cache: Optional[ExecutionResultCache], cache_key: str, result: Any) -> None:
+        """Remember the registered outputs of an execution."""
+        if result_cache is None:
+            return
+        entities = result if isinstance(result, list) else [result]
+        if not entities or not all(isinstance(e, Entity) and e.root_ecs_id for e in entities):
+            return
+        # JSON-compatible entry: the return shape is explicit, not implied by the container type
+        result_cache.put(cache_key, {
+            "single": not isinstance(result, list),
+            "refs": [[str(e.root_ecs_id), str(e.ecs_id)] for e in entities]
+        })
+    
+    @classmethod
+    def get_single_flight_stats(cls, func_name: Optional[str] = None) -> Dict[str, Any]:
+        """Executions run and calls saved by coalescing, per single-flight function."""
+        def summarize(name: str, stats: Dict[str, int]) -> Dict[str, Any]:
+            total = stats["executions"] + stats["coalesced"]
+            return {
+                "executions": stats["executions"],
+                "coalesced": stats["coalesced"],
+                "calls_saved": stats["coalesced"],
+                "in_flight": sum(1 for _, flight_name, _ in cls._inflight if flight_name == name),
+                "coalesce_rate": stats["coalesced"] / total if total else 0.0
+            }
+        if func_name is not None:
+            stats = cls._single_flight_stats.get(func_name)
+            return summarize(func_name, stats) if stats else {}
+        return {name: summarize(name, stats) for name, stats in cls._single_flight_stats.items()}
+    
+    @classmethod
+    def clear_result_cache(cls, func_name: Optional[str] = None) -> None:
+        """Clear the result cache of one function (or of all cached functions)."""
+        caches = [cls._result_caches[func_name]] if func_name in cls._result_caches else \
+            ([] if func_name is not None else list(cls._result_caches.values()))
+        for result_cache in caches:
+            result_cache.clear()
+    
+    @classmethod
+    def get_result_cache_stats(cls, func_name: Optional[str] = None) -> Dict[str, Any]:
+        """Result cache statistics per cached function."""
+        if func_name is not None:
+            result_cache = cls._result_caches.get(func_name)
+            return result_cache.get_stats() if result_cache else {}
+        return {name: result_cache.get_stats() for name, result_cache in cls._result_caches.items()}
+    
+    @classmethod
+    def _get_process_pool(cls) -> concurrent.futures.ProcessPoolExecutor:
+        """Shared worker process pool, created on first use."""
+        if cls._process_pool is None:
+            cls._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=cls._process_pool_workers)
+        return cls._process_pool
+    
+    @classmethod
+    def configure_process_pool(cls, max_workers: Optional[int] = None) -> None:
+        """Set the worker count of the process pool (replaces an existing pool)."""
+        cls.shutdown_process_pool()
+        cls._process_pool_workers = max_workers
+    
+    @classmethod
+    def shutdown_process_pool(cls, wait: bool = True) -> None:
+        """Shut down the process pool; it is recreated on the next process execution."""
+        if cls._process_pool is not None:
+            cls._process_pool.shutdown(wait=wait)
+            cls._process_pool = None
+    
+    @classmethod
+    def shutdown_executors(cls, wait: bool = True) -> None:
+        """Shut down the shared process pool and every dedicated function executor."""
+        cls.shutdown_process_pool(wait=wait)
+        for metadata in cls._functions.values():
+            if metadata.executor is not None:
+                metadata.executor.shutdown(wait=wait)
+                metadata.executor = cls._create_executor(metadata.name, metadata.execution_target, metadata.executor_workers)
+    
+    @classmethod
+    def get_concurrency_stats(cls, func_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Admission statistics (active, queue depth, wait times) per limited function.
+        
+        Args:
+            func_name: Return only this function's statistics
+        """
+        if func_name is not None:
+            limiter = cls._limiters.get(func_name)
+            return limiter.get_stats() if limiter else {}
+        return {name: limiter.get_stats() for name, limiter in cls._limiters.items()}
     
     @classmethod
     async def _execute_async(cls, func_name: str, **kwargs) -> Union[Entity, List[Entity]]:
@@ -572,8 +2157,93 @@ class CallableRegistry:
         if not metadata:
             raise ValueError(f"Function '{func_name}' not registered")
         
+        # Claim the caller's outcome slot so nested executions do not write into it
+        outcome = _execution_outcome.get()
+        if outcome is not None:
+            _execution_outcome.set(None)
+        
+        # Memoized and single-flight functions: identical calls share one execution
+        result_cache = cls._result_caches.get(func_name)
+        single_flight = func_name in cls._single_flight_functions
+        if result_cache is not None or single_flight:
+            with execution_phase("cache_lookup"):
+                cache_key = await cls._result_cache_key(func_name, kwargs)
+            if cache_key is not None:
+                if result_cache is not None:
+                    with execution_phase("cache_lookup"):
+                        cached = await cls._get_cached_result(result_cache, cache_key, func_name, kwargs)
+                    if cached is not None:
+                        if outcome is not None:
+                            outcome.cached = True
+                        return cached
+                if single_flight:
+                    return await cls._execute_single_flight(metadata, kwargs, cache_key, result_cache, outcome)
+                result = await cls._execute_routed(metadata, kwargs)
+                cls._store_cached_result(result_cache, cache_key, result)
+                return result
+        
+        return await cls._execute_routed(metadata, kwargs)
+    
+    @classmethod
+    async def _execute_single_flight(
+        cls,
+        metadata: FunctionMetadata,
+        kwargs: Dict[str, Any],
+        cache_key: str,
+        result_cache: Optional[ExecutionResultCache],
+        outcome: Optional["ExecutionOutcome"]
+    ) -> Union[Entity, List[Entity]]:
+        """Run an execution once per key; concurrent identical callers await the leader's future."""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), metadata.name, cache_key)
+        stats = cls._single_flight_stats.setdefault(metadata.name, {"executions": 0, "coalesced": 0})
+        
+        # Followers: wait for the leader (retrying if the leader itself was cancelled)
+        while flight_key in cls._inflight:
+            leader = cls._inflight[flight_key]
+            try:
+                result = await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if leader.cancelled():
+                    continue
+                raise
+            stats["coalesced"] += 1
+            if outcome is not None:
+                outcome.coalesced = True
+            return result
+        
+        # Leader: run the execution and publish its result
+        future = loop.create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())  # Mark failures as retrieved
+        cls._inflight[flight_key] = future
+        stats["executions"] += 1
+        try:
+            result = await cls._execute_routed(metadata, kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            cls._inflight.pop(flight_key, None)
+        
+        cls._store_cached_result(result_cache, cache_key, result)
+        future.set_result(result)
+        return result
+    
+    @classmethod
+    async def _execute_routed(cls, metadata: FunctionMetadata, kwargs: Dict[str, Any]) -> Union[Entity, List[Entity]]:
+        """Detect the execution strategy and route to its implementation."""
+        if metadata.is_async_generator:
+            # Collected stream: same per-entity finalization as aexecute_stream, returned as one list
+            return [entity async for entity in cls._stream_outputs(metadata, kwargs, _phase_timer.get())]
+        
         # Step 2: Detect execution strategy based on ConfigEntity pattern
-        strategy = cls._detect_execution_strategy(kwargs, metadata)
+        with execution_phase("strategy_detection"):
+            strategy = cls._detect_execution_strategy(kwargs, metadata)
+            if strategy not in ("single_entity_with_config", "no_inputs"):
+                pattern_type, classification = cls._get_execution_plan(metadata).pattern_for(kwargs)
         
         # Step 3: Route to appropriate execution strategy
         if strategy == "single_entity_with_config":
@@ -582,13 +2252,11 @@ class CallableRegistry:
             return await cls._execute_no_inputs(metadata)
         elif strategy in ["multi_entity_composite", "single_entity_direct"]:
             # Use pattern classification for existing logic
-            pattern_type, classification = InputPatternClassifier.classify_kwargs(kwargs)
             if pattern_type in ["pure_transactional", "mixed"]:
                 return await cls._execute_transactional(metadata, kwargs, classification)
             else:
                 return await cls._execute_borrowing(metadata, kwargs, classification)
         else:  # pure_borrowing
-            pattern_type, classification = InputPatternClassifier.classify_kwargs(kwargs)
             return await cls._execute_borrowing(metadata, kwargs, classification)
     
     @classmethod
@@ -616,61 +2284,50 @@ class CallableRegistry:
             object_identity_map_size=0,
             isolation_successful=True,
             borrowing_operations_completed=0,
-            preparation_duration_ms=0.0
+            preparation_duration_ms=current_phase_ms("input_resolution", "isolation")
         )
     )
     async def _execute_with_partial(cls, metadata: FunctionMetadata, kwargs: Dict[str, Any]) -> Union[Entity, List[Entity]]:
         """Execute using functools.partial for single_entity_with_config pattern."""
         
         # Step 1: Separate entity and config parameters
-        sig = signature(metadata.original_function)
-        type_hints = get_type_hints(metadata.original_function)
-        
-        entity_params = {}
-        config_params = {}
-        primitive_params = {}
-        
-        for param_name, value in kwargs.items():
-            param_type = type_hints.get(param_name)
-            
-            if is_top_level_config_entity(param_type):
-                config_params[param_name] = value
-            elif isinstance(value, Entity) and not isinstance(value, ConfigEntity):
-                entity_params[param_name] = value
-            else:
-                primitive_params[param_name] = value
+        plan = cls._get_execution_plan(metadata)
+        entity_params, config_params, primitive_params = plan.split_kwargs(kwargs)
         
         # Step 2: Create or resolve ConfigEntity
         config_entities = {}
         
         # Handle explicit ConfigEntity parameters
-        for param_name, param_type in [(p.name, type_hints.get(p.name)) for p in sig.parameters.values()]:
-            if is_top_level_config_entity(param_type):
-                if param_name in config_params:
-                    # Use provided ConfigEntity
-                    config_entity = config_params[param_name]
-                else:
-                    # Create ConfigEntity using the factory pattern
+        for param_name, param_type in plan.config_slots.items():
+            if param_name in config_params:
+                # Use provided ConfigEntity
+                config_entity = config_params[param_name]
+            else:
+                # Create ConfigEntity using the factory pattern
+                with execution_phase("input_resolution"):
                     config_entity = cls.create_config_entity_from_primitives(
                         metadata.name,
                         primitive_params,
                         expected_config_type=param_type
                     )
-                    
-                    # Register ConfigEntity in ECS
-                    config_entity.promote_to_root()
                 
-                config_entities[param_name] = config_entity
+                # Register ConfigEntity in ECS
+                with execution_phase("registration"):
+                    cls._register_execution_input(config_entity)
+            
+            config_entities[param_name] = config_entity
         
         # For "1 entity + primitives" pattern, create dynamic ConfigEntity from primitives
         if len(entity_params) == 1 and primitive_params and not config_entities:
             # Create a dynamic ConfigEntity that includes all primitive parameters
-            dynamic_config = cls.create_config_entity_from_primitives(
-                metadata.name,
-                primitive_params,
-                expected_config_type=None  # Will create dynamic ConfigEntity
-            )
-            dynamic_config.promote_to_root()
+            with execution_phase("input_resolution"):
+                dynamic_config = cls.create_config_entity_from_primitives(
+                    metadata.name,
+                    primitive_params,
+                    expected_config_type=None  # Will create dynamic ConfigEntity
+                )
+            with execution_phase("registration"):
+                cls._register_execution_input(dynamic_config)
             
             # The partial function should include all primitive parameters directly
             config_entities.update(primitive_params)
@@ -684,21 +2341,10 @@ class CallableRegistry:
                 # Single entity case - use direct execution with partial
                 entity_name, entity_obj = next(iter(entity_params.items()))
                 
-                # Create temporary metadata for the partial function
-                partial_metadata = FunctionMetadata(
-                    name=f"{metadata.name}_partial",
-                    signature_str=str(signature(partial_func)),
-                    docstring=metadata.docstring,
-                    is_async=metadata.is_async,
-                    original_function=partial_func,
-                    input_entity_class=type(entity_obj),
-                    output_entity_class=metadata.output_entity_class,
-                    input_pattern="single_entity_direct",
-                    output_pattern=metadata.output_pattern,
-                    serializable_signature={}
-                )
+                # Metadata for the partial function (cached per shape and entity class)
+                partial_metadata = plan.partial_metadata_for(kwargs, metadata, partial_func, type(entity_obj))
                 
-                return await cls._execute_transactional(partial_metadata, {entity_name: entity_obj}, None)
+                return await cls._execute_transactional(partial_metadata, {entity_name: entity_obj}, None, partial_func)
             else:
                 # Multiple entities + ConfigEntity case:
                 # 1. Create composite entity from multiple entities
@@ -706,44 +2352,32 @@ class CallableRegistry:
                 # 3. Execute partial function with composite entity
                 
                 # Create composite input entity from multiple entities
-                if metadata.input_entity_class:
-                    composite_input = await cls._create_input_entity_with_borrowing(
-                        metadata.input_entity_class, entity_params, None
-                    )
-                else:
-                    # If no input entity class (pure ConfigEntity function), create a simple wrapper
-                    CompositeClass = create_dynamic_entity_class(
-                        f"{metadata.name}CompositeInput",
-                        {name: (type(entity), entity) for name, entity in entity_params.items()}
-                    )
-                    composite_input = CompositeClass(**entity_params)
+                with execution_phase("input_resolution"):
+                    if metadata.input_entity_class:
+                        composite_input = await cls._create_input_entity_with_borrowing(
+                            metadata.input_entity_class, entity_params, None
+                        )
+                    else:
+                        # If no input entity class (pure ConfigEntity function), create a simple wrapper
+                        CompositeClass = create_dynamic_entity_class(
+                            f"{metadata.name}CompositeInput",
+                            {name: (type(entity), entity) for name, entity in entity_params.items()}
+                        )
+                        composite_input = CompositeClass(**entity_params)
                 
                 # Register composite entity
-                composite_input.promote_to_root()
+                with execution_phase("registration"):
+                    cls._register_execution_input(composite_input)
                 
-                # Create metadata for partial function with composite input
-                partial_metadata = FunctionMetadata(
-                    name=f"{metadata.name}_partial",
-                    signature_str=str(signature(partial_func)),
-                    docstring=metadata.docstring,
-                    is_async=metadata.is_async,
-                    original_function=partial_func,
-                    input_entity_class=type(composite_input),
-                    output_entity_class=metadata.output_entity_class,
-                    input_pattern="single_entity_direct",
-                    output_pattern=metadata.output_pattern,
-                    serializable_signature={}
-                )
+                # Metadata for the partial function (cached per shape; wrapper composite
+                # classes are created per call, so only a registered input class keys it)
+                partial_metadata = plan.partial_metadata_for(kwargs, metadata, partial_func, metadata.input_entity_class)
                 
-                return await cls._execute_transactional(partial_metadata, entity_params, None)
+                return await cls._execute_transactional(partial_metadata, entity_params, None, partial_func)
         else:
             # Pure ConfigEntity function - execute directly
             try:
-                if metadata.is_async:
-                    result = await partial_func()
-                else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(None, partial_func)
+                result = await cls._run_function(metadata, partial_func, {})
             except Exception as e:
                 await cls._record_execution_failure(None, metadata.name, str(e), None, None)
                 raise
@@ -762,10 +2396,11 @@ class CallableRegistry:
                 # Continue with existing single-entity path
                 if isinstance(result, Entity):
                     output_entity = result
-                    output_entity.promote_to_root()
                 else:
                     # Use unified output entity creation method
-                    output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+                    with execution_phase("unpacking"):
+                        output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+                with execution_phase("registration"):
                     output_entity.promote_to_root()
                 
                 # Record execution with ConfigEntity tracking
@@ -795,7 +2430,7 @@ class CallableRegistry:
             config_entity_type=type(config_entity).__name__,
             fields_populated=len(primitive_params),
             registered_in_ecs=True,
-            creation_duration_ms=0.0
+            creation_duration_ms=current_phase_ms("input_resolution")
         )
     )
     def create_config_entity_from_primitives(
@@ -820,21 +2455,8 @@ class CallableRegistry:
                         config_data[param_name] = param_value
             return expected_config_type(**config_data)
         else:
-            # Create dynamic ConfigEntity class for this function
-            class_name = f"{function_name}Config"
-            
-            # Build field definitions from primitive parameters
-            field_definitions = {}
-            for param_name, param_value in primitive_params.items():
-                param_type = type(param_value)
-                field_definitions[param_name] = (param_type, param_value)
-            
-            # Create ConfigEntity subclass using factory
-            ConfigClass = ConfigEntity.create_config_entity_class(
-                class_name,
-                field_definitions,
-                module_name="__callable_registry__"
-            )
+            # Reuse (or create once) the dynamic ConfigEntity class for this parameter shape
+            ConfigClass = ConfigEntityClassCache.get_or_create(function_name, primitive_params)
             
             # Create instance
             return ConfigClass(**primitive_params)
@@ -848,13 +2470,15 @@ class CallableRegistry:
         config_entities: List[ConfigEntity]
     ) -> None:
         """Record function execution with ConfigEntity tracking."""
-        execution_record = FunctionExecution(
+        input_entity_id = input_entity.ecs_id if input_entity else None
+        config_entity_ids = [c.ecs_id for c in config_entities if isinstance(c, Entity)]
+        ProvenanceIndex.add_execution(function_name, [input_entity_id, *config_entity_ids], [output_entity.ecs_id])
+        cls._store_execution(
+            "creation",
             function_name=function_name,
-            input_entity_id=input_entity.ecs_id if input_entity else None,
+            input_entity_id=input_entity_id,
             output_entity_id=output_entity.ecs_id
         )
-        execution_record.mark_as_completed("creation")
-        execution_record.promote_to_root()
     
     @classmethod
     def _has_direct_entity_inputs(cls, kwargs: Dict[str, Any]) -> bool:
@@ -869,20 +2493,23 @@ class CallableRegistry:
         """Execute using borrowing pattern (data composition)."""
         
         # Create input entity with borrowing (enhanced pattern)
-        input_entity = await cls._create_input_entity_with_borrowing(
-            metadata.input_entity_class, kwargs, classification
-        )
+        with execution_phase("input_resolution"):
+            input_entity = await cls._create_input_entity_with_borrowing(
+                metadata.input_entity_class, kwargs, classification
+            )
         
         # Register input entity (leverages build_entity_tree)
-        input_entity.promote_to_root()
+        with execution_phase("registration"):
+            cls._register_execution_input(input_entity)
         
         # Create isolated execution copy (proven immutability)
         if not input_entity.root_ecs_id:
             raise ValueError("Input entity missing root_ecs_id")
             
-        execution_entity = EntityRegistry.get_stored_entity(
-            input_entity.root_ecs_id, input_entity.ecs_id
-        )
+        with execution_phase("isolation"):
+            execution_entity = EntityRegistry.get_stored_entity(
+                input_entity.root_ecs_id, input_entity.ecs_id
+            )
         
         if not execution_entity:
             raise ValueError("Failed to create isolated execution environment")
@@ -895,7 +2522,7 @@ class CallableRegistry:
             'untyped_data', 'attribute_source',
             # Phase 4 fields
             'derived_from_function', 'derived_from_execution_id', 
-            'sibling_output_entities', 'output_index'
+            'output_index'
         }
         
         # Extract function arguments while preserving Entity objects
@@ -905,11 +2532,7 @@ class CallableRegistry:
                 function_args[field_name] = field_value
         
         try:
-            if metadata.is_async:
-                result = await metadata.original_function(**function_args)
-            else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, lambda: metadata.original_function(**function_args))
+            result = await cls._run_function(metadata, metadata.original_function, function_args)
         except Exception as e:
             await cls._record_execution_failure(input_entity, metadata.name, str(e), None, None)
             raise
@@ -927,13 +2550,15 @@ class CallableRegistry:
             )
         else:
             # Use traditional single-entity processing
-            output_entity = await cls._create_output_entity_with_provenance(
-                result, metadata.output_entity_class, input_entity, metadata.name
-            )
+            with execution_phase("unpacking"):
+                output_entity = await cls._create_output_entity_with_provenance(
+                    result, metadata.output_entity_class, input_entity, metadata.name
+                )
             
             # Register output entity (automatic versioning)
             if not output_entity.is_root_entity():
-                output_entity.promote_to_root()
+                with execution_phase("registration"):
+                    output_entity.promote_to_root()
             
             # Record function execution relationship
             await cls._record_basic_execution(input_entity, output_entity, metadata.name)
@@ -942,7 +2567,7 @@ class CallableRegistry:
     
     @classmethod
     @emit_events(
-        creating_factory=lambda cls, metadata, kwargs, classification: TransactionalExecutionEvent(
+        creating_factory=lambda cls, metadata, kwargs, classification=None, func=None: TransactionalExecutionEvent(
             process_name="transactional_execution",
             function_name=metadata.name,
             isolated_entity_ids=extract_entity_uuids(kwargs)[0],
@@ -952,7 +2577,7 @@ class CallableRegistry:
             isolation_successful=True,
             transaction_id=uuid4()
         ),
-        created_factory=lambda result, cls, metadata, kwargs, classification: TransactionalExecutedEvent(
+        created_factory=lambda result, cls, metadata, kwargs, classification=None, func=None: TransactionalExecutedEvent(
             process_name="transactional_execution",
             function_name=metadata.name,
             execution_successful=True,
@@ -961,14 +2586,25 @@ class CallableRegistry:
             execution_copy_ids=[],  # Will be populated during execution
             output_entities_count=1 if isinstance(result, Entity) else len(result) if isinstance(result, list) else 0,
             semantic_analysis_completed=True,
-            transaction_duration_ms=0.0,
+            transaction_duration_ms=current_phase_ms(
+                "isolation", "function", "unpacking", "semantic_detection", "registration", "recording"
+            ),
             transaction_id=uuid4()
         )
     )
-    async def _execute_transactional(cls, metadata: FunctionMetadata, kwargs: Dict[str, Any], classification: Optional[Dict[str, str]] = None) -> Union[Entity, List[Entity]]:
+    async def _execute_transactional(
+        cls,
+        metadata: FunctionMetadata,
+        kwargs: Dict[str, Any],
+        classification: Optional[Dict[str, str]] = None,
+        func: Optional[Callable] = None
+    ) -> Union[Entity, List[Entity]]:
         """
         Enhanced execute with complete semantic detection and Phase 2 unpacking.
         
+        func overrides metadata.original_function (the call's bound partial when
+        metadata is cached partial metadata).
+        
         This implements the enhanced pattern with object identity-based semantic analysis:
         1. Prepare isolated execution environment with object tracking
         2. Execute function with isolated entities
@@ -977,23 +2613,20 @@ class CallableRegistry:
         
         # Generate execution ID for tracking
         execution_id = uuid4()
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Step 1: Prepare isolated execution environment with object identity tracking
-        execution_kwargs, original_entities, execution_copies, object_identity_map = await cls._prepare_transactional_inputs(kwargs)
+        with execution_phase("isolation"):
+            execution_kwargs, original_entities, execution_copies, object_identity_map = await cls._prepare_transactional_inputs(kwargs)
         
         # Extract input entity for tracking (first original entity if available)
         input_entity = original_entities[0] if original_entities else None
         
         # Step 2: Execute function with isolated entities
         try:
-            if metadata.is_async:
-                result = await metadata.original_function(**execution_kwargs)
-            else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, lambda: metadata.original_function(**execution_kwargs))
+            result = await cls._run_function(metadata, func or metadata.original_function, execution_kwargs)
         except Exception as e:
-            execution_duration = time.time() - start_time
+            execution_duration = time.perf_counter() - start_time
             await cls._record_execution_failure(input_entity, metadata.name, str(e), execution_id, execution_duration)
             raise
         
@@ -1021,56 +2654,48 @@ class CallableRegistry:
         original_entities = []
         execution_copies = []
         object_identity_map = {}  # Maps id(execution_copy) -> original_entity
+        snapshot = ExecutionSnapshot()
         
         for param_name, value in kwargs.items():
             if isinstance(value, Entity):
                 # Check if entity has diverged from storage
-                await cls._check_entity_divergence(value)
+                await cls._check_entity_divergence(value, snapshot)
                 
                 # Store original for lineage tracking
                 original_entities.append(value)
                 
-                # Create isolated execution copy
-                if value.root_ecs_id:
-                    copy = EntityRegistry.get_stored_entity(value.root_ecs_id, value.ecs_id)
-                    if copy:
-                        execution_copies.append(copy)
-                        execution_kwargs[param_name] = copy
-                        # Track object identity mapping
-                        object_identity_map[id(copy)] = value
-                    else:
-                        # Entity not in storage, use direct copy with new live_id
-                        copy = value.model_copy(deep=True)
-                        copy.live_id = uuid4()
-                        execution_copies.append(copy)
-                        execution_kwargs[param_name] = copy
-                        object_identity_map[id(copy)] = value
-                else:
-                    # Orphan entity, create isolated copy
-                    copy = value.model_copy(deep=True)
-                    copy.live_id = uuid4()
-                    execution_copies.append(copy)
-                    execution_kwargs[param_name] = copy
-                    object_identity_map[id(copy)] = value
+                # Create isolated execution copy (one stored-tree copy per root)
+                copy = snapshot.isolated_entity(value.root_ecs_id, value.ecs_id) if value.root_ecs_id else None
+                if copy is None:
+                    # Orphan or not in storage: direct copy with new live_id
+                    copy = snapshot.detached_copy(value)
+                execution_copies.append(copy)
+                execution_kwargs[param_name] = copy
+                # Track object identity mapping
+                object_identity_map[id(copy)] = value
             else:
                 # Non-entity values pass through
                 execution_kwargs[param_name] = value
         
+        count_execution_event("snapshot_tree_copies", snapshot.tree_copies)
+        count_execution_event("snapshot_entity_copies", snapshot.entity_copies)
         return execution_kwargs, original_entities, execution_copies, object_identity_map
     
     @classmethod
-    async def _check_entity_divergence(cls, entity: Entity) -> None:
+    async def _check_entity_divergence(cls, entity: Entity, snapshot: Optional[ExecutionSnapshot] = None) -> None:
         """
         Check if entity has diverged from its stored version.
         
         If diverged, automatically version the entity to maintain consistency.
+        The stored tree is only read, never copied.
         """
         if not entity.root_ecs_id:
             # Orphan entity, no stored version to compare
             return
         
-        stored_entity = EntityRegistry.get_stored_entity(entity.root_ecs_id, entity.ecs_id)
-        if not stored_entity:
+        snapshot = snapshot or ExecutionSnapshot()
+        stored_tree = snapshot.stored_tree(entity.root_ecs_id)
+        if stored_tree is None or entity.ecs_id not in stored_tree.nodes:
             # Entity not in storage, register it
             if entity.is_root_entity():
                 EntityRegistry.register_entity(entity)
@@ -1078,14 +2703,14 @@ class CallableRegistry:
         
         # Compare with stored version
         current_tree = build_entity_tree(entity)
-        stored_tree = EntityRegistry.get_stored_tree(entity.root_ecs_id)
         
         if stored_tree:
             modified_entities = find_modified_entities(current_tree, stored_tree)
             if modified_entities:
                 # Entity has diverged, trigger versioning
                 if entity.is_root_entity():
-                    EntityRegistry.version_entity(entity)
+                    with execution_phase("registration"):
+                        EntityRegistry.version_entity(entity)
     
     @classmethod
     @emit_events(
@@ -1110,7 +2735,7 @@ class CallableRegistry:
             original_entity_id=semantic_result[1].ecs_id if semantic_result[1] else None,
             semantic_type=semantic_result[0],
             confidence_level="high",
-            analysis_duration_ms=0.0,
+            analysis_duration_ms=current_phase_ms("semantic_detection"),
             entities_analyzed=1
         )
     )
@@ -1134,7 +2759,8 @@ class CallableRegistry:
         # but is a different Python object (indicating extraction from tree)
         for original_entity in object_identity_map.values():
             if original_entity.root_ecs_id:
-                tree = EntityRegistry.get_stored_tree(original_entity.root_ecs_id)
+                # Membership test only: read the registered tree without copying it
+                tree = EntityRegistry.tree_registry.get(original_entity.root_ecs_id)
                 if tree and result.ecs_id in tree.nodes:
                     # Entity exists in input tree but is different object -> detachment
                     return "detachment", original_entity
@@ -1161,40 +2787,52 @@ class CallableRegistry:
         
         # Handle entity results with semantic detection
         if isinstance(result, Entity):
-            semantic, original_entity = cls._detect_execution_semantic(result, object_identity_map)
-            
-            if semantic == "mutation":
-                # MUTATION: Function modified input entity in-place
-                if original_entity:
-                    # Preserve lineage, update ecs_id for versioning
-                    result.update_ecs_ids()
-                    # Register the updated entity (this should NOT conflict)
-                    EntityRegistry.register_entity(result)
-                    # Version the original entity to maintain history
-                    EntityRegistry.version_entity(original_entity)
-                else:
-                    # Fallback: treat as creation if we can't find original
-                    result.promote_to_root()
-                    
-            elif semantic == "creation":
-                # CREATION: Function created completely new entity
-                result.promote_to_root()
-                
-            elif semantic == "detachment":
-                # DETACHMENT: Function extracted child from parent tree
-                result.detach()
-                # Version the parent entity to reflect the change
-                if original_entity:
-                    EntityRegistry.version_entity(original_entity)
+            with execution_phase("semantic_detection"):
+                semantic, original_entity = cls._detect_execution_semantic(result, object_identity_map)
             
+            # Input versions are captured before registration versions the originals
+            input_ids = [e.ecs_id for e in object_identity_map.values()]
+            with execution_phase("registration"):
+                cls._register_single_result(result, semantic, original_entity)
+            ProvenanceIndex.add_execution(metadata.name, input_ids, [result.ecs_id])
             return result
         
         # Handle non-entity results - use unified entity creation method
-        output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+        with execution_phase("unpacking"):
+            output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
         
-        output_entity.promote_to_root()
+        with execution_phase("registration"):
+            output_entity.promote_to_root()
+        ProvenanceIndex.add_execution(metadata.name, [e.ecs_id for e in object_identity_map.values()], [output_entity.ecs_id])
         return output_entity
     
+    @classmethod
+    def _register_single_result(cls, result: Entity, semantic: str, original_entity: Optional[Entity]) -> None:
+        """Register a single entity result according to its execution semantic."""
+        if semantic == "mutation":
+            # MUTATION: Function modified input entity in-place
+            if original_entity:
+                # Preserve lineage, update ecs_id for versioning
+                result.update_ecs_ids()
+                # Register the updated entity (this should NOT conflict)
+                EntityRegistry.register_entity(result)
+                # Version the original entity to maintain history
+                EntityRegistry.version_entity(original_entity)
+            else:
+                # Fallback: treat as creation if we can't find original
+                result.promote_to_root()
+                
+        elif semantic == "creation":
+            # CREATION: Function created completely new entity
+            result.promote_to_root()
+            
+        elif semantic == "detachment":
+            # DETACHMENT: Function extracted child from parent tree
+            result.detach()
+            # Version the parent entity to reflect the change
+            if original_entity:
+                EntityRegistry.version_entity(original_entity)
+    
     @classmethod
     @emit_events(
         creating_factory=lambda cls, result, metadata, object_identity_map, input_entity, execution_id: UnpackingEvent(
@@ -1217,7 +2855,7 @@ class CallableRegistry:
             sibling_entity_ids=[e.ecs_id for e in unpacked_result if isinstance(e, Entity)],
             unpacked_entity_count=len([e for e in unpacked_result if isinstance(e, Entity)]),
             sibling_relationships_created=len([e for e in unpacked_result if isinstance(e, Entity)]) > 1,
-            unpacking_duration_ms=0.0
+            unpacking_duration_ms=current_phase_ms("unpacking")
         )
     )
     async def _finalize_multi_entity_result(
@@ -1238,49 +2876,60 @@ class CallableRegistry:
         if execution_id is None:
             execution_id = uuid4()
         
-        # Step 1: Use EntityUnpacker for sophisticated result analysis
-        unpacking_result = ContainerReconstructor.unpack_with_signature_analysis(
-            result,
-            metadata.return_analysis,
-            metadata.output_entity_class,
-            execution_id
-        )
+        # Step 1: Unpack with the plan compiled at registration (dynamic analysis otherwise)
+        with execution_phase("unpacking"):
+            if metadata.unpacker is not None:
+                unpacking_result = metadata.unpacker.unpack(result, execution_id)
+            else:
+                unpacking_result = ContainerReconstructor.unpack_with_signature_analysis(
+                    result,
+                    metadata.return_analysis,
+                    metadata.output_entity_class,
+                    execution_id
+                )
+        
+        # Step 2: Provenance and output positions, assigned before the first registration
+        for index, entity in enumerate(unpacking_result.primary_entities):
+            if isinstance(entity, Entity):
+                entity.derived_from_function = metadata.name
+                entity.derived_from_execution_id = execution_id
+                entity.output_index = index
         
-        # Step 2: Process each entity with semantic detection
+        # Step 3: Process each entity with semantic detection
         final_entities = []
         semantic_results = []
         
         for entity in unpacking_result.primary_entities:
             if isinstance(entity, Entity):
                 # Apply semantic detection
-                semantic, original_entity = cls._detect_execution_semantic(entity, object_identity_map)
+                with execution_phase("semantic_detection"):
+                    semantic, original_entity = cls._detect_execution_semantic(entity, object_identity_map)
                 
                 # Apply semantic actions
-                processed_entity = await cls._apply_semantic_actions(
-                    entity, semantic, original_entity, metadata, execution_id
-                )
+                with execution_phase("registration"):
+                    processed_entity = await cls._apply_semantic_actions(
+                        entity, semantic, original_entity, metadata, execution_id
+                    )
                 
                 final_entities.append(processed_entity)
                 semantic_results.append(semantic)
             else:
                 # Non-entity result, promote to root
                 if hasattr(entity, 'promote_to_root'):
-                    entity.promote_to_root()
+                    with execution_phase("registration"):
+                        entity.promote_to_root()
                 final_entities.append(entity)
                 semantic_results.append("creation")
         
-        # Step 3: Handle container entity if unpacking created one
+        # Step 4: Handle container entity if unpacking created one
         if unpacking_result.container_entity:
             container = unpacking_result.container_entity
             if hasattr(container, 'promote_to_root'):
-                container.promote_to_root()
+                with execution_phase("registration"):
+                    container.promote_to_root()
             # Note: Container is tracking entity, not returned directly
         
-        # Step 4: Set up sibling relationships for multi-entity outputs
-        if len(final_entities) > 1:
-            await cls._setup_sibling_relationships(final_entities, execution_id)
-        
-        # Step 5: Record multi-entity execution metadata
+        # Step 5: Record multi-entity execution metadata (its sibling group is shared by every output)
         await cls._record_multi_entity_execution(
             input_entity, final_entities, metadata.name, execution_id,
             unpacking_result, semantic_results
@@ -1300,6 +2949,10 @@ class CallableRegistry:
     ) -> Entity:
         """Apply semantic actions based on detection result."""
         
+        # Function execution tracking is set before registration, so it is part of the first version
+        entity.derived_from_function = metadata.name
+        entity.derived_from_execution_id = execution_id
+        
         if semantic == "mutation":
             # Handle mutation: preserve lineage, update IDs
             if original_entity:
@@ -1311,14 +2964,8 @@ class CallableRegistry:
                 if not entity.is_root_entity():
                     entity.promote_to_root()
             
-            # Add function execution tracking
-            entity.derived_from_function = metadata.name
-            entity.derived_from_execution_id = execution_id
-            
         elif semantic == "creation":
             # Handle creation: new lineage, function derivation
-            entity.derived_from_function = metadata.name
-            entity.derived_from_execution_id = execution_id
             if not entity.is_root_entity():
                 entity.promote_to_root()
             
@@ -1327,41 +2974,9 @@ class CallableRegistry:
             entity.detach()
             if original_entity:
                 EntityRegistry.version_entity(original_entity)
-            
-            # Add function execution tracking
-            entity.derived_from_function = metadata.name
-            entity.derived_from_execution_id = execution_id
         
         return entity
     
-    @classmethod
-    async def _setup_sibling_relationships(
-        cls, 
-        entities: List[Entity], 
-        execution_id: UUID
-    ) -> None:
-        """Set up sibling relationships for multi-entity outputs."""
-        
-        entity_ids = [e.ecs_id for e in entities]
-        
-        for i, entity in enumerate(entities):
-            # Set output index for tuple position tracking
-            if hasattr(entity, 'output_index'):
-                entity.output_index = i
-            
-            # Set sibling IDs (all others from same execution)
-            if hasattr(entity, 'sibling_output_entities'):
-                entity.sibling_output_entities = [
-                    eid for j, eid in enumerate(entity_ids) if j != i
-                ]
-            
-            # Ensure derived_from_execution_id is set
-            if hasattr(entity, 'derived_from_execution_id'):
-                entity.derived_from_execution_id = execution_id
-            
-            # Re-register entity with updated sibling information
-            EntityRegistry.version_entity(entity)
-    
     @classmethod
     async def _record_multi_entity_execution(
         cls,
@@ -1373,35 +2988,37 @@ class CallableRegistry:
         semantic_results: List[str],
         config_entities: Optional[List[Any]] = None,
         execution_duration: float = 0.0
-    ) -> FunctionExecution:
+    ) -> Optional[FunctionExecution]:
         """Record multi-entity function execution with complete Phase 2 metadata."""
         
-        execution_record = FunctionExecution(
+        input_entity_id = input_entity.ecs_id if input_entity else None
+        output_entity_ids = [e.ecs_id for e in output_entities]
+        config_entity_ids = [c.ecs_id for c in (config_entities or []) if hasattr(c, 'ecs_id')]
+        unpacking_metadata = unpacking_result.metadata if hasattr(unpacking_result, 'metadata') else {}
+        
+        if input_entity is not None:
+            ProvenanceIndex.add_attribute_sources(input_entity)
+        ProvenanceIndex.add_execution(function_name, [input_entity_id, *config_entity_ids], output_entity_ids)
+        
+        # None when the execution log is enabled (the record is a log row)
+        return cls._store_execution(
+            "enhanced_execution",
             ecs_id=execution_id,
             function_name=function_name,
-            input_entity_id=input_entity.ecs_id if input_entity else None,
-            output_entity_ids=[e.ecs_id for e in output_entities]
+            input_entity_id=input_entity_id,
+            output_entity_ids=output_entity_ids,
+            execution_duration=execution_duration or None,  # Phase timer total when not given
+            return_analysis=unpacking_metadata,
+            unpacking_metadata=unpacking_metadata,
+            sibling_groups=cls._build_sibling_groups(output_entities),
+            semantic_classifications=semantic_results,
+            execution_pattern="enhanced_unified",
+            was_unpacked=len(output_entities) > 1,
+            original_return_type=str(type(unpacking_result).__name__) if unpacking_result else "",
+            entity_count_input=1 if input_entity else 0,
+            entity_count_output=len(output_entities),
+            config_entity_ids=config_entity_ids
         )
-        
-        # Set enhanced fields after construction
-        execution_record.execution_duration = execution_duration
-        execution_record.return_analysis = unpacking_result.metadata if hasattr(unpacking_result, 'metadata') else {}
-        execution_record.unpacking_metadata = unpacking_result.metadata if hasattr(unpacking_result, 'metadata') else {}
-        execution_record.sibling_groups = cls._build_sibling_groups(output_entities)
-        execution_record.semantic_classifications = semantic_results
-        execution_record.execution_pattern = "enhanced_unified"
-        execution_record.was_unpacked = len(output_entities) > 1
-        execution_record.original_return_type = str(type(unpacking_result).__name__) if unpacking_result else ""
-        execution_record.entity_count_input = 1 if input_entity else 0
-        execution_record.entity_count_output = len(output_entities)
-        execution_record.config_entity_ids = [c.ecs_id for c in (config_entities or []) if hasattr(c, 'ecs_id')]
-        
-        execution_record.mark_as_completed("enhanced_execution")
-        execution_record.promote_to_root()
-        
-        # Entity is already registered by promote_to_root()
-        
-        return execution_record
     
     @classmethod
     def _build_sibling_groups(cls, output_entities: List[Entity]) -> List[List[UUID]]:
@@ -1445,7 +3062,7 @@ class CallableRegistry:
                                                                 'root_ecs_id', 'root_live_id', 'from_storage',
                                                                 'untyped_data', 'attribute_source',
                                                                 'derived_from_function', 'derived_from_execution_id',
-                                                                'sibling_output_entities', 'output_index'}]
+                                                                'output_index'}]
             if data_fields:
                 # Use the first available data field
                 output_entity = output_entity_class(**{data_fields[0]: result})
@@ -1483,7 +3100,7 @@ class CallableRegistry:
                                      'root_ecs_id', 'root_live_id', 'from_storage', 
                                      'untyped_data', 'attribute_source',
                                      'derived_from_function', 'derived_from_execution_id',
-                                     'sibling_output_entities', 'output_index'}:
+                                     'output_index'}:
                     
                     field_value = getattr(output_entity, field_name)
                     
@@ -1499,6 +3116,7 @@ class CallableRegistry:
                     else:
                         output_entity.attribute_source[field_name] = input_entity.ecs_id
             
+            ProvenanceIndex.add_attribute_sources(output_entity)
             return output_entity
         
         # Use the consolidated method for non-entity results only
@@ -1515,7 +3133,7 @@ class CallableRegistry:
                                  'root_ecs_id', 'root_live_id', 'from_storage', 
                                  'untyped_data', 'attribute_source',
                                  'derived_from_function', 'derived_from_execution_id',
-                                 'sibling_output_entities', 'output_index'}:
+                                 'output_index'}:
                 
                 field_value = getattr(output_entity, field_name)
                 
@@ -1531,6 +3149,7 @@ class CallableRegistry:
                 else:
                     output_entity.attribute_source[field_name] = input_entity.ecs_id
         
+        ProvenanceIndex.add_attribute_sources(output_entity)
         return output_entity
     
     @classmethod
@@ -1541,14 +3160,14 @@ class CallableRegistry:
         function_name: str
     ) -> None:
         """Record basic function execution with standard tracking."""
-        # Create FunctionExecution entity for audit trail
-        execution_record = FunctionExecution(
+        ProvenanceIndex.add_attribute_sources(input_entity)
+        ProvenanceIndex.add_execution(function_name, [input_entity.ecs_id], [output_entity.ecs_id])
+        cls._store_execution(
+            "creation",  # Default semantic
             function_name=function_name,
             input_entity_id=input_entity.ecs_id,
             output_entity_id=output_entity.ecs_id
         )
-        execution_record.mark_as_completed("creation")  # Default semantic
-        execution_record.promote_to_root()
     
     @classmethod
     async def _record_execution_failure(
@@ -1563,47 +3182,41 @@ class CallableRegistry:
         if execution_id is None:
             execution_id = uuid4()
         
-        # Create failed execution record
-        failed_execution = FunctionExecution(
+        # Store the execution_id in untyped_data since execution_id field doesn't exist
+        fields: Dict[str, Any] = {"untyped_data": f"execution_id:{execution_id}"}
+        if execution_duration is not None or _phase_timer.get() is None:
+            fields["execution_duration"] = execution_duration or 0.0
+        
+        cls._store_execution(
+            "",
+            error_message=error_message,
             function_name=function_name,
             input_entity_id=input_entity.ecs_id if input_entity else None,
             output_entity_id=None,  # No output for failed execution
-            error_message=error_message
+            execution_pattern="failed",
+            **fields
         )
-        # Store the execution_id in untyped_data since execution_id field doesn't exist
-        if execution_id:
-            failed_execution.untyped_data = f"execution_id:{execution_id}"
-        
-        # Set additional fields after construction
-        failed_execution.execution_duration = execution_duration or 0.0
-        failed_execution.succeeded = False
-        failed_execution.execution_pattern = "failed"
-        
-        failed_execution.mark_as_failed(error_message)
-        failed_execution.promote_to_root()  # This already calls EntityRegistry.register_entity()
     
     @classmethod
     async def _execute_primitives_only(cls, metadata: FunctionMetadata, kwargs: Dict[str, Any]) -> Union[Entity, List[Entity]]:
         """Execute function with only primitive parameters (no entities)."""
         
         # Create ConfigEntity from all primitive parameters
-        config_entity = cls.create_config_entity_from_primitives(
-            metadata.name,
-            kwargs,
-            expected_config_type=None  # Create dynamic ConfigEntity
-        )
-        config_entity.promote_to_root()
+        with execution_phase("input_resolution"):
+            config_entity = cls.create_config_entity_from_primitives(
+                metadata.name,
+                kwargs,
+                expected_config_type=None  # Create dynamic ConfigEntity
+            )
+        with execution_phase("registration"):
+            cls._register_execution_input(config_entity)
         
         # Create partial function with all parameters
         partial_func = partial(metadata.original_function, **kwargs)
         
         # Execute function (no input entities needed)
         try:
-            if metadata.is_async:
-                result = await partial_func()
-            else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, partial_func)
+            result = await cls._run_function(metadata, partial_func, {})
         except Exception as e:
             await cls._record_execution_failure(None, metadata.name, str(e), None, None)
             raise
@@ -1611,10 +3224,11 @@ class CallableRegistry:
         # Create output entity
         if isinstance(result, Entity):
             output_entity = result
-            output_entity.promote_to_root()
         else:
             # Handle non-entity result using consistent field detection
-            output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+            with execution_phase("unpacking"):
+                output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+        with execution_phase("registration"):
             output_entity.promote_to_root()
         
         # Record execution
@@ -1628,11 +3242,7 @@ class CallableRegistry:
         
         # Execute function directly
         try:
-            if metadata.is_async:
-                result = await metadata.original_function()
-            else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, metadata.original_function)
+            result = await cls._run_function(metadata, metadata.original_function, {})
         except Exception as e:
             await cls._record_execution_failure(None, metadata.name, str(e), None, None)
             raise
@@ -1640,37 +3250,128 @@ class CallableRegistry:
         # Create output entity
         if isinstance(result, Entity):
             output_entity = result
-            output_entity.promote_to_root()
         else:
             # Handle non-entity result using consistent field detection
-            output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+            with execution_phase("unpacking"):
+                output_entity = cls._create_output_entity_from_result(result, metadata.output_entity_class, metadata.name)
+        with execution_phase("registration"):
             output_entity.promote_to_root()
         
         # Record execution (no input entity, no config entity)
-        execution_record = FunctionExecution(
+        cls._store_execution(
+            "creation",
             function_name=metadata.name,
             input_entity_id=None,
             output_entity_id=output_entity.ecs_id
         )
-        execution_record.mark_as_completed("creation")
-        execution_record.promote_to_root()
         
         return output_entity
     
     @classmethod
-    async def execute_batch(cls, executions: List[Dict[str, Any]]) -> List[Union[Entity, List[Entity]]]:
-        """Execute multiple functions concurrently."""
-        async def execute_single(execution_config: Dict[str, Any]) -> Union[Entity, List[Entity]]:
-            func_name = execution_config.pop('func_name')
-            return await cls.aexecute(func_name, **execution_config)
+    async def execute_batch(cls, executions: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[Union[Entity, List[Entity]]]:
+        """
+        Execute multiple functions concurrently.
+        
+        A fixed set of workers pulls executions in order, so a large batch never
+        creates more than max_concurrency tasks (default: batch_concurrency).
+        """
+        limit = max_concurrency or cls.batch_concurrency
+        results: List[Any] = [None] * len(executions)
+        pending = iter(enumerate(executions))
+        
+        async def worker() -> None:
+            for index, config in pending:
+                execution_config = config.copy()
+                func_name = execution_config.pop('func_name')
+                results[index] = await cls.aexecute(func_name, **execution_config)
+        
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(limit, len(executions)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+        return results
+    
+    @classmethod
+    async def execute_batch_stream(
+        cls,
+        executions: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        window: Optional[int] = None,
+        return_exceptions: bool = True
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Execute a stream of functions, yielding (index, result) as each one completes.
+        
+        At most `window` executions (default: batch_concurrency) are in flight, and
+        configs are pulled from the (async) iterable only as slots free up, so memory
+        stays constant for arbitrarily long streams. Closing the generator (break,
+        aclose, cancellation) cancels the executions still running.
+        
+        Args:
+            executions: Iterable or async iterable of execution configs ({'func_name': ..., **kwargs})
+            window: Maximum executions in flight
+            return_exceptions: Yield (index, exception) for failed executions instead of raising
+        """
+        limit = window or cls.batch_concurrency
+        if limit < 1:
+            raise ValueError("window must be at least 1")
         
-        tasks = [execute_single(config.copy()) for config in executions]
-        return await asyncio.gather(*tasks)
+        if isinstance(executions, AsyncIterable):
+            source = executions.__aiter__()
+        else:
+            sync_source = iter(executions)
+            
+            async def from_iterable() -> AsyncIterator[Dict[str, Any]]:
+                for config in sync_source:
+                    yield config
+            source = from_iterable()
+        
+        in_flight: Dict[asyncio.Future, int] = {}
+        next_index = 0
+        exhausted = False
+        
+        try:
+            while True:
+                # Step 1: Fill the window
+                while not exhausted and len(in_flight) < limit:
+                    try:
+                        config = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    execution_config = dict(config)
+                    func_name = execution_config.pop('func_name')
+                    task = asyncio.ensure_future(cls.aexecute(func_name, **execution_config))
+                    in_flight[task] = next_index
+                    next_index += 1
+                
+                if not in_flight:
+                    return
+                
+                # Step 2: Yield whatever completed
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = in_flight.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        if not return_exceptions:
+                            raise error
+                        yield index, error
+                    else:
+                        yield index, task.result()
+        finally:
+            # Step 3: Cancel the remainder when the consumer stops early or an error escapes
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
     
     @classmethod
-    def execute_batch_sync(cls, executions: List[Dict[str, Any]]) -> List[Union[Entity, List[Entity]]]:
-        """Execute multiple functions concurrently (sync wrapper)."""
-        return asyncio.run(cls.execute_batch(executions))
+    def execute_batch_sync(cls, executions: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[Union[Entity, List[Entity]]]:
+        """Execute multiple functions concurrently (sync wrapper on the background event loop)."""
+        return run_sync(cls.execute_batch(executions, max_concurrency))
     
     @classmethod
     def get_metadata(cls, name: str) -> Optional[FunctionMetadata]:
@@ -1694,9 +3395,14 @@ class CallableRegistry:
             'signature': metadata.signature_str,
             'docstring': metadata.docstring,
             'is_async': metadata.is_async,
+            'is_async_generator': metadata.is_async_generator,
+            'execution_target': metadata.execution_target,
+            'max_concurrency': metadata.max_concurrency,
+            'executor_workers': metadata.executor_workers,
             'created_at': metadata.created_at,
             'input_entity_class': metadata.input_entity_class.__name__ if metadata.input_entity_class else None,
-            'output_entity_class': metadata.output_entity_class.__name__
+            'output_entity_class': metadata.output_entity_class.__name__,
+            'unpacker': metadata.unpacker.get_stats() if metadata.unpacker else None
         }
     
     @classmethod
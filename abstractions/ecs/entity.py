@@ -8,11 +8,12 @@ from datetime import datetime, timezone
 from collections import defaultdict
 
 from pydantic import BaseModel, Field, model_validator
-from typing import Dict, List, Set, Tuple, Any, Optional, Type, Union, get_type_hints, get_origin, get_args, Self
+from typing import Dict, List, Set, Tuple, Any, Optional, Type, Union, Iterable, get_type_hints, get_origin, get_args, Self
 from uuid import UUID, uuid4
 from enum import Enum
 from collections import deque
 import inspect
+import logging
 from pydantic import create_model
 
 # Event system imports for automatic event emission
@@ -30,6 +31,11 @@ from abstractions.events.entity_events import (
     ChangeDetectionEvent, ChangesDetectedEvent
 )
 
+# Array-aware comparison and buffer freezing for NDArray fields
+from abstractions.ecs.array_fields import values_differ, freeze_array_fields
+
+logger = logging.getLogger(__name__)
+
 # Edge type enum
 class EdgeType(str, Enum):
     """Type of edge between entities"""
@@ -885,8 +891,8 @@ def compare_non_entity_attributes(entity1: "Entity", entity2: "Entity") -> bool:
     for field_name, value1 in attrs1.items():
         value2 = attrs2[field_name]
         
-        # Direct comparison for non-entity values
-        if value1 != value2:
+        # Direct comparison for non-entity values (arrays compared by content hash)
+        if values_differ(value1, value2):
             return True
     
     # No differences found
@@ -1276,12 +1282,15 @@ class EntityRegistry():
     3) a live_id registry indexed by live_id UUID --> Entity [this is used to navigate from live python entity to their root entity when recosntructing a tree from a sub-entity]
     4) a type_registry indexed by entity_type --> List[lineage_id UUID] which is used to get all entities of a given type
     5) a ecs_id_to_root_id registry indexed by ecs_id UUID --> root_ecs_id UUID which is used to get the root_ecs_id for any given ecs_id
+    6) a sibling_groups registry indexed by execution_id UUID --> List[ecs_id UUID], the output group recorded once per
+       multi-output function execution (entities resolve their siblings through derived_from_execution_id)
     """
     tree_registry: Dict[UUID, EntityTree] = {}
     lineage_registry: Dict[UUID, List[UUID]] = {}
     live_id_registry: Dict[UUID, "Entity"] = {}
     ecs_id_to_root_id: Dict[UUID, UUID] = {}
     type_registry: Dict[Type["Entity"], List[UUID]] = {}
+    sibling_groups: Dict[UUID, List[UUID]] = {}
     
     @classmethod
     def register_entity_tree(cls, entity_tree: EntityTree) -> None:
@@ -1289,12 +1298,14 @@ class EntityRegistry():
         1) its root_ecs_id is added to the lineage_history
         2) the entities in the tree are referenced by their live id in the live_id_registry 
         3) the tree is added to the tree_registry with its root_ecs_id as key
+        4) a succeeded FunctionExecution root restores its sibling group (imported or decoded records)
         """
         if entity_tree.root_ecs_id in cls.tree_registry:
             raise ValueError("entity tree already registered")
         
         cls.tree_registry[entity_tree.root_ecs_id] = entity_tree
         for sub_entity in entity_tree.nodes.values():
+            freeze_array_fields(sub_entity)
             cls.live_id_registry[sub_entity.live_id] = sub_entity
             cls.ecs_id_to_root_id[sub_entity.ecs_id] = entity_tree.root_ecs_id
         if entity_tree.lineage_id not in cls.lineage_registry:
@@ -1307,10 +1318,51 @@ class EntityRegistry():
                 cls.type_registry[root_entity.__class__] = [entity_tree.lineage_id]
             else:
                 cls.type_registry[root_entity.__class__].append(entity_tree.lineage_id)
+            if isinstance(root_entity, FunctionExecution) and root_entity.succeeded and root_entity.sibling_groups:
+                cls.register_sibling_group(root_entity.ecs_id, root_entity.sibling_groups[0])
         else:
             raise ValueError("root entity not found in entity tree")
 
 
+    @classmethod
+    def unregister_tree(cls, root_ecs_id: UUID) -> bool:
+        """ Remove a registered tree, undoing register_entity_tree (used to roll back
+        entities registered for an execution that did not complete). Returns False if
+        the tree is not registered. """
+        entity_tree = cls.tree_registry.pop(root_ecs_id, None)
+        if entity_tree is None:
+            return False
+        execution_ids: Set[UUID] = set()
+        for sub_entity in entity_tree.nodes.values():
+            if cls.live_id_registry.get(sub_entity.live_id) is sub_entity:
+                del cls.live_id_registry[sub_entity.live_id]
+            if cls.ecs_id_to_root_id.get(sub_entity.ecs_id) == root_ecs_id:
+                del cls.ecs_id_to_root_id[sub_entity.ecs_id]
+            if sub_entity.derived_from_execution_id in cls.sibling_groups:
+                execution_ids.add(sub_entity.derived_from_execution_id)
+        # Sibling groups go with their execution record, or once none of their outputs is registered
+        cls.sibling_groups.pop(root_ecs_id, None)
+        for execution_id in execution_ids:
+            if not any(ecs_id in cls.ecs_id_to_root_id for ecs_id in cls.sibling_groups[execution_id]):
+                del cls.sibling_groups[execution_id]
+        lineage = cls.lineage_registry.get(entity_tree.lineage_id, [])
+        if root_ecs_id in lineage:
+            lineage.remove(root_ecs_id)
+        if not lineage:
+            # Last version gone: the lineage leaves the lineage and type registries
+            cls.lineage_registry.pop(entity_tree.lineage_id, None)
+            root_entity = entity_tree.get_entity(root_ecs_id)
+            lineages = cls.type_registry.get(root_entity.__class__) if root_entity is not None else None
+            if lineages:
+                lineages[:] = [lineage_id for lineage_id in lineages if lineage_id != entity_tree.lineage_id]
+        return True
+
+    @classmethod
+    def register_sibling_group(cls, execution_id: UUID, group: List[UUID]) -> None:
+        """ Record the output group of a function execution. The list is kept by reference (it is the
+        sibling group of the execution record), so it is stored once instead of once per output. """
+        cls.sibling_groups[execution_id] = group
+
     @classmethod
     @emit_events(
         creating_factory=lambda cls, entity: EntityRegistrationEvent(
@@ -1355,6 +1407,31 @@ class EntityRegistry():
         entity_tree = build_entity_tree(entity)
         cls.register_entity_tree(entity_tree)
 
+    @classmethod
+    def register_entities_batch(cls, entities: Iterable["Entity"], flat: bool = False) -> int:
+        """ Promote and register many independent entities as roots in a single pass.
+        This is the batched counterpart of promote_to_root used by bulk ingest: it skips the
+        per-entity registration events and, when flat=True (no entity-valued fields), builds the
+        single-node trees directly instead of walking the fields of every entity.
+        Returns the number of registered trees."""
+        tree_builder = getattr(build_entity_tree, "__wrapped__", build_entity_tree)
+        registered = 0
+        for entity in entities:
+            if entity.root_ecs_id is None or entity.root_live_id is None:
+                entity.root_ecs_id = entity.ecs_id
+                entity.root_live_id = entity.live_id
+            elif not entity.is_root_entity():
+                raise ValueError("can only batch register root or orphan entities")
+            if flat:
+                entity_tree = EntityTree(root_ecs_id=entity.ecs_id, lineage_id=entity.lineage_id)
+                entity_tree.add_entity(entity)
+                entity_tree.set_ancestry_path(entity.ecs_id, [entity.ecs_id])
+            else:
+                entity_tree = tree_builder(entity)
+            cls.register_entity_tree(entity_tree)
+            registered += 1
+        return registered
+
     @classmethod            
     def get_stored_tree(cls, root_ecs_id: UUID) -> Optional[EntityTree]:
         """ Get the tree for a given root_ecs_id """
@@ -1457,54 +1534,63 @@ class EntityRegistry():
                 modified_entities = new_tree.nodes.keys()
             else:
                 modified_entities = list(find_modified_entities(new_tree=new_tree, old_tree=old_tree))
-        
-            typed_entities = [entity for entity in modified_entities if isinstance(entity, UUID)]
-            
-            if len(typed_entities) > 0:
-                if new_tree.root_ecs_id not in typed_entities:
-                    raise ValueError("if any entity is modified the root entity must be modified something went wrong")
-                # first we fork the root entity
-                # forking the root entity will create a new root_ecs_id then we fork all the modified entities with the new root_ecs_id as input
-                current_root_ecs_id = new_tree.root_ecs_id
-                root_entity = new_tree.get_entity(current_root_ecs_id)
-                if root_entity is None:
-                    raise ValueError("root entity not found in new tree, something went very wrong")
-                root_entity.update_ecs_ids()
-                new_root_ecs_id = root_entity.ecs_id
-                root_entity_live_id = root_entity.live_id
-                assert new_root_ecs_id is not None and new_root_ecs_id != current_root_ecs_id
-                
-                # Build ID mapping for tracking changes
-                id_mapping = {current_root_ecs_id: new_root_ecs_id}
-                
-                # Update the nodes dictionary to use the new root entity ID
-                new_tree.nodes.pop(current_root_ecs_id)
-                new_tree.nodes[new_root_ecs_id] = root_entity
-                
-                # now we fork all the modified entities with the new root_ecs_id as input
-                #remove the old root_ecs_id from the typed_entities
-                typed_entities.remove(current_root_ecs_id)
-                for modified_entity_id in typed_entities:
-                    modified_entity = new_tree.get_entity(modified_entity_id)
-                    if modified_entity is not None:
-                        #here we could have some modified entitiyes being entities that have been removed from the tree so we get nones
-                        old_ecs_id = modified_entity.ecs_id
-                        modified_entity.update_ecs_ids(new_root_ecs_id, root_entity_live_id)
-                        new_ecs_id = modified_entity.ecs_id
-                        id_mapping[old_ecs_id] = new_ecs_id
-                    else:
-                        #later here we will handle the case where the entity has been moved to a different tree or prompoted to it's own tree
-                        print(f"modified entity {modified_entity_id} not found in new tree, something went wrong")
-                
-                # Update tree mappings to be consistent with new ECS IDs
-                update_tree_mappings_after_versioning(new_tree, id_mapping)
-                
-                # Update the tree's lineage_id to match the updated root entity
-                new_tree.lineage_id = root_entity.lineage_id
-                
-                cls.register_entity_tree(new_tree)
+            cls.commit_modified_entities(new_tree, modified_entities)
             return True            
 
+    @classmethod
+    def commit_modified_entities(cls, new_tree: EntityTree, modified_entities: Iterable[UUID]) -> bool:
+        """ Fork the modified entities of a freshly built tree and register it as a new version.
+        This is the commit half of version_entity, split out so that change sets computed elsewhere
+        (e.g. by the parallel forest differ) can be applied without recomputing the diff.
+        Returns True if a new version was registered, False if there was nothing to commit."""
+        typed_entities = [entity for entity in modified_entities if isinstance(entity, UUID)]
+        
+        if len(typed_entities) > 0:
+            if new_tree.root_ecs_id not in typed_entities:
+                raise ValueError("if any entity is modified the root entity must be modified something went wrong")
+            # first we fork the root entity
+            # forking the root entity will create a new root_ecs_id then we fork all the modified entities with the new root_ecs_id as input
+            current_root_ecs_id = new_tree.root_ecs_id
+            root_entity = new_tree.get_entity(current_root_ecs_id)
+            if root_entity is None:
+                raise ValueError("root entity not found in new tree, something went very wrong")
+            root_entity.update_ecs_ids()
+            new_root_ecs_id = root_entity.ecs_id
+            root_entity_live_id = root_entity.live_id
+            assert new_root_ecs_id is not None and new_root_ecs_id != current_root_ecs_id
+            
+            # Build ID mapping for tracking changes
+            id_mapping = {current_root_ecs_id: new_root_ecs_id}
+            
+            # Update the nodes dictionary to use the new root entity ID
+            new_tree.nodes.pop(current_root_ecs_id)
+            new_tree.nodes[new_root_ecs_id] = root_entity
+            
+            # now we fork all the modified entities with the new root_ecs_id as input
+            #remove the old root_ecs_id from the typed_entities
+            typed_entities.remove(current_root_ecs_id)
+            for modified_entity_id in typed_entities:
+                modified_entity = new_tree.get_entity(modified_entity_id)
+                if modified_entity is not None:
+                    #here we could have some modified entitiyes being entities that have been removed from the tree so we get nones
+                    old_ecs_id = modified_entity.ecs_id
+                    modified_entity.update_ecs_ids(new_root_ecs_id, root_entity_live_id)
+                    new_ecs_id = modified_entity.ecs_id
+                    id_mapping[old_ecs_id] = new_ecs_id
+                else:
+                    #later here we will handle the case where the entity has been moved to a different tree or prompoted to it's own tree
+                    logger.warning("modified entity %s not found in new tree %s, skipping it", modified_entity_id, new_tree.root_ecs_id)
+            
+            # Update tree mappings to be consistent with new ECS IDs
+            update_tree_mappings_after_versioning(new_tree, id_mapping)
+            
+            # Update the tree's lineage_id to match the updated root entity
+            new_tree.lineage_id = root_entity.lineage_id
+            
+            cls.register_entity_tree(new_tree)
+            return True
+        return False
+
 
 
 class Entity(BaseModel):
@@ -1528,7 +1614,6 @@ class Entity(BaseModel):
     # Phase 4 sibling relationship tracking fields
     derived_from_function: Optional[str] = Field(default=None, description="Function that created or modified this entity")
     derived_from_execution_id: Optional[UUID] = Field(default=None, description="Execution ID that created or modified this entity")
-    sibling_output_entities: List[UUID] = Field(default_factory=list, description="Other entities created by the same function execution")
     output_index: Optional[int] = Field(default=None, description="Position in tuple output if part of multi-entity return")
 
     @model_validator(mode='after')
@@ -1565,19 +1650,7 @@ class Entity(BaseModel):
             if field_name in self.attribute_source:
                 continue
                 
-            # Handle different field types
-            if isinstance(field_value, list):
-                # Initialize list of None values matching length of field_value
-                # Create a properly typed list that satisfies type checking
-                none_value: Optional[UUID] = None
-                self.attribute_source[field_name] = [none_value] * len(field_value)
-            elif isinstance(field_value, dict):
-                # Initialize dict with None values for each key
-                typed_dict: Dict[str, Optional[UUID]] = {str(k): None for k in field_value.keys()}
-                self.attribute_source[field_name] = typed_dict
-            else:
-                # Regular field gets simple None value
-                self.attribute_source[field_name] = None
+            self.attribute_source[field_name] = self.initial_field_source(field_value)
         
         # Validate existing container fields have correct structure
         for field_name, source_value in self.attribute_source.items():
@@ -1603,6 +1676,55 @@ class Entity(BaseModel):
         
         return self
 
+    @staticmethod
+    def initial_field_source(field_value: Any) -> Union[Optional[UUID], List[Optional[UUID]], Dict[str, Optional[UUID]]]:
+        """
+        Source entry for a field value created in Python (no source entity).
+
+        - Lists: List[Optional[UUID]] of the same length as the value, all None
+        - Dicts: Dict[str, Optional[UUID]] with None for each key
+        - Anything else: None
+        """
+        if isinstance(field_value, list):
+            return [None] * len(field_value)
+        if isinstance(field_value, dict):
+            return {str(k): None for k in field_value.keys()}
+        return None
+
+    @classmethod
+    def initial_attribute_source(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Full attribute_source for a dict of field values created in Python.
+
+        Equivalent to what validate_attribute_source builds for a fresh instance
+        with an empty attribute_source.
+        """
+        return {
+            field_name: cls.initial_field_source(values[field_name])
+            for field_name in cls.model_fields
+            if field_name != 'attribute_source'
+        }
+
+    @classmethod
+    def from_validated_values(cls, values: Dict[str, Any], fields_set: Set[str]) -> Self:
+        """
+        Build an instance from already validated field values without running pydantic validation.
+
+        Args:
+            values: Value for every field except attribute_source (taken over, not copied)
+            fields_set: Names of the fields that were explicitly provided
+
+        Returns:
+            The instance, with attribute_source initialized as validate_attribute_source would
+        """
+        values['attribute_source'] = cls.initial_attribute_source(values)
+        entity = cls.__new__(cls)
+        object.__setattr__(entity, '__dict__', values)
+        object.__setattr__(entity, '__pydantic_fields_set__', set(fields_set))
+        object.__setattr__(entity, '__pydantic_extra__', None)
+        object.__setattr__(entity, '__pydantic_private__', None)
+        return entity
+
     def _hash_str(self) -> str:
         """
         Generate a hash string from identity fields.
@@ -1631,6 +1753,33 @@ class Entity(BaseModel):
         return self._hash_str() == other._hash_str()
 
     
+    @property
+    def sibling_output_entities(self) -> List[UUID]:
+        """
+        Other entities created by the same function execution, read from the
+        sibling group recorded for derived_from_execution_id (empty until the
+        execution is recorded).
+        """
+        group = EntityRegistry.sibling_groups.get(self.derived_from_execution_id) if self.derived_from_execution_id else None
+        if not group:
+            return []
+        if self.output_index is not None and self.output_index < len(group):
+            return [ecs_id for index, ecs_id in enumerate(group) if index != self.output_index]
+        return [ecs_id for ecs_id in group if ecs_id != self.ecs_id]
+
+    @sibling_output_entities.setter
+    def sibling_output_entities(self, siblings: List[UUID]) -> None:
+        """
+        Record this entity's siblings as the sibling group of derived_from_execution_id
+        (the entity itself sits at output_index, or first when it has none).
+        """
+        if self.derived_from_execution_id is None:
+            raise ValueError("sibling_output_entities can only be set on an entity with derived_from_execution_id")
+        group = [ecs_id for ecs_id in siblings if ecs_id != self.ecs_id]
+        position = self.output_index if self.output_index is not None and self.output_index <= len(group) else 0
+        group.insert(position, self.ecs_id)
+        EntityRegistry.register_sibling_group(self.derived_from_execution_id, group)
+    
     def is_root_entity(self) -> bool:
         """
         Check if the entity is the root of its tree.
@@ -0,0 +1,333 @@
+"""
+Execution Log: Compact Columnar Records of Function Executions
+
+This module provides an append-only alternative to registering one
+FunctionExecution entity tree per call. Each execution becomes a row in
+column arrays (ids, dictionary-encoded strings, float timestamps); only the
+fields that differ from their defaults are kept in a per-row details dict.
+A FunctionExecution entity is built on request from its row.
+
+Features:
+- O(1) append on the execution path; rows are moved into the columns in
+  batches, scheduled after the current execution when an event loop runs
+- Dictionary encoding of function names, statuses, semantics and patterns
+- Optional on-disk JSON segments: full in-memory batches are spilled to
+  segment files and loaded back lazily by execution id lookups and scans
+- Lazy materialization of FunctionExecution entities (optionally registered)
+- Row scans filtered by function name and status, without building entities
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from pydantic_core import to_jsonable_python
+
+from abstractions.ecs.entity import FunctionExecution
+
+
+SEGMENT_FORMAT = "abstractions.execution_log/1"
+
+# FunctionExecution fields stored as columns; every other field goes to details
+_COLUMN_FIELDS = frozenset({
+    "ecs_id", "function_name", "execution_status", "execution_semantic", "execution_pattern",
+    "execution_timestamp", "execution_duration", "input_entity_id", "output_entity_id",
+    "output_entity_ids", "config_entity_ids", "error_message", "succeeded"
+})
+
+
+class _Columns:
+    """Column arrays of a batch of rows (the in-memory tail or a loaded segment)."""
+
+    def __init__(self):
+        self.ids: List[UUID] = []
+        self.function: array = array("I")
+        self.status: array = array("I")
+        self.semantic: array = array("I")
+        self.pattern: array = array("I")
+        self.timestamp: array = array("d")
+        self.duration: array = array("d")      # NaN when unknown
+        self.input_id: List[Optional[UUID]] = []
+        self.output_id: List[Optional[UUID]] = []
+        self.output_ids: List[Tuple[UUID, ...]] = []
+        self.config_ids: List[Tuple[UUID, ...]] = []
+        self.error: List[Optional[str]] = []
+        self.details: List[Optional[Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_record(self, strings: List[str]) -> Dict[str, Any]:
+        return {
+            "format": SEGMENT_FORMAT,
+            "strings": strings,
+            "columns": {
+                "ids": [str(value) for value in self.ids],
+                "function": self.function.tolist(),
+                "status": self.status.tolist(),
+                "semantic": self.semantic.tolist(),
+                "pattern": self.pattern.tolist(),
+                "timestamp": self.timestamp.tolist(),
+                "duration": [None if math.isnan(value) else value for value in self.duration],
+                "input_id": [str(value) if value else None for value in self.input_id],
+                "output_id": [str(value) if value else None for value in self.output_id],
+                "output_ids": [[str(value) for value in ids] for ids in self.output_ids],
+                "config_ids": [[str(value) for value in ids] for ids in self.config_ids],
+                "error": self.error,
+                "details": to_jsonable_python(self.details, fallback=str)
+            }
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> Tuple["_Columns", List[str]]:
+        if record.get("format") != SEGMENT_FORMAT:
+            raise ValueError(f"Unsupported execution log segment format: {record.get('format')}")
+        data = record["columns"]
+        columns = cls()
+        columns.ids = [UUID(value) for value in data["ids"]]
+        columns.function = array("I", data["function"])
+        columns.status = array("I", data["status"])
+        columns.semantic = array("I", data["semantic"])
+        columns.pattern = array("I", data["pattern"])
+        columns.timestamp = array("d", data["timestamp"])
+        columns.duration = array("d", [math.nan if value is None else value for value in data["duration"]])
+        columns.input_id = [UUID(value) if value else None for value in data["input_id"]]
+        columns.output_id = [UUID(value) if value else None for value in data["output_id"]]
+        columns.output_ids = [tuple(UUID(value) for value in ids) for ids in data["output_ids"]]
+        columns.config_ids = [tuple(UUID(value) for value in ids) for ids in data["config_ids"]]
+        columns.error = data["error"]
+        columns.details = data["details"]
+        return columns, record["strings"]
+
+
+class ExecutionLog:
+    """
+    Append-only columnar log of function executions.
+
+    Rows are FunctionExecution field dicts. append() only queues the row;
+    flush() (run automatically once batch_size rows are queued, and before
+    every read) encodes queued rows into the in-memory columns and, when a
+    segment_dir is configured, spills every segment_rows rows to a segment file.
+    """
+
+    def __init__(self, segment_dir: Optional[str] = None, batch_size: int = 256, segment_rows: int = 50_000):
+        if batch_size < 1:
+            raise ValueError("execution log batch_size must be at least 1")
+        if segment_rows < 1:
+            raise ValueError("execution log segment_rows must be at least 1")
+        self.segment_dir = segment_dir
+        self.batch_size = batch_size
+        self.segment_rows = segment_rows
+        if segment_dir is not None:
+            os.makedirs(segment_dir, exist_ok=True)
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_scheduled = False
+        self._lock = threading.RLock()
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        self._memory = _Columns()
+        self._segments: List[str] = []
+        self._segment_rows: List[int] = []
+        self._loaded_segment: Optional[Tuple[int, _Columns]] = None
+        # execution id -> (segment index or -1 for the in-memory tail, row)
+        self._positions: Dict[UUID, Tuple[int, int]] = {}
+
+    def append(self, fields: Dict[str, Any]) -> UUID:
+        """
+        Queue one execution row (FunctionExecution keyword fields).
+
+        Returns:
+            The execution id (the row's ecs_id, generated when missing)
+        """
+        fields.setdefault("ecs_id", uuid4())
+        fields.setdefault("execution_timestamp", time.time())
+        self._pending.append(fields)
+        if len(self._pending) >= self.batch_size and not self._flush_scheduled:
+            self._schedule_flush()
+        return fields["ecs_id"]
+
+    def _schedule_flush(self) -> None:
+        """Flush after the current execution when on an event loop, else now."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_scheduled = True
+        loop.call_soon(self.flush)
+
+    def flush(self) -> int:
+        """Move queued rows into the columns; returns the number of rows moved."""
+        with self._lock:
+            self._flush_scheduled = False
+            pending, self._pending = self._pending, []
+            for fields in pending:
+                self._encode_row(fields)
+                if self.segment_dir is not None and len(self._memory) >= self.segment_rows:
+                    self._spill()
+            return len(pending)
+
+    def _code(self, value: Optional[str]) -> int:
+        value = value or ""
+        code = self._string_codes.get(value)
+        if code is None:
+            code = self._string_codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def _encode_row(self, fields: Dict[str, Any]) -> None:
+        columns = self._memory
+        timestamp = fields["execution_timestamp"]
+        duration = fields.get("execution_duration")
+        semantic = fields.get("execution_semantic", "")
+        details = {name: value for name, value in fields.items() if name not in _COLUMN_FIELDS}
+        if details.get("semantic_classifications") in ([semantic], []):
+            del details["semantic_classifications"]
+
+        self._positions[fields["ecs_id"]] = (-1, len(columns))
+        columns.ids.append(fields["ecs_id"])
+        columns.function.append(self._code(fields.get("function_name")))
+        columns.status.append(self._code(fields.get("execution_status", "completed")))
+        columns.semantic.append(self._code(semantic))
+        columns.pattern.append(self._code(fields.get("execution_pattern", "standard")))
+        columns.timestamp.append(timestamp.timestamp() if isinstance(timestamp, datetime) else timestamp)
+        columns.duration.append(math.nan if duration is None else duration)
+        columns.input_id.append(fields.get("input_entity_id"))
+        columns.output_id.append(fields.get("output_entity_id"))
+        columns.output_ids.append(tuple(fields.get("output_entity_ids") or ()))
+        columns.config_ids.append(tuple(fields.get("config_entity_ids") or ()))
+        columns.error.append(fields.get("error_message"))
+        columns.details.append(details or None)
+
+    def _spill(self) -> None:
+        """Write the in-memory columns to a new segment file and start an empty tail."""
+        index = len(self._segments)
+        path = os.path.join(self.segment_dir, f"segment-{index:06d}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self._memory.to_record(list(self._strings)), handle, separators=(",", ":"))
+        for row, execution_id in enumerate(self._memory.ids):
+            self._positions[execution_id] = (index, row)
+        self._segments.append(path)
+        self._segment_rows.append(len(self._memory))
+        self._memory = _Columns()
+
+    def _segment(self, index: int) -> Tuple[_Columns, List[str]]:
+        """Columns of a segment (-1 for the in-memory tail), caching the last loaded file."""
+        if index < 0:
+            return self._memory, self._strings
+        if self._loaded_segment is None or self._loaded_segment[0] != index:
+            with open(self._segments[index], encoding="utf-8") as handle:
+                self._loaded_segment = (index, _Columns.from_record(json.load(handle)))
+        return self._loaded_segment[1]
+
+    @staticmethod
+    def _decode_row(columns: _Columns, strings: List[str], row: int) -> Dict[str, Any]:
+        status = strings[columns.status[row]]
+        semantic = strings[columns.semantic[row]]
+        duration = columns.duration[row]
+        fields: Dict[str, Any] = {
+            "ecs_id": columns.ids[row],
+            "function_name": strings[columns.function[row]],
+            "execution_status": status,
+            "execution_semantic": semantic,
+            "execution_pattern": strings[columns.pattern[row]],
+            "execution_timestamp": datetime.fromtimestamp(columns.timestamp[row], tz=timezone.utc),
+            "execution_duration": None if math.isnan(duration) else duration,
+            "input_entity_id": columns.input_id[row],
+            "output_entity_id": columns.output_id[row],
+            "output_entity_ids": list(columns.output_ids[row]),
+            "config_entity_ids": list(columns.config_ids[row]),
+            "error_message": columns.error[row],
+            "succeeded": status != "failed",
+            "semantic_classifications": [semantic] if semantic else []
+        }
+        fields.update(columns.details[row] or {})
+        return fields
+
+    def get(self, execution_id: UUID) -> Optional[Dict[str, Any]]:
+        """FunctionExecution fields of one execution, or None if it is not logged."""
+        self.flush()
+        with self._lock:
+            position = self._positions.get(execution_id)
+            if position is None:
+                return None
+            columns, strings = self._segment(position[0])
+            return self._decode_row(columns, strings, position[1])
+
+    def materialize(self, execution_id: UUID, register: bool = False) -> Optional[FunctionExecution]:
+        """
+        Build the FunctionExecution entity of a logged execution.
+
+        Args:
+            execution_id: ecs_id of the execution row
+            register: Also register the entity (promote_to_root) in EntityRegistry
+        """
+        fields = self.get(execution_id)
+        if fields is None:
+            return None
+        execution = FunctionExecution(**fields)
+        if register:
+            execution.promote_to_root()
+        return execution
+
+    def iter_rows(self, function_name: Optional[str] = None, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Rows in append order (segments first), filtered on the encoded columns."""
+        self.flush()
+        for index in [*range(len(self._segments)), -1]:
+            with self._lock:
+                columns, strings = self._segment(index)
+                function_code = strings.index(function_name) if function_name in strings else None
+                status_code = strings.index(status) if status in strings else None
+                if (function_name is not None and function_code is None) or (status is not None and status_code is None):
+                    continue
+                rows = [
+                    row for row in range(len(columns))
+                    if (function_code is None or columns.function[row] == function_code)
+                    and (status_code is None or columns.status[row] == status_code)
+                ]
+                decoded = [self._decode_row(columns, strings, row) for row in rows]
+            yield from decoded
+
+    def __len__(self) -> int:
+        return sum(self._segment_rows) + len(self._memory) + len(self._pending)
+
+    def __contains__(self, execution_id: UUID) -> bool:
+        self.flush()
+        return execution_id in self._positions
+
+    def clear(self) -> None:
+        """Drop all rows; segment files written so far are deleted."""
+        with self._lock:
+            for path in self._segments:
+                if os.path.exists(path):
+                    os.remove(path)
+            self._pending = []
+            self._strings = []
+            self._string_codes = {}
+            self._memory = _Columns()
+            self._segments = []
+            self._segment_rows = []
+            self._loaded_segment = None
+            self._positions = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        self.flush()
+        with self._lock:
+            memory = self._memory
+            failed_code = self._string_codes.get("failed")
+            return {
+                "rows": len(self),
+                "in_memory_rows": len(memory),
+                "segments": len(self._segments),
+                "segment_rows": sum(self._segment_rows),
+                "distinct_strings": len(self._strings),
+                "rows_with_details": sum(1 for details in memory.details if details),
+                "in_memory_failed": sum(1 for code in memory.status if code == failed_code) if failed_code is not None else 0
+            }
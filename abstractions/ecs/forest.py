@@ -0,0 +1,249 @@
+"""
+Forest Versioning: Parallel Tree Building and Diffing for Many Roots
+
+This module versions large forests of independent root entities by sharding the
+pure-Python tree walks (build_entity_tree + find_modified_entities) across a
+process pool. Workers return change sets (with the built tree of every modified
+root); the main process commits them into EntityRegistry, which stays the single
+writer.
+
+Features:
+- Shard roots across a ProcessPoolExecutor with configurable chunk size
+- Build and diff trees in workers, return ForestChangeSet records
+- Commit change sets through EntityRegistry.commit_modified_entities, reusing
+  the worker-built trees rebound to the live entities (no second tree walk)
+- Serial in-process fallback for small forests or max_workers=1
+
+Entity classes must be importable by the workers (defined at module level) so
+that roots and stored trees can be pickled into the pool.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, Executor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from abstractions.ecs.entity import (
+    Entity, EntityTree, EntityRegistry, build_entity_tree, find_modified_entities
+)
+
+
+# Workers have no event subscribers: use the undecorated builder to skip event emission
+_build_tree_without_events = getattr(build_entity_tree, "__wrapped__", build_entity_tree)
+
+
+@dataclass
+class ForestChangeSet:
+    """Compact result of diffing one root against its stored version."""
+    root_ecs_id: Optional[UUID]
+    lineage_id: UUID
+    modified_entity_ids: List[UUID] = field(default_factory=list)
+    is_new_root: bool = False
+    node_count: int = 0
+    error: Optional[str] = None
+    tree: Optional[EntityTree] = None  # Built tree, kept only for roots with modifications
+
+    @property
+    def has_changes(self) -> bool:
+        return self.is_new_root or len(self.modified_entity_ids) > 0
+
+
+@dataclass
+class ForestCommitResult:
+    """Summary of committing a batch of change sets into the registry."""
+    versioned_roots: int = 0
+    registered_roots: int = 0
+    unchanged_roots: int = 0
+    failed_roots: List[Tuple[Optional[UUID], str]] = field(default_factory=list)
+    new_root_ecs_ids: Dict[UUID, UUID] = field(default_factory=dict)  # old root_ecs_id -> new root_ecs_id
+
+
+def _diff_root(root: Entity, stored_tree: Optional[EntityTree]) -> ForestChangeSet:
+    """Build the tree of a root and diff it against its stored tree."""
+    if stored_tree is None:
+        return ForestChangeSet(root_ecs_id=root.root_ecs_id, lineage_id=root.lineage_id, is_new_root=True)
+    try:
+        new_tree = _build_tree_without_events(root)
+        modified = [entity_id for entity_id in find_modified_entities(new_tree=new_tree, old_tree=stored_tree) if isinstance(entity_id, UUID)]
+        return ForestChangeSet(
+            root_ecs_id=root.root_ecs_id,
+            lineage_id=root.lineage_id,
+            modified_entity_ids=modified,
+            node_count=new_tree.node_count,
+            tree=new_tree if modified else None
+        )
+    except Exception as e:
+        return ForestChangeSet(root_ecs_id=root.root_ecs_id, lineage_id=root.lineage_id, error=str(e))
+
+
+def _diff_forest_shard(shard: List[Tuple[Entity, Optional[EntityTree]]]) -> List[ForestChangeSet]:
+    """Worker entry point: diff every (root, stored_tree) pair of a shard."""
+    return [_diff_root(root, stored_tree) for root, stored_tree in shard]
+
+
+def _live_entities(root: Entity) -> Dict[UUID, Entity]:
+    """Entities reachable from a root, by live_id (a plain object walk, no type introspection)."""
+    found: Dict[UUID, Entity] = {}
+    stack: List[Any] = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Entity):
+            if value.live_id not in found:
+                found[value.live_id] = value
+                stack.extend(value.__dict__.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+    return found
+
+
+def _bind_live_tree(root: Entity, tree: Optional[EntityTree]) -> EntityTree:
+    """
+    Tree of a live root for committing, reusing the tree built by the diff.
+
+    Trees built in a worker hold unpickled copies: their nodes are swapped for
+    the live entities with the same live_id. Falls back to building the tree
+    when there is none or a node cannot be matched.
+    """
+    if tree is None:
+        return build_entity_tree(root)
+    if tree.nodes.get(root.ecs_id) is root:
+        return tree  # Built in-process from the live root
+    live = _live_entities(root)
+    for ecs_id, node in list(tree.nodes.items()):
+        live_node = live.get(node.live_id)
+        if live_node is None:
+            return build_entity_tree(root)
+        tree.nodes[ecs_id] = live_node
+    return tree
+
+
+class ForestVersioner:
+    """
+    Version many independent roots per tick using a process pool.
+
+    Example:
+        with ForestVersioner(max_workers=8) as versioner:
+            result = versioner.version(roots)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        parallel_threshold: int = 64,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes (defaults to os.cpu_count())
+            chunk_size: Roots per shard (defaults to an even split over 4x the workers)
+            parallel_threshold: Forests smaller than this are diffed in-process
+            executor: Optional externally managed executor to reuse
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> "ForestVersioner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool if this versioner created it."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _shards(self, pairs: List[Tuple[Entity, Optional[EntityTree]]]) -> List[List[Tuple[Entity, Optional[EntityTree]]]]:
+        chunk_size = self.chunk_size or max(1, len(pairs) // (self.max_workers * 4) or 1)
+        return [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+
+    def diff(self, roots: Sequence[Entity]) -> List[ForestChangeSet]:
+        """
+        Compute change sets for a forest of root entities.
+
+        Stored trees are read directly from the registry (no snapshot copies are
+        needed since they are pickled into the workers). Change sets are returned
+        in the same order as the input roots.
+        """
+        pairs: List[Tuple[Entity, Optional[EntityTree]]] = []
+        for root in roots:
+            if not root.is_root_entity():
+                raise ValueError(f"forest versioning only supports root entities, got {type(root).__name__} {root.ecs_id}")
+            pairs.append((root, EntityRegistry.tree_registry.get(root.root_ecs_id)))
+
+        if self.max_workers <= 1 or len(pairs) < self.parallel_threshold:
+            return _diff_forest_shard(pairs)
+
+        executor = self._get_executor()
+        change_sets: List[ForestChangeSet] = []
+        for shard_result in executor.map(_diff_forest_shard, self._shards(pairs)):
+            change_sets.extend(shard_result)
+        return change_sets
+
+    def commit(self, roots: Sequence[Entity], change_sets: Sequence[ForestChangeSet]) -> ForestCommitResult:
+        """
+        Apply change sets to the registry in the main process.
+
+        Roots with modifications reuse the tree built by diff; unchanged roots
+        cost nothing and new roots go through EntityRegistry.register_entity.
+        """
+        if len(roots) != len(change_sets):
+            raise ValueError("roots and change_sets must have the same length")
+
+        result = ForestCommitResult()
+        for root, change_set in zip(roots, change_sets):
+            if change_set.error is not None:
+                result.failed_roots.append((change_set.root_ecs_id, change_set.error))
+            elif change_set.is_new_root:
+                EntityRegistry.register_entity(root)
+                result.registered_roots += 1
+            elif not change_set.modified_entity_ids:
+                result.unchanged_roots += 1
+            else:
+                old_root_ecs_id = root.ecs_id
+                new_tree = _bind_live_tree(root, change_set.tree)
+                change_set.tree = None  # Committed: do not keep the tree alive
+                if EntityRegistry.commit_modified_entities(new_tree, change_set.modified_entity_ids):
+                    result.versioned_roots += 1
+                    result.new_root_ecs_ids[old_root_ecs_id] = root.ecs_id
+                else:
+                    result.unchanged_roots += 1
+        return result
+
+    def version(self, roots: Sequence[Entity]) -> ForestCommitResult:
+        """Diff a forest in parallel and commit the resulting change sets."""
+        roots = list(roots)
+        return self.commit(roots, self.diff(roots))
+
+
+def version_forest(
+    roots: Sequence[Entity],
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> ForestCommitResult:
+    """
+    Version a forest of independent roots using a temporary process pool.
+
+    Args:
+        roots: Root entities to version (registered or not)
+        max_workers: Worker processes (defaults to os.cpu_count())
+        chunk_size: Roots per shard
+
+    Returns:
+        ForestCommitResult with counts and the old -> new root id mapping
+    """
+    with ForestVersioner(max_workers=max_workers, chunk_size=chunk_size) as versioner:
+        return versioner.version(roots)
@@ -12,6 +12,7 @@ Features:
 """
 
 from typing import Any, Dict, List, Optional, Union, Type, Tuple
+from uuid import UUID
 from abstractions.ecs.entity import Entity, EntityRegistry, FunctionExecution
 from abstractions.ecs.ecs_address_parser import ECSAddressParser, EntityReferenceResolver, InputPatternClassifier
 
@@ -392,6 +393,49 @@ def get_entity_dependencies(entity: Entity) -> Dict[str, Any]:
     }
 
 
+def get_entity_dependents(
+    entity: Union[Entity, UUID],
+    transitive: bool = False,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get the entities derived from a given entity (reverse of get_entity_dependencies).
+    
+    Uses the incrementally maintained ProvenanceIndex instead of scanning
+    attribute_source and FunctionExecution records.
+    
+    Args:
+        entity: Entity or ecs_id to analyze
+        transitive: Include indirect dependents (breadth-first)
+        max_depth: Bound on the traversal depth when transitive
+        max_nodes: Bound on the number of dependents returned when transitive
+        
+    Example:
+        deps = get_entity_dependents(student, transitive=True, max_depth=3)
+        # Returns: {
+        #     "direct_dependents": [UUID(...)],
+        #     "edge_reasons": {UUID(...): ["field:name", "execution:analyze_student"]},
+        #     "transitive_dependents": {UUID(...): 1, UUID(...): 2},
+        #     "total_dependents": 2
+        # }
+    """
+    from abstractions.ecs.provenance_index import ProvenanceIndex
+    
+    ecs_id = entity if isinstance(entity, UUID) else entity.ecs_id
+    direct = ProvenanceIndex.dependents_of(ecs_id)
+    result: Dict[str, Any] = {
+        "direct_dependents": list(direct),
+        "edge_reasons": {dependent_id: sorted(reasons) for dependent_id, reasons in direct.items()},
+        "total_dependents": len(direct)
+    }
+    if transitive:
+        reachable = ProvenanceIndex.transitive_dependents(ecs_id, max_depth=max_depth, max_nodes=max_nodes)
+        result["transitive_dependents"] = reachable
+        result["total_dependents"] = len(reachable)
+    return result
+
+
 def validate_addresses(addresses: List[str]) -> Dict[str, bool]:
     """
     Validate multiple ECS addresses without resolving them.
@@ -0,0 +1,352 @@
+"""
+Lineage I/O: Streaming JSON Lines Export and Import of Entity Lineages
+
+This module provides a serialization path for EntityTree and a streaming
+exporter/importer that moves whole registries (or selected lineages) between
+environments one tree version at a time.
+
+Features:
+- EntityTreeSerializer: EntityTree <-> flat record (typed nodes + index-based edges)
+- Sub-entities stored once as nodes, never nested inside their parents
+- Entity classes resolved by module path, with a fallback to loaded subclasses
+- Generator-based export over lineage_registry with bounded memory
+- Incremental import rebuilding tree_registry, lineage_registry,
+  ecs_id_to_root_id, live_id_registry, type_registry and the sibling groups
+  of imported execution records line by line
+"""
+
+import importlib
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Type, Union
+from uuid import UUID
+
+from pydantic_core import to_jsonable_python
+
+from abstractions.ecs.entity import Entity, EntityTree, EntityEdge, EdgeType, EntityRegistry
+
+
+RECORD_FORMAT = "abstractions.entity_tree/1"
+
+
+def json_fallback(value: Any) -> Any:
+    """JSON form of values pydantic cannot serialize: classes (e.g. in execution metadata) by "module:qualname"."""
+    if isinstance(value, type):
+        return f"{value.__module__}:{value.__qualname__}"
+    raise TypeError(f"Cannot serialize {type(value).__name__} value {value!r}")
+
+
+class EntityTreeSerializer:
+    """
+    Convert EntityTree objects to flat records and back.
+
+    A record lists the tree nodes (root first) with their entity class and
+    non-entity field data, plus the edges as node indices. Fields that hold
+    sub-entities are stored as skeletons (entity positions set to None) and are
+    refilled from the edges when the tree is rebuilt bottom-up.
+    """
+
+    _class_cache: Dict[str, Type[Entity]] = {}
+
+    @classmethod
+    def class_path(cls, entity_class: Type[Entity]) -> str:
+        """Stable "module:qualname" identifier of an entity class."""
+        return f"{entity_class.__module__}:{entity_class.__qualname__}"
+
+    @classmethod
+    def resolve_class(cls, class_path: str) -> Type[Entity]:
+        """
+        Resolve a "module:qualname" identifier back to an entity class.
+
+        Falls back to searching loaded Entity subclasses, which covers classes
+        created dynamically (function input/output entities, config entities).
+        """
+        cached = cls._class_cache.get(class_path)
+        if cached is not None:
+            return cached
+
+        module_name, _, qualname = class_path.partition(":")
+        resolved: Optional[Type[Entity]] = None
+        try:
+            target: Any = importlib.import_module(module_name)
+            for part in qualname.split("."):
+                target = getattr(target, part)
+            if isinstance(target, type) and issubclass(target, Entity):
+                resolved = target
+        except (ImportError, AttributeError):
+            resolved = None
+
+        if resolved is None:
+            pending = list(Entity.__subclasses__())
+            while pending:
+                candidate = pending.pop()
+                if cls.class_path(candidate) == class_path:
+                    resolved = candidate
+                    break
+                pending.extend(candidate.__subclasses__())
+
+        if resolved is None:
+            raise ValueError(f"Cannot resolve entity class '{class_path}'")
+        cls._class_cache[class_path] = resolved
+        return resolved
+
+    @classmethod
+    def entity_field_names(cls, tree: EntityTree, entity_id: UUID) -> Set[str]:
+        """Names of the fields of a node that hold sub-entities in this tree."""
+        return {
+            tree.edges[(entity_id, target_id)].field_name
+            for target_id in tree.outgoing_edges.get(entity_id, [])
+        }
+
+    @classmethod
+    def node_data(cls, tree: EntityTree, entity: Entity, mode: str = "json") -> Dict[str, Any]:
+        """
+        Field data of a node with sub-entities stripped out.
+
+        Args:
+            mode: "json" for JSON-compatible values, "python" for native values
+        """
+        entity_fields = cls.entity_field_names(tree, entity.ecs_id)
+        data = entity.model_dump(
+            mode=mode, exclude=entity_fields or None, fallback=json_fallback if mode == "json" else None
+        )
+        for field_name in entity_fields:
+            value = getattr(entity, field_name)
+            if isinstance(value, Entity) or value is None:
+                skeleton: Any = None
+            elif isinstance(value, (list, tuple)):
+                skeleton = [None if isinstance(item, Entity) else item for item in value]
+            elif isinstance(value, dict):
+                skeleton = {key: (None if isinstance(item, Entity) else item) for key, item in value.items()}
+            else:
+                # Sets can only hold entities: rebuilt entirely from edges
+                skeleton = []
+            data[field_name] = to_jsonable_python(skeleton) if mode == "json" else skeleton
+        return data
+
+    @classmethod
+    def tree_to_record(cls, tree: EntityTree, mode: str = "json") -> Dict[str, Any]:
+        """Serialize a tree into a flat record (JSON-compatible when mode="json")."""
+        node_ids = [tree.root_ecs_id] + [node_id for node_id in tree.nodes if node_id != tree.root_ecs_id]
+        index_of = {node_id: index for index, node_id in enumerate(node_ids)}
+        nodes = [
+            {
+                "class": cls.class_path(type(tree.nodes[node_id])),
+                "data": cls.node_data(tree, tree.nodes[node_id], mode=mode),
+            }
+            for node_id in node_ids
+        ]
+        edges = [
+            [
+                index_of[edge.source_id],
+                index_of[edge.target_id],
+                edge.field_name,
+                edge.edge_type.value,
+                edge.container_index,
+                to_jsonable_python(edge.container_key) if mode == "json" else edge.container_key,
+                edge.ownership,
+                edge.is_hierarchical,
+            ]
+            for edge in tree.edges.values()
+        ]
+        return {
+            "format": RECORD_FORMAT,
+            "root_ecs_id": str(tree.root_ecs_id) if mode == "json" else tree.root_ecs_id,
+            "lineage_id": str(tree.lineage_id) if mode == "json" else tree.lineage_id,
+            "nodes": nodes,
+            "edges": edges,
+        }
+
+    @classmethod
+    def _edge_from_row(cls, row: List[Any], node_ids: List[UUID]) -> EntityEdge:
+        source_index, target_index, field_name, edge_type, container_index, container_key, ownership, is_hierarchical = row
+        return EntityEdge(
+            source_id=node_ids[source_index],
+            target_id=node_ids[target_index],
+            edge_type=EdgeType(edge_type),
+            field_name=field_name,
+            container_index=container_index,
+            container_key=container_key,
+            ownership=ownership,
+            is_hierarchical=is_hierarchical,
+        )
+
+    @classmethod
+    def tree_from_record(cls, record: Dict[str, Any]) -> EntityTree:
+        """
+        Rebuild an EntityTree (and its entities) from a record.
+
+        Nodes are validated bottom-up so every parent receives its already built
+        children; ecs_ids, lineage ids and provenance are preserved exactly.
+        """
+        if record.get("format", RECORD_FORMAT) != RECORD_FORMAT:
+            raise ValueError(f"Unsupported record format: {record.get('format')}")
+
+        node_records = record["nodes"]
+        node_ids = [UUID(str(node["data"]["ecs_id"])) for node in node_records]
+
+        # Step 1: Children per node and BFS order from the root
+        children: Dict[int, List[List[Any]]] = {}
+        for row in record["edges"]:
+            children.setdefault(row[0], []).append(row)
+        order: List[int] = []
+        parents: Dict[int, int] = {}
+        queue = deque([0])
+        seen = {0}
+        while queue:
+            index = queue.popleft()
+            order.append(index)
+            for row in children.get(index, []):
+                target_index = row[1]
+                if target_index not in seen:
+                    seen.add(target_index)
+                    parents[target_index] = index
+                    queue.append(target_index)
+        if len(order) != len(node_records):
+            raise ValueError("record contains nodes that are not reachable from the root")
+
+        # Step 2: Validate nodes bottom-up, refilling entity positions from edges
+        built: Dict[int, Entity] = {}
+        for index in reversed(order):
+            node = node_records[index]
+            data = dict(node["data"])
+            set_fields: Dict[str, List[Entity]] = {}
+            for row in children.get(index, []):
+                _, target_index, field_name, edge_type, container_index, container_key, _, _ = row
+                child = built[target_index]
+                if edge_type == EdgeType.SET.value or (
+                        edge_type == EdgeType.DIRECT.value and isinstance(data.get(field_name), list)):
+                    # build_entity_tree records set members as direct edges; their skeleton is []
+                    set_fields.setdefault(field_name, []).append(child)
+                elif edge_type == EdgeType.DIRECT.value:
+                    data[field_name] = child
+                elif edge_type in (EdgeType.LIST.value, EdgeType.TUPLE.value):
+                    skeleton = data[field_name] = list(data[field_name])
+                    skeleton[container_index] = child
+                elif edge_type == EdgeType.DICT.value:
+                    skeleton = data[field_name] = dict(data[field_name])
+                    if container_key not in skeleton:
+                        # JSON turns every dict key into a string
+                        skeleton.pop(str(container_key), None)
+                    skeleton[container_key] = child
+            for field_name, members in set_fields.items():
+                data[field_name] = set(members)
+            entity_class = cls.resolve_class(node["class"])
+            built[index] = entity_class.model_validate(data)
+
+        # Step 3: Reassemble the tree structure
+        tree = EntityTree(root_ecs_id=node_ids[0], lineage_id=UUID(str(record["lineage_id"])))
+        paths: Dict[int, List[UUID]] = {}
+        for index in order:
+            tree.add_entity(built[index])
+            parent_index = parents.get(index)
+            paths[index] = [node_ids[index]] if parent_index is None else paths[parent_index] + [node_ids[index]]
+            tree.set_ancestry_path(node_ids[index], paths[index])
+        for row in record["edges"]:
+            tree.add_edge(cls._edge_from_row(row, node_ids))
+        return tree
+
+
+def iter_lineage_records(lineage_ids: Optional[Iterable[UUID]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one JSON-compatible record per stored tree version.
+
+    Versions are yielded lineage by lineage in registration order, each record
+    annotated with its position ("version") inside the lineage.
+    """
+    selected = list(EntityRegistry.lineage_registry.keys()) if lineage_ids is None else list(lineage_ids)
+    for lineage_id in selected:
+        root_ids = EntityRegistry.lineage_registry.get(lineage_id)
+        if root_ids is None:
+            raise ValueError(f"Lineage {lineage_id} is not registered")
+        for version, root_ecs_id in enumerate(list(root_ids)):
+            tree = EntityRegistry.tree_registry.get(root_ecs_id)
+            if tree is None:
+                continue
+            record = EntityTreeSerializer.tree_to_record(tree)
+            record["version"] = version
+            yield record
+
+
+def export_lineages(destination: Union[str, TextIO], lineage_ids: Optional[Iterable[UUID]] = None) -> int:
+    """
+    Write every version of the selected lineages as JSON Lines.
+
+    Args:
+        destination: File path or open text handle
+        lineage_ids: Lineages to export (all registered lineages when None)
+
+    Returns:
+        Number of tree versions written
+    """
+    written = 0
+    handle, owned = open_text(destination, "w")
+    try:
+        for record in iter_lineage_records(lineage_ids):
+            handle.write(json.dumps(record, separators=(",", ":")))
+            handle.write("\n")
+            written += 1
+    finally:
+        if owned:
+            handle.close()
+    return written
+
+
+def iter_lineage_file(source: Union[str, TextIO]) -> Iterator[EntityTree]:
+    """Stream EntityTree objects from a JSON Lines export, one line at a time."""
+    handle, owned = open_text(source, "r")
+    try:
+        for line in handle:
+            if line.strip():
+                yield EntityTreeSerializer.tree_from_record(json.loads(line))
+    finally:
+        if owned:
+            handle.close()
+
+
+@dataclass
+class LineageImportResult:
+    """Summary of a lineage import."""
+    trees_imported: int = 0
+    trees_skipped: int = 0
+    lineage_ids: List[UUID] = field(default_factory=list)
+
+
+def import_lineages(source: Union[str, TextIO], skip_existing: bool = True) -> LineageImportResult:
+    """
+    Import a JSON Lines export into EntityRegistry incrementally.
+
+    Each line is rebuilt and registered before the next one is read, so the
+    registries grow in file order (preserving version order inside lineages)
+    without materializing the dataset in memory.
+
+    Args:
+        source: File path or open text handle
+        skip_existing: Skip trees whose root_ecs_id is already registered
+            (otherwise raise ValueError)
+    """
+    result = LineageImportResult()
+    seen_lineages: Set[UUID] = set()
+    for tree in iter_lineage_file(source):
+        if tree.root_ecs_id in EntityRegistry.tree_registry:
+            if not skip_existing:
+                raise ValueError(f"Tree {tree.root_ecs_id} is already registered")
+            result.trees_skipped += 1
+            continue
+        EntityRegistry.register_entity_tree(tree)
+        result.trees_imported += 1
+        if tree.lineage_id not in seen_lineages:
+            seen_lineages.add(tree.lineage_id)
+            result.lineage_ids.append(tree.lineage_id)
+    return result
+
+
+def open_text(target: Union[str, TextIO], mode: str, newline: Optional[str] = None) -> Tuple[TextIO, bool]:
+    """
+    Open a path as UTF-8 text (owned=True, caller closes it) or pass an already
+    open text handle through (owned=False). Shared by the file-based readers and writers.
+    """
+    if isinstance(target, str) or hasattr(target, "__fspath__"):
+        return open(target, mode, encoding="utf-8", newline=newline), True
+    return target, False
@@ -0,0 +1,291 @@
+"""
+Pipelines: Declarative DAGs over Registered Functions
+
+This module wires registered functions into a directed acyclic graph whose
+edges are output-to-input bindings, and schedules it so that every node starts
+as soon as the outputs it reads are available.
+
+Features:
+- Bindings to a whole output, one item of a list output, or a field address
+  ("@<ecs_id>.<field>") resolved by the registry's borrowing path
+- Bindings inside list, tuple and dict arguments
+- Concurrent scheduling of independent nodes, with an optional pipeline-wide
+  bound on top of the per-function max_concurrency limits
+- Streaming of node results as they complete (astream)
+- Per-node timing and critical-path analysis in the pipeline result
+"""
+
+import asyncio
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from abstractions.ecs.entity import Entity
+
+
+@dataclass(frozen=True)
+class OutputRef:
+    """Binding to the output of a pipeline node."""
+    node: str
+    index: Optional[int] = None        # Item of a list output
+    field_path: Optional[str] = None   # Bind "@<ecs_id>.<field_path>" instead of the entity
+
+    def __getitem__(self, index: int) -> "OutputRef":
+        if self.index is not None or self.field_path is not None:
+            raise ValueError(f"Output binding of '{self.node}' is already narrowed")
+        return OutputRef(self.node, index, None)
+
+    def field(self, path: str) -> "OutputRef":
+        if self.field_path is not None:
+            raise ValueError(f"Output binding of '{self.node}' already addresses a field")
+        return OutputRef(self.node, self.index, path)
+
+
+@dataclass
+class PipelineNode:
+    """One registered-function call in a pipeline."""
+    name: str
+    function_name: str
+    arguments: Dict[str, Any]
+    depends_on: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class NodeResult:
+    """Outcome and timing of one node (times in ms relative to the pipeline start)."""
+    name: str
+    function_name: str
+    status: str                    # "completed" | "failed" | "skipped"
+    output: Any = None
+    error: Optional[BaseException] = None
+    ready_ms: float = 0.0          # All inputs available
+    start_ms: float = 0.0          # Admitted by the pipeline bound
+    end_ms: float = 0.0
+    performance_metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+
+@dataclass
+class PipelineResult:
+    """Results of a pipeline run with critical-path timing."""
+    results: Dict[str, NodeResult]
+    total_ms: float
+    critical_path: List[str]
+    critical_path_ms: float
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name].output
+
+    @property
+    def outputs(self) -> Dict[str, Any]:
+        return {name: result.output for name, result in self.results.items() if result.status == "completed"}
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.status == "completed" for result in self.results.values())
+
+    def get_timing_report(self) -> Dict[str, Any]:
+        busy_ms = sum(result.duration_ms for result in self.results.values() if result.status == "completed")
+        return {
+            "total_ms": self.total_ms,
+            "critical_path": self.critical_path,
+            "critical_path_ms": self.critical_path_ms,
+            "busy_ms": busy_ms,
+            "parallelism": busy_ms / self.total_ms if self.total_ms else 0.0,
+            "nodes": {
+                name: {
+                    "status": result.status,
+                    "ready_ms": result.ready_ms,
+                    "start_ms": result.start_ms,
+                    "end_ms": result.end_ms,
+                    "duration_ms": result.duration_ms
+                }
+                for name, result in self.results.items()
+            }
+        }
+
+
+class UpstreamFailure(Exception):
+    """A node was skipped because a node it reads from did not complete."""
+
+
+class Pipeline:
+    """
+    DAG of registered-function calls.
+
+    Example:
+        pipeline = Pipeline("semester")
+        analysis = pipeline.add("analysis", "analyze_student_performance", student=alice, grades=grades)
+        stats = pipeline.add("stats", "analyze_course_statistics", course=course, grades=grades)
+        pipeline.add("report", "generate_semester_report", analyses=[analysis], statistics=[stats])
+        result = await pipeline.arun()
+    """
+
+    def __init__(self, name: str = "pipeline"):
+        self.name = name
+        self.nodes: Dict[str, PipelineNode] = {}
+
+    def add(self, name: str, function_name: str, after: Optional[List[OutputRef]] = None, **arguments) -> OutputRef:
+        """
+        Add a node calling a registered function.
+
+        Args:
+            name: Unique node name
+            function_name: Registered function to call
+            after: Extra ordering dependencies that do not pass data
+            **arguments: Function arguments; OutputRef values (also inside lists,
+                tuples and dicts) are bound to upstream outputs
+
+        Returns:
+            OutputRef to the node output (index it or call .field() to narrow it)
+        """
+        from abstractions.ecs.callable_registry import CallableRegistry
+
+        if name in self.nodes:
+            raise ValueError(f"Pipeline '{self.name}' already has a node named '{name}'")
+        if CallableRegistry.get_metadata(function_name) is None:
+            raise ValueError(f"Function '{function_name}' not registered")
+
+        depends_on = self._collect_dependencies(arguments) | {ref.node for ref in (after or [])}
+        for dependency in depends_on:
+            if dependency not in self.nodes:
+                raise ValueError(f"Node '{name}' depends on unknown node '{dependency}'")
+        self.nodes[name] = PipelineNode(name, function_name, arguments, depends_on)
+        return OutputRef(name)
+
+    @classmethod
+    def _collect_dependencies(cls, value: Any) -> Set[str]:
+        if isinstance(value, OutputRef):
+            return {value.node}
+        if isinstance(value, dict):
+            return set().union(*(cls._collect_dependencies(item) for item in value.values()))
+        if isinstance(value, (list, tuple)):
+            return set().union(*(cls._collect_dependencies(item) for item in value))
+        return set()
+
+    @classmethod
+    def _resolve(cls, value: Any, outputs: Dict[str, Any]) -> Any:
+        """Replace output bindings with upstream outputs (entities, list items or addresses)."""
+        if isinstance(value, OutputRef):
+            output = outputs[value.node]
+            if value.index is not None:
+                if not isinstance(output, list):
+                    raise ValueError(f"Node '{value.node}' did not return a list; cannot bind item {value.index}")
+                output = output[value.index]
+            if value.field_path is not None:
+                if not isinstance(output, Entity):
+                    raise ValueError(f"Node '{value.node}' output is not an entity; cannot address '{value.field_path}'")
+                return f"@{output.ecs_id}.{value.field_path}"
+            return output
+        if isinstance(value, dict):
+            return {key: cls._resolve(item, outputs) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._resolve(item, outputs) for item in value]
+        if isinstance(value, tuple):
+            return tuple(cls._resolve(item, outputs) for item in value)
+        return value
+
+    def topological_order(self) -> List[str]:
+        """Node names in a valid execution order (insertion order among independent nodes)."""
+        # Nodes may only bind to nodes added before them, so insertion order is topological
+        return list(self.nodes)
+
+    async def astream(self, max_concurrency: Optional[int] = None, fail_fast: bool = True) -> AsyncIterator[NodeResult]:
+        """
+        Run the pipeline, yielding node results as they complete.
+
+        Args:
+            max_concurrency: Pipeline-wide bound on running nodes (per-function
+                limits registered with max_concurrency always apply)
+            fail_fast: Cancel the remaining nodes and raise on the first failure;
+                otherwise independent branches keep running and dependents of
+                failed nodes are reported as skipped
+        """
+        from abstractions.ecs.callable_registry import CallableRegistry, completed_execution_metrics
+
+        loop = asyncio.get_running_loop()
+        started_at = time.perf_counter()
+        futures: Dict[str, asyncio.Future] = {name: loop.create_future() for name in self.nodes}
+        for future in futures.values():
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())  # Mark failures as retrieved
+        completed: asyncio.Queue = asyncio.Queue()
+        bound = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - started_at) * 1000
+
+        async def run_node(node: PipelineNode) -> None:
+            result = NodeResult(node.name, node.function_name, status="completed")
+            try:
+                # Stream-in: start as soon as the outputs this node reads exist
+                outputs = {dependency: await futures[dependency] for dependency in node.depends_on}
+            except BaseException as e:
+                result.status = "skipped"
+                result.error = e if isinstance(e, UpstreamFailure) else UpstreamFailure(f"upstream of '{node.name}' failed: {e}")
+                result.ready_ms = result.start_ms = result.end_ms = elapsed_ms()
+                futures[node.name].set_exception(result.error)
+                completed.put_nowait(result)
+                return
+            result.ready_ms = elapsed_ms()
+            try:
+                async with bound or nullcontext():
+                    result.start_ms = elapsed_ms()
+                    kwargs = self._resolve(node.arguments, outputs)
+                    result.output = await CallableRegistry.aexecute(node.function_name, **kwargs)
+                    result.performance_metrics = completed_execution_metrics()
+            except Exception as e:
+                result.status = "failed"
+                result.error = e
+                result.end_ms = elapsed_ms()
+                futures[node.name].set_exception(e)
+                completed.put_nowait(result)
+                return
+            result.end_ms = elapsed_ms()
+            futures[node.name].set_result(result.output)
+            completed.put_nowait(result)
+
+        tasks = [asyncio.ensure_future(run_node(self.nodes[name])) for name in self.topological_order()]
+        try:
+            for _ in range(len(tasks)):
+                result = await completed.get()
+                if result.status == "failed" and fail_fast:
+                    raise result.error
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def arun(self, max_concurrency: Optional[int] = None, fail_fast: bool = True) -> PipelineResult:
+        """Run the pipeline to completion and return outputs with critical-path timing."""
+        started_at = time.perf_counter()
+        results: Dict[str, NodeResult] = {}
+        async for result in self.astream(max_concurrency=max_concurrency, fail_fast=fail_fast):
+            results[result.name] = result
+        total_ms = (time.perf_counter() - started_at) * 1000
+        ordered = {name: results[name] for name in self.topological_order() if name in results}
+        critical_path, critical_path_ms = self._critical_path(ordered)
+        return PipelineResult(ordered, total_ms, critical_path, critical_path_ms)
+
+    def run(self, max_concurrency: Optional[int] = None, fail_fast: bool = True) -> PipelineResult:
+        """Sync wrapper of arun (runs on the background event loop)."""
+        from abstractions.events.background_loop import run_sync
+        return run_sync(self.arun(max_concurrency=max_concurrency, fail_fast=fail_fast))
+
+    def _critical_path(self, results: Dict[str, NodeResult]) -> Tuple[List[str], float]:
+        """Chain of nodes that determined the finish time, following the last-finishing dependency."""
+        finished = [result for result in results.values() if result.status == "completed"]
+        if not finished:
+            return [], 0.0
+        path: List[str] = []
+        current: Optional[NodeResult] = max(finished, key=lambda result: result.end_ms)
+        while current is not None:
+            path.append(current.name)
+            upstream = [results[name] for name in self.nodes[current.name].depends_on if name in results]
+            current = max(upstream, key=lambda result: result.end_ms) if upstream else None
+        path.reverse()
+        return path, sum(results[name].duration_ms for name in path)
@@ -0,0 +1,157 @@
+"""
+Process Execution: Running Registered Functions in Worker Processes
+
+This module provides the transport used by CallableRegistry for functions
+registered with execution_target="process". Inputs and results cross the
+process boundary in the compact binary EntityTree format instead of pickled
+pydantic models, so dynamically created entity classes never need to be
+importable by pickle.
+
+Features:
+- Entity arguments (and entities inside lists, tuples, dicts) packed with EntityTreeCodec
+- functools.partial wrappers unwrapped so bound ConfigEntity values travel as entities
+- Registration-time shape check, with the pickle check deferred to first submission
+- Worker entry point reporting which returned entities are the argument objects themselves
+- Parent-side unpacking that writes returned argument state back into the
+  execution copies, keeping object-identity semantic detection intact
+"""
+
+import pickle
+import weakref
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from abstractions.ecs.entity import Entity
+from abstractions.ecs.binary_codec import EntityTreeCodec
+
+
+# Packed value kinds
+PACKED_VALUE = "value"
+PACKED_ENTITY = "entity"
+PACKED_LIST = "list"
+PACKED_TUPLE = "tuple"
+PACKED_DICT = "dict"
+
+
+def _contains_entity(values) -> bool:
+    return any(isinstance(item, Entity) for item in values)
+
+
+def pack_value(value: Any, argument_names: Optional[Dict[int, Any]] = None) -> Tuple[Any, ...]:
+    """
+    Pack a value for transfer to or from a worker process.
+
+    Args:
+        value: Argument or result value
+        argument_names: id(argument entity) -> argument reference (parameter name, or
+            (parameter name, index) for list items), used by workers to mark returned
+            entities that are the argument objects themselves
+    """
+    if isinstance(value, Entity):
+        argument_ref = argument_names.get(id(value)) if argument_names else None
+        return (PACKED_ENTITY, argument_ref, EntityTreeCodec.encode_entity(value))
+    if isinstance(value, list) and _contains_entity(value):
+        return (PACKED_LIST, [pack_value(item, argument_names) for item in value])
+    if isinstance(value, tuple) and _contains_entity(value):
+        return (PACKED_TUPLE, [pack_value(item, argument_names) for item in value])
+    if isinstance(value, dict) and _contains_entity(value.values()):
+        return (PACKED_DICT, [(key, pack_value(item, argument_names)) for key, item in value.items()])
+    return (PACKED_VALUE, value)
+
+
+def unpack_value(packed: Tuple[Any, ...], arguments: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Rebuild a packed value.
+
+    Args:
+        packed: Output of pack_value
+        arguments: Parent-side arguments by parameter name. Returned entities marked
+            as argument objects are copied back into these objects and the objects
+            themselves are returned, so identity checks behave as for in-process calls.
+    """
+    kind = packed[0]
+    if kind == PACKED_VALUE:
+        return packed[1]
+    if kind == PACKED_ENTITY:
+        _, argument_ref, data = packed
+        entity = EntityTreeCodec.decode_entity(data)
+        target = _resolve_argument(arguments, argument_ref)
+        if target is not None:
+            target.__dict__.update(entity.__dict__)
+            return target
+        return entity
+    if kind == PACKED_LIST:
+        return [unpack_value(item, arguments) for item in packed[1]]
+    if kind == PACKED_TUPLE:
+        return tuple(unpack_value(item, arguments) for item in packed[1])
+    if kind == PACKED_DICT:
+        return {key: unpack_value(item, arguments) for key, item in packed[1]}
+    raise ValueError(f"Unknown packed value kind: {kind}")
+
+
+def _resolve_argument(arguments: Optional[Dict[str, Any]], argument_ref: Any) -> Optional[Entity]:
+    if argument_ref is None or not arguments:
+        return None
+    if isinstance(argument_ref, tuple):
+        name, index = argument_ref
+        container = arguments.get(name)
+        target = container[index] if isinstance(container, list) and index < len(container) else None
+    else:
+        target = arguments.get(argument_ref)
+    return target if isinstance(target, Entity) else None
+
+
+def unwrap_partial(func: Callable, kwargs: Dict[str, Any]) -> Tuple[Callable, Dict[str, Any]]:
+    """Flatten functools.partial layers into (plain function, merged keyword arguments)."""
+    while isinstance(func, partial):
+        if func.args:
+            raise ValueError("Process execution only supports keyword-bound partial functions")
+        kwargs = {**func.keywords, **kwargs}
+        func = func.func
+    return func, kwargs
+
+
+# Functions already confirmed to pickle by reference
+_picklable_functions: "weakref.WeakSet[Callable]" = weakref.WeakSet()
+
+
+def ensure_process_compatible(func: Callable) -> None:
+    """
+    Raise ValueError if a function can never be shipped to worker processes by reference.
+
+    Only the function's shape is checked (nested functions, lambdas, closures):
+    registration decorators run before the module-level name is bound, so the
+    real pickle check is left to ensure_picklable at the first submission.
+    """
+    qualname = getattr(func, "__qualname__", "")
+    if "<locals>" in qualname or "<lambda>" in qualname or getattr(func, "__closure__", None):
+        raise ValueError(
+            f"Function {qualname or func} cannot run in a process pool: "
+            f"it must be defined at module level (not nested, a lambda or a closure)"
+        )
+
+
+def ensure_picklable(func: Callable) -> None:
+    """Raise ValueError if a function does not pickle by reference (checked once per function)."""
+    if func in _picklable_functions:
+        return
+    try:
+        pickle.dumps(func)
+    except Exception as e:
+        raise ValueError(
+            f"Function {getattr(func, '__qualname__', func)} cannot run in a process pool: "
+            f"it must be importable under its module-level name ({e})"
+        )
+    _picklable_functions.add(func)
+
+
+def process_entry(func: Callable, packed_kwargs: Dict[str, Tuple[Any, ...]]) -> Tuple[Any, ...]:
+    """Worker entry point: unpack arguments, run the function, pack the result."""
+    kwargs = {name: unpack_value(packed) for name, packed in packed_kwargs.items()}
+    argument_names: Dict[int, Any] = {}
+    for name, value in kwargs.items():
+        if isinstance(value, Entity):
+            argument_names[id(value)] = name
+        elif isinstance(value, list):
+            argument_names.update((id(item), (name, index)) for index, item in enumerate(value) if isinstance(item, Entity))
+    return pack_value(func(**kwargs), argument_names)
@@ -0,0 +1,171 @@
+"""
+Provenance Index: Reverse Lookup of Derived Entities
+
+This module maintains a reverse index of provenance edges ("entity B was
+derived from entity A") so that impact analysis and cache invalidation can ask
+what depends on an entity without scanning every registered entity's
+attribute_source or every FunctionExecution.
+
+Features:
+- Incremental maintenance as outputs are created and executions recorded
+- Edges from attribute_source (field-level) and from function executions
+- O(1) direct dependents / dependencies lookup by ecs_id
+- Bounded transitive traversal (depth and node limits)
+- Full rebuild from the registry for imported or pre-existing data
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from abstractions.ecs.entity import Entity, EntityRegistry, FunctionExecution
+
+if TYPE_CHECKING:
+    from abstractions.ecs.execution_log import ExecutionLog
+
+
+def _source_ids(source: Any) -> Iterable[UUID]:
+    """UUIDs inside an attribute_source value (a UUID, or a list/dict of them)."""
+    if isinstance(source, UUID):
+        yield source
+    elif isinstance(source, list):
+        for item in source:
+            if isinstance(item, UUID):
+                yield item
+    elif isinstance(source, dict):
+        for item in source.values():
+            if isinstance(item, UUID):
+                yield item
+
+
+class ProvenanceIndex:
+    """
+    Reverse provenance index keyed by ecs_id.
+
+    Each edge source -> dependent carries the reasons it exists:
+    "field:<name>" for attribute_source entries and "execution:<function>" for
+    function executions.
+    """
+
+    enabled: bool = True
+    _dependents: Dict[UUID, Dict[UUID, Set[str]]] = {}
+    _dependencies: Dict[UUID, Dict[UUID, Set[str]]] = {}
+
+    @classmethod
+    def add_edge(cls, source_id: UUID, dependent_id: UUID, via: str) -> None:
+        if not cls.enabled or source_id == dependent_id:
+            return
+        cls._dependents.setdefault(source_id, {}).setdefault(dependent_id, set()).add(via)
+        cls._dependencies.setdefault(dependent_id, {}).setdefault(source_id, set()).add(via)
+
+    @classmethod
+    def add_attribute_sources(cls, entity: Entity) -> None:
+        """Index the field-level sources recorded in an entity's attribute_source."""
+        if not cls.enabled:
+            return
+        for field_name, source in entity.attribute_source.items():
+            for source_id in _source_ids(source):
+                cls.add_edge(source_id, entity.ecs_id, f"field:{field_name}")
+
+    @classmethod
+    def add_execution(cls, function_name: str, input_ids: Iterable[Optional[UUID]], output_ids: Iterable[Optional[UUID]]) -> None:
+        """Index the input -> output edges of one function execution."""
+        if not cls.enabled:
+            return
+        outputs = [output_id for output_id in output_ids if output_id is not None]
+        for input_id in input_ids:
+            if input_id is None:
+                continue
+            for output_id in outputs:
+                cls.add_edge(input_id, output_id, f"execution:{function_name}")
+
+    @classmethod
+    def add_execution_record(cls, execution: FunctionExecution, extra_input_ids: Iterable[UUID] = ()) -> None:
+        """Index a FunctionExecution record (its input entity and declared outputs)."""
+        output_ids = list(execution.output_entity_ids)
+        if execution.output_entity_id is not None and execution.output_entity_id not in output_ids:
+            output_ids.append(execution.output_entity_id)
+        cls.add_execution(execution.function_name, [execution.input_entity_id, *extra_input_ids], output_ids)
+
+    @classmethod
+    def dependents_of(cls, ecs_id: UUID) -> Dict[UUID, Set[str]]:
+        """Entities directly derived from ecs_id, with the reasons of each edge."""
+        return cls._dependents.get(ecs_id, {})
+
+    @classmethod
+    def dependencies_of(cls, ecs_id: UUID) -> Dict[UUID, Set[str]]:
+        """Entities ecs_id was directly derived from, with the reasons of each edge."""
+        return cls._dependencies.get(ecs_id, {})
+
+    @classmethod
+    def transitive_dependents(
+        cls,
+        ecs_id: UUID,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None
+    ) -> Dict[UUID, int]:
+        """
+        Everything derived from ecs_id, directly or indirectly (breadth-first).
+
+        Args:
+            ecs_id: Entity to start from
+            max_depth: Stop expanding past this many edges from the start
+            max_nodes: Stop once this many dependents have been found
+
+        Returns:
+            dependent ecs_id -> depth (1 for direct dependents)
+        """
+        found: Dict[UUID, int] = {}
+        queue = deque([(ecs_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for dependent_id in cls._dependents.get(current, {}):
+                if dependent_id in found or dependent_id == ecs_id:
+                    continue
+                found[dependent_id] = depth + 1
+                if max_nodes is not None and len(found) >= max_nodes:
+                    return found
+                queue.append((dependent_id, depth + 1))
+        return found
+
+    @classmethod
+    def rebuild(cls, execution_log: Optional["ExecutionLog"] = None) -> int:
+        """
+        Rebuild the index from every registered tree (and the rows of an
+        execution log, if given); returns the number of edges.
+        """
+        cls.clear()
+        for tree in list(EntityRegistry.tree_registry.values()):
+            for entity in tree.nodes.values():
+                if entity.attribute_source:
+                    cls.add_attribute_sources(entity)
+                if isinstance(entity, FunctionExecution):
+                    cls.add_execution_record(entity)
+        if execution_log is not None:
+            for row in execution_log.iter_rows():
+                cls.add_execution(
+                    row["function_name"],
+                    [row["input_entity_id"], *row["config_entity_ids"]],
+                    [row["output_entity_id"], *row["output_entity_ids"]]
+                )
+        return cls.edge_count()
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._dependents.clear()
+        cls._dependencies.clear()
+
+    @classmethod
+    def edge_count(cls) -> int:
+        return sum(len(dependents) for dependents in cls._dependents.values())
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {
+            "enabled": cls.enabled,
+            "sources": len(cls._dependents),
+            "dependents": len(cls._dependencies),
+            "edges": cls.edge_count()
+        }
@@ -0,0 +1,345 @@
+"""
+Incremental Recomputation: Re-running Only What an Input Change Affects
+
+This module records registered-function executions as computation records and,
+when an input entity is versioned, re-executes only the downstream computations
+that read one of its earlier versions, in dependency order.
+
+Features:
+- Opt-in dependency tracking of CallableRegistry.aexecute calls (entity inputs
+  by ecs_id and content digest, address inputs, plain arguments, outputs)
+- Consumers found through ProvenanceIndex edges and the records that produced each output
+- Downstream discovery through the outputs of affected computations
+- Topological re-execution with the latest versions substituted
+- Computations whose inputs are unchanged by content are skipped, and outputs
+  that come out identical stop the propagation
+"""
+
+import contextvars
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.provenance_index import ProvenanceIndex
+
+
+# Entity system fields: excluded from content digests so versioning alone is not a change
+_SYSTEM_FIELDS = frozenset(Entity.model_fields)
+
+
+def _strip_system_fields(data: Any) -> Any:
+    if isinstance(data, dict):
+        is_entity = "ecs_id" in data and "lineage_id" in data
+        return {
+            key: _strip_system_fields(value)
+            for key, value in data.items()
+            if not (is_entity and key in _SYSTEM_FIELDS)
+        }
+    if isinstance(data, list):
+        return [_strip_system_fields(item) for item in data]
+    return data
+
+
+def content_digest(entity: Entity) -> str:
+    """Digest of an entity's data (sub-entities included), ignoring identity and versioning fields."""
+    data = _strip_system_fields(entity.model_dump(mode="json"))
+    return hashlib.blake2b(repr((type(entity).__name__, data)).encode(), digest_size=16).hexdigest()
+
+
+def _address_target(value: Any) -> Optional[UUID]:
+    if isinstance(value, str) and value.startswith("@"):
+        try:
+            return UUID(value[1:].split(".")[0])
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass
+class ComputationRecord:
+    """One recorded execution of a registered function."""
+    record_id: UUID
+    function_name: str
+    entity_inputs: Dict[str, Tuple[UUID, str]]        # param -> (ecs_id, content digest)
+    address_inputs: Dict[str, Tuple[UUID, str]]       # param -> (target ecs_id, address)
+    plain_inputs: Dict[str, Any]                      # param -> value passed unchanged
+    outputs: List[Tuple[UUID, str]] = field(default_factory=list)  # (ecs_id, content digest)
+    returned_list: bool = False
+    superseded_by: Optional[UUID] = None
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def consumed_ids(self) -> Set[UUID]:
+        return {ecs_id for ecs_id, _ in self.entity_inputs.values()} | {
+            ecs_id for ecs_id, _ in self.address_inputs.values()
+        }
+
+
+# Slot of the re-execution awaited by arecompute, filled with the record it produces
+_record_slot: contextvars.ContextVar[Optional[List[ComputationRecord]]] = contextvars.ContextVar(
+    'recompute_record_slot', default=None
+)
+
+
+@dataclass
+class RecomputeResult:
+    """Outcome of a recomputation."""
+    recomputed: List[Tuple[UUID, UUID]] = field(default_factory=list)  # (old record, new record)
+    skipped: List[UUID] = field(default_factory=list)                  # records with unchanged inputs
+    replacements: Dict[UUID, Entity] = field(default_factory=dict)     # superseded ecs_id -> current entity
+    outputs: List[Entity] = field(default_factory=list)                # outputs of re-executed records
+
+
+class RecomputeEngine:
+    """
+    Dependency tracking and incremental recomputation for registered functions.
+
+    Tracking is off by default: enable it before running the executions that
+    should be recomputable. Consumers of a version are found through the
+    ProvenanceIndex edges from that version to the outputs of each record.
+    """
+
+    tracking: bool = False
+    _records: Dict[UUID, ComputationRecord] = {}
+    _producers: Dict[UUID, List[UUID]] = {}   # output ecs_id -> record ids that returned it
+    _stats: Dict[str, int] = {"recorded": 0, "recomputed": 0, "skipped": 0}
+
+    @classmethod
+    def enable(cls) -> None:
+        if not ProvenanceIndex.enabled:
+            raise ValueError("RecomputeEngine requires ProvenanceIndex to be enabled")
+        cls.tracking = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.tracking = False
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._records.clear()
+        cls._producers.clear()
+        cls._stats = {"recorded": 0, "recomputed": 0, "skipped": 0}
+
+    @classmethod
+    def snapshot_inputs(cls, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Capture the inputs of a call before it runs (executions may version them)."""
+        return {
+            name: (value, value.ecs_id, content_digest(value)) if isinstance(value, Entity) else (value, None, None)
+            for name, value in kwargs.items()
+        }
+
+    @classmethod
+    def claim_record_slot(cls) -> Optional[List[ComputationRecord]]:
+        """Claim the record slot of an arecompute re-execution (nested executions do not see it)."""
+        slot = _record_slot.get()
+        if slot is not None:
+            _record_slot.set(None)
+        return slot
+
+    @classmethod
+    def record_execution(cls, function_name: str, snapshot: Dict[str, Any], result: Any) -> ComputationRecord:
+        """Record a completed execution from its input snapshot and its result."""
+        entity_inputs: Dict[str, Tuple[UUID, str]] = {}
+        address_inputs: Dict[str, Tuple[UUID, str]] = {}
+        plain_inputs: Dict[str, Any] = {}
+        for name, (value, ecs_id, digest) in snapshot.items():
+            target = _address_target(value)
+            if ecs_id is not None:
+                entity_inputs[name] = (ecs_id, digest)
+            elif target is not None:
+                address_inputs[name] = (target, value)
+            else:
+                plain_inputs[name] = value
+
+        outputs = result if isinstance(result, list) else [result]
+        record = ComputationRecord(
+            record_id=uuid4(),
+            function_name=function_name,
+            entity_inputs=entity_inputs,
+            address_inputs=address_inputs,
+            plain_inputs=plain_inputs,
+            outputs=[(output.ecs_id, content_digest(output)) for output in outputs if isinstance(output, Entity)],
+            returned_list=isinstance(result, list)
+        )
+        cls._records[record.record_id] = record
+        output_ids = [output_id for output_id, _ in record.outputs]
+        for output_id in output_ids:
+            cls._producers.setdefault(output_id, []).append(record.record_id)
+        ProvenanceIndex.add_execution(function_name, record.consumed_ids(), output_ids)
+        cls._stats["recorded"] += 1
+        return record
+
+    @classmethod
+    def get_record(cls, record_id: UUID) -> Optional[ComputationRecord]:
+        return cls._records.get(record_id)
+
+    @classmethod
+    def consumers_of(cls, ecs_id: UUID) -> List[ComputationRecord]:
+        """Current (not superseded) computations that read the given entity version."""
+        consumers: Dict[UUID, ComputationRecord] = {}
+        for dependent_id in ProvenanceIndex.dependents_of(ecs_id):
+            for record_id in cls._producers.get(dependent_id, ()):
+                record = cls._records[record_id]
+                if record.superseded_by is None and ecs_id in record.consumed_ids():
+                    consumers[record_id] = record
+        return list(consumers.values())
+
+    @classmethod
+    def _changed_versions(cls, entity: Entity) -> Dict[UUID, Entity]:
+        """Earlier ecs_ids of every entity in the new version's tree -> current entity."""
+        changed: Dict[UUID, Entity] = {}
+        tree = EntityRegistry.tree_registry.get(entity.root_ecs_id) if entity.root_ecs_id else None
+        nodes = list(tree.nodes.values()) if tree else [entity]
+        for node in nodes:
+            if node.ecs_id == entity.ecs_id:
+                node = entity
+            for old_id in node.old_ids:
+                changed[old_id] = node
+        return changed
+
+    @classmethod
+    def affected_computations(cls, entity: Entity) -> List[ComputationRecord]:
+        """Computations downstream of earlier versions of an entity, in topological order."""
+        changed = cls._changed_versions(entity)
+
+        # Step 1: Collect downstream records through the reverse index
+        affected: Dict[UUID, ComputationRecord] = {}
+        pending = deque(record for ecs_id in changed for record in cls.consumers_of(ecs_id))
+        while pending:
+            record = pending.popleft()
+            if record.record_id in affected:
+                continue
+            affected[record.record_id] = record
+            for output_id, _ in record.outputs:
+                pending.extend(cls.consumers_of(output_id))
+
+        # Step 2: Kahn's algorithm over producer -> consumer edges (ties in recording order)
+        producer_of = {output_id: record.record_id for record in affected.values() for output_id, _ in record.outputs}
+        upstream = {
+            record_id: {producer_of[ecs_id] for ecs_id in record.consumed_ids() if ecs_id in producer_of} - {record_id}
+            for record_id, record in affected.items()
+        }
+        ordered: List[ComputationRecord] = []
+        ready = sorted((affected[rid] for rid, deps in upstream.items() if not deps), key=lambda r: r.recorded_at)
+        while ready:
+            record = ready.pop(0)
+            ordered.append(record)
+            for record_id, deps in upstream.items():
+                if record.record_id in deps:
+                    deps.discard(record.record_id)
+                    if not deps:
+                        ready.append(affected[record_id])
+            ready.sort(key=lambda r: r.recorded_at)
+        if len(ordered) != len(affected):
+            raise ValueError("Cyclic dependency between recorded computations")
+        return ordered
+
+    @classmethod
+    def recompute(cls, entity: Entity) -> RecomputeResult:
+        """Sync wrapper of arecompute (runs on the background event loop)."""
+        from abstractions.events.background_loop import run_sync
+        return run_sync(cls.arecompute(entity))
+
+    @classmethod
+    async def arecompute(cls, entity: Entity) -> RecomputeResult:
+        """
+        Re-execute the computations affected by a newly versioned entity.
+
+        Args:
+            entity: The new version (its tree's old_ids identify the superseded versions)
+
+        Returns:
+            RecomputeResult with recomputed and skipped records and the
+            superseded ecs_id -> current entity replacements
+        """
+        from abstractions.ecs.callable_registry import CallableRegistry
+
+        result = RecomputeResult(replacements=cls._changed_versions(entity))
+        for record in cls.affected_computations(entity):
+            # Step 1: Substitute current versions; keep inputs whose content did not change
+            kwargs: Dict[str, Any] = dict(record.plain_inputs)
+            changed = False
+            equal_replacements: List[Tuple[UUID, Entity]] = []
+            for name, (ecs_id, digest) in record.entity_inputs.items():
+                replacement = result.replacements.get(ecs_id)
+                if replacement is None:
+                    kwargs[name] = cls._resolve_input(ecs_id)
+                elif content_digest(replacement) != digest:
+                    kwargs[name] = replacement
+                    changed = True
+                else:
+                    kwargs[name] = replacement
+                    equal_replacements.append((ecs_id, replacement))
+            for name, (ecs_id, address) in record.address_inputs.items():
+                replacement = result.replacements.get(ecs_id)
+                if replacement is None:
+                    kwargs[name] = address
+                else:
+                    kwargs[name] = f"@{replacement.ecs_id}{address[len(str(ecs_id)) + 1:]}"
+                    changed = True
+
+            if not changed:
+                # Same content under new versions: the record now reads those versions
+                for ecs_id, replacement in equal_replacements:
+                    cls._rebind(record.record_id, ecs_id, replacement.ecs_id)
+                result.skipped.append(record.record_id)
+                cls._stats["skipped"] += 1
+                continue
+
+            # Step 2: Re-execute (recorded as a new computation) and supersede the old record
+            slot: List[ComputationRecord] = []
+            token = _record_slot.set(slot)
+            try:
+                new_result = await CallableRegistry.aexecute(record.function_name, **kwargs)
+            finally:
+                _record_slot.reset(token)
+            new_record = slot[0]
+            record.superseded_by = new_record.record_id
+            result.recomputed.append((record.record_id, new_record.record_id))
+            cls._stats["recomputed"] += 1
+
+            # Step 3: Outputs that changed replace the old ones for downstream records
+            # (record.outputs only lists entities, so align against the entity outputs)
+            new_outputs = [
+                output for output in (new_result if isinstance(new_result, list) else [new_result])
+                if isinstance(output, Entity)
+            ]
+            result.outputs.extend(new_outputs)
+            for (old_id, old_digest), output in zip(record.outputs, new_outputs):
+                result.replacements[old_id] = output
+                if content_digest(output) == old_digest:
+                    # Identical output: consumers are not re-executed but follow the new version
+                    for consumer in cls.consumers_of(old_id):
+                        cls._rebind(consumer.record_id, old_id, output.ecs_id)
+        return result
+    
+    @classmethod
+    def _rebind(cls, record_id: UUID, old_id: UUID, new_id: UUID) -> None:
+        """Point a record's input at a content-identical newer version."""
+        record = cls._records[record_id]
+        for name, (ecs_id, digest) in list(record.entity_inputs.items()):
+            if ecs_id == old_id:
+                record.entity_inputs[name] = (new_id, digest)
+        ProvenanceIndex.add_execution(record.function_name, [new_id], [output_id for output_id, _ in record.outputs])
+
+    @classmethod
+    def _resolve_input(cls, ecs_id: UUID) -> Entity:
+        """Registered entity for an unchanged input version."""
+        root_ecs_id = EntityRegistry.ecs_id_to_root_id.get(ecs_id)
+        entity = EntityRegistry.get_stored_entity(root_ecs_id, ecs_id) if root_ecs_id else None
+        if entity is None:
+            raise ValueError(f"Input entity {ecs_id} is no longer registered")
+        return entity
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        active = sum(1 for record in cls._records.values() if record.superseded_by is None)
+        return {
+            **cls._stats,
+            "records": len(cls._records),
+            "active_records": active,
+            "indexed_outputs": len(cls._producers)
+        }
@@ -8,14 +8,20 @@ Core Design Principle:
 - Every component MUST only deal with Entity objects
 - No raw data structures allowed in entity pipelines
 - Type safety enforced at every boundary
+
+CompiledUnpacker applies the same rules with a plan compiled once per
+registered function from its return annotation, so the execution path does
+not re-inspect results whose shape the signature already fixes.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import typing
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
 from abstractions.ecs.entity import Entity, create_dynamic_entity_class
+from abstractions.ecs.return_type_analyzer import QuickPatternDetector
 
 
 @dataclass
@@ -279,4 +285,115 @@ class TypeSafeContainerReconstructor:
             primary_entities=type_safe_result.primary_entities,  # Guaranteed Entity objects
             container_entity=None,  # No separate container needed with type-safe approach
             metadata=combined_metadata
-        )
\ No newline at end of file
+        )
+
+@dataclass
+class CompiledUnpacker:
+    """
+    Unpacking plan of one registered function, compiled from its return annotation.
+    
+    Shapes:
+    - "entity_tuple": Tuple[E1, ..., En] (or Tuple[E, ...]) of entity types;
+      a matching result is unpacked into its items without a recursive walk
+    - "wrap": any other concrete annotation (entity containers, mixed tuples,
+      primitives, models); the result is wrapped unless it turns out to be a
+      tuple of entities
+    - "dynamic": Any / Union / unannotated returns, always analyzed at runtime
+    
+    Results that do not match the compiled shape fall back to
+    TypeSafeContainerReconstructor, so the outcome is always the same as the
+    dynamic path.
+    """
+    function_name: str
+    shape: str
+    arity: Optional[int]                 # Tuple length, None for Tuple[E, ...]
+    return_analysis: Dict[str, Any]
+    compiled_hits: int = 0
+    dynamic_fallbacks: int = 0
+    
+    @classmethod
+    def compile(cls, function_name: str, return_type: Any, return_analysis: Dict[str, Any]) -> "CompiledUnpacker":
+        """Derive the unpacking shape from the return annotation and its registration analysis."""
+        origin = get_origin(return_type)
+        args = get_args(return_type)
+        if return_type is None or return_type is typing.Any or origin is Union or return_analysis.get("pattern") in ("unknown", "union_return"):
+            return cls(function_name, "dynamic", None, return_analysis)
+        if origin is tuple and args:
+            if len(args) == 2 and args[1] is Ellipsis and QuickPatternDetector._is_entity_type_annotation(args[0]):
+                return cls(function_name, "entity_tuple", None, return_analysis)
+            if all(QuickPatternDetector._is_entity_type_annotation(arg) for arg in args):
+                return cls(function_name, "entity_tuple", len(args), return_analysis)
+        return cls(function_name, "wrap", None, return_analysis)
+    
+    def unpack(self, result: Any, execution_id: Optional[UUID] = None):
+        """
+        Unpack a result following the compiled shape.
+        
+        Returns:
+            UnpackingResult with the same entities and metadata keys as
+            ContainerReconstructor.unpack_with_signature_analysis
+        """
+        from abstractions.ecs.entity_unpacker import UnpackingResult
+        
+        if execution_id is None:
+            execution_id = uuid4()
+        
+        # Step 1: Confirm the result has the compiled shape (one flat check, no recursion)
+        if self.shape == "entity_tuple":
+            matches = (
+                type(result) is tuple and len(result) > 0
+                and (self.arity is None or len(result) == self.arity)
+                and all(isinstance(item, Entity) for item in result)
+            )
+            strategy = "unpack_entities"
+        elif self.shape == "wrap":
+            # Only a tuple of entities would be unpacked instead of wrapped
+            matches = not (isinstance(result, tuple) and all(isinstance(item, Entity) for item in result))
+            strategy = "wrap_complete_result"
+        else:
+            matches = False
+            strategy = ""
+        
+        if not matches:
+            self.dynamic_fallbacks += 1
+            return TypeSafeContainerReconstructor.unpack_with_signature_analysis(
+                result, self.return_analysis, None, execution_id
+            )
+        self.compiled_hits += 1
+        
+        # Step 2: Extract entities in a single pass over the known shape
+        if strategy == "unpack_entities":
+            entities = list(result)
+        else:
+            entities = [DataWrapper.wrap_complete_result(result, execution_id)]
+        
+        # Step 3: Metadata matching the dynamic path
+        metadata = {
+            **self.return_analysis,
+            "execution_id": str(execution_id),
+            "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
+            "force_unpack_effective": self.return_analysis.get("supports_unpacking", False),
+            "strategy_used": strategy,
+            "entity_count": len(entities),
+            "type_safe": True,
+            "original_type": str(type(result).__name__),
+            "unpacking_type": "type_safe_guaranteed",
+            "migration_status": "type_safe_implementation",
+            "compiled_shape": self.shape
+        }
+        if strategy == "unpack_entities":
+            metadata["unpacked_entity_types"] = [type(e).__name__ for e in entities]
+        else:
+            metadata["wrapped_in_entity"] = True
+            metadata["wrapper_entity_type"] = type(entities[0]).__name__
+        
+        return UnpackingResult(primary_entities=entities, container_entity=None, metadata=metadata)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "function_name": self.function_name,
+            "shape": self.shape,
+            "arity": self.arity,
+            "compiled_hits": self.compiled_hits,
+            "dynamic_fallbacks": self.dynamic_fallbacks
+        }
@@ -13,6 +13,7 @@ from .typed_events import (
 # Export base events
 from .events import (
     Event, EventPhase, EventPriority, EventBus, get_event_bus,
+    set_events_enabled, events_enabled, events_disabled,
     emit_events, on, CreatingEvent, CreatedEvent, ModifyingEvent, ModifiedEvent,
     ProcessingEvent, ProcessedEvent, StateTransitionEvent
 )
@@ -31,6 +32,7 @@ __all__ = [
     
     # Base events
     'Event', 'EventPhase', 'EventPriority', 'EventBus', 'get_event_bus',
+    'set_events_enabled', 'events_enabled', 'events_disabled',
     'emit_events', 'on', 'CreatingEvent', 'CreatedEvent', 'ModifyingEvent', 'ModifiedEvent',
     'ProcessingEvent', 'ProcessedEvent', 'StateTransitionEvent',
     
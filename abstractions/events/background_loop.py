@@ -0,0 +1,150 @@
+"""
+Background Event Loop for Synchronous Callers
+
+This module provides a managed asyncio event loop running in a dedicated daemon
+thread. Sync entry points (CallableRegistry.execute, execute_batch_sync,
+EventBus.emit_sync outside async code) submit coroutines to it instead of
+creating and tearing down a loop and default executor on every call.
+
+Features:
+- Lazily started, process-wide loop shared by all sync callers
+- Context variables of the caller propagated into the submitted coroutine
+- Safe fallback when called from the loop thread itself (no deadlock)
+- Graceful shutdown: pending tasks cancelled, default executor shut down,
+  registered as an atexit hook and restartable after shutdown
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+
+R = TypeVar('R')
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop owned by a dedicated thread."""
+
+    def __init__(self, name: str = "abstractions-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller is running on the loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, starting the thread on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+        self._loop = loop
+        self._thread.start()
+        started.wait()
+
+    def submit(self, coro: Coroutine[Any, Any, R]) -> "concurrent.futures.Future[R]":
+        """Schedule a coroutine on the loop; the caller's context variables are preserved."""
+        loop = self.get_loop()
+        future: "concurrent.futures.Future[R]" = concurrent.futures.Future()
+        context = contextvars.copy_context()
+
+        def on_done(task: asyncio.Task) -> None:
+            if future.done():
+                return
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        def start() -> None:
+            if not future.set_running_or_notify_cancel():
+                coro.close()
+                return
+            task = loop.create_task(coro, context=context)
+            task.add_done_callback(on_done)
+
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def run(self, coro: Coroutine[Any, Any, R], timeout: Optional[float] = None) -> R:
+        """
+        Run a coroutine on the loop and block until it completes.
+
+        When called from the loop thread (e.g. an inline function calling a sync
+        API), the coroutine runs on a private loop in a helper thread instead.
+        """
+        if self.in_loop_thread():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as helper:
+                return helper.submit(asyncio.run, coro).result(timeout)
+        return self.submit(coro).result(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks, shut down the default executor and stop the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def drain() -> None:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+            await loop.shutdown_default_executor()
+
+        if thread is not None and thread.is_alive() and threading.current_thread() is not thread:
+            try:
+                asyncio.run_coroutine_threadsafe(drain(), loop).result(timeout)
+            except Exception:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+_background_loop = BackgroundEventLoop()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Process-wide background loop used by sync entry points."""
+    return _background_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, R], timeout: Optional[float] = None) -> R:
+    """Run a coroutine to completion from sync code on the background loop."""
+    return _background_loop.run(coro, timeout)
+
+
+def shutdown_background_loop(timeout: float = 5.0) -> None:
+    """Stop the background loop (it restarts on the next run_sync)."""
+    _background_loop.shutdown(timeout)
+
+
+atexit.register(shutdown_background_loop)
@@ -24,7 +24,7 @@ import re
 import time
 import json
 import weakref
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import logging
 
 # Import context management functions
@@ -36,6 +36,8 @@ from abstractions.events.context import (
     validate_context_balance
 )
 
+from abstractions.events.background_loop import run_sync
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,9 @@ S = TypeVar('S', bound=BaseModel)
 # Global event bus instance - initialized at module level
 _event_bus: Optional['EventBus'] = None
 
+# Global instrumentation switch - when False, emit_events wrappers call straight through
+_events_enabled: bool = True
+
 
 def get_event_bus() -> 'EventBus':
     """Get or create the global event bus instance."""
@@ -65,6 +70,28 @@ def get_event_bus() -> 'EventBus':
     return _event_bus
 
 
+def set_events_enabled(enabled: bool) -> None:
+    """Globally enable or disable emit_events instrumentation."""
+    global _events_enabled
+    _events_enabled = enabled
+
+
+def events_enabled() -> bool:
+    """Whether emit_events instrumentation is globally enabled."""
+    return _events_enabled
+
+
+@contextmanager
+def events_disabled():
+    """Context manager that turns emit_events instrumentation off for its duration."""
+    previous = _events_enabled
+    set_events_enabled(False)
+    try:
+        yield
+    finally:
+        set_events_enabled(previous)
+
+
 # ============================================================================
 # ENUMS AND CONSTANTS
 # ============================================================================
@@ -418,6 +445,11 @@ class EventBus:
         self._pattern_subscriptions: List[Subscription] = []
         self._predicate_subscriptions: List[Subscription] = []
         
+        # Subscription version and per-event-class match cache (invalidated on change)
+        self._subscription_version: int = 0
+        self._match_cache: Dict[Type[Event], bool] = {}
+        self._match_cache_version: int = 0
+        
         # Event history (ring buffer)
         self._history: deque[Event] = deque(maxlen=history_size)
         
@@ -527,10 +559,12 @@ class EventBus:
         else:
             raise ValueError("Must specify event_types, pattern, or predicate")
         
+        self._subscription_version += 1
         return sub
     
     def unsubscribe(self, subscription: Subscription) -> None:
         """Remove a subscription."""
+        self._subscription_version += 1
         # Remove from type subscriptions
         for event_type in subscription.event_types:
             if event_type in self._type_subscriptions:
@@ -554,6 +588,26 @@ class EventBus:
         except ValueError:
             pass  # Subscription not in list
     
+    def could_match(self, event_type: Type[Event]) -> bool:
+        """
+        Cheap check whether any subscription could receive events of this class.
+        
+        Type subscriptions are matched against the class MRO; any pattern or
+        predicate subscription counts as a potential match. Results are cached
+        per class until the subscriptions change.
+        """
+        if self._match_cache_version != self._subscription_version:
+            self._match_cache.clear()
+            self._match_cache_version = self._subscription_version
+        
+        cached = self._match_cache.get(event_type)
+        if cached is None:
+            cached = bool(self._pattern_subscriptions or self._predicate_subscriptions) or any(
+                self._type_subscriptions.get(base_type) for base_type in event_type.__mro__
+            )
+            self._match_cache[event_type] = cached
+        return cached
+    
     async def emit(self, event: Event) -> Event:
         """
         Emit an event to all matching subscribers.
@@ -573,7 +627,7 @@ class EventBus:
         Emit an event synchronously from sync context.
         
         This handles both sync and async contexts appropriately:
-        - In pure sync context: Creates new event loop and processes immediately
+        - In pure sync context: Processes immediately on the background event loop
         - In async context: Schedules as background task
         """
         # Create a temporary async context to run the internal emission
@@ -583,11 +637,12 @@ class EventBus:
         try:
             # Check if we're already in an async context
             loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running - process immediately on the shared background loop
+            run_sync(_emit_and_process())
+        else:
             # We're in an async context - schedule as background task
             loop.create_task(_emit_and_process())
-        except RuntimeError:
-            # No event loop running - create one and process immediately
-            asyncio.run(_emit_and_process())
         
         return event
     
@@ -1056,16 +1111,73 @@ def emit_events(
         - Automatic nesting is enabled by default and safe
         - Events without parents work exactly as before
         - Minimal performance overhead: O(1) context operations
+        
+    Zero-Subscriber Fast Path:
+        The event class returned by each factory is learned on its first call.
+        Once the creating/created classes are known and no subscription on the
+        bus could match them (EventBus.could_match), the wrapper calls the
+        method directly without running the factories. The same happens when
+        instrumentation is globally off (set_events_enabled / events_disabled).
+        Failure events are still built on the error path when someone listens.
     """
     def decorator(func: Callable) -> Callable:
         # Detect if function is async or sync
         is_async = inspect.iscoroutinefunction(func)
         
+        # Event class produced by each factory, learned on first use
+        event_classes: Dict[str, Type[Event]] = {}
+        expected_roles = tuple(
+            role for role, factory in (("creating", creating_factory), ("created", created_factory))
+            if factory is not None
+        )
+        
+        def instrumentation_needed(bus: EventBus) -> bool:
+            if not _events_enabled:
+                return False
+            for role in expected_roles:
+                event_class = event_classes.get(role)
+                if event_class is None or bus.could_match(event_class):
+                    return True
+            return False
+        
+        def skipped_failure_event(bus: EventBus, error: Exception, args, kwargs, start_time: float) -> Optional[Event]:
+            """Failure event for a call that bypassed instrumentation, if anyone listens."""
+            if not _events_enabled or failed_factory is None:
+                return None
+            known_class = event_classes.get("failed")
+            if known_class is not None and not bus.could_match(known_class):
+                return None
+            error_event = failed_factory(error, *args, **kwargs)
+            event_classes["failed"] = type(error_event)
+            if not bus.could_match(type(error_event)):
+                return None
+            
+            parent_event = get_current_parent_event()
+            parent_id = getattr(parent_event, 'id', None) if parent_event else None
+            if parent_id:
+                error_event.parent_id = parent_id
+                error_event.root_id = getattr(parent_event, 'root_id', None) or parent_id
+            else:
+                error_event.root_id = error_event.id
+            if include_timing:
+                error_event.duration_ms = (time.perf_counter() - start_time) * 1000
+            return error_event
+        
         if is_async:
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
                 bus = get_event_bus()
-                start_time = time.time()
+                start_time = time.perf_counter()
+                
+                # Fast path: nobody listens, skip event construction entirely
+                if not instrumentation_needed(bus):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        error_event = skipped_failure_event(bus, e, args, kwargs, start_time)
+                        if error_event is not None:
+                            await bus.emit(error_event)
+                        raise
                 
                 # Get current parent from context stack
                 parent_event = get_current_parent_event()
@@ -1074,6 +1186,7 @@ def emit_events(
                 start_event = None
                 if creating_factory:
                     start_event = creating_factory(*args, **kwargs)
+                    event_classes["creating"] = type(start_event)
                     
                     # Apply automatic parent linking
                     if parent_event:
@@ -1112,6 +1225,7 @@ def emit_events(
                     # Create completion event
                     if created_factory:
                         end_event = created_factory(result, *args, **kwargs)
+                        event_classes["created"] = type(end_event)
                         end_event.lineage_id = lineage_id
                         
                         # Apply automatic parent linking to completion event
@@ -1129,7 +1243,7 @@ def emit_events(
                         
                         # Add timing information
                         if include_timing:
-                            end_event.duration_ms = (time.time() - start_time) * 1000
+                            end_event.duration_ms = (time.perf_counter() - start_time) * 1000
                         
                         await bus.emit(end_event)
                     
@@ -1139,6 +1253,7 @@ def emit_events(
                     # Create failure event
                     if failed_factory:
                         error_event = failed_factory(e, *args, **kwargs)
+                        event_classes["failed"] = type(error_event)
                         error_event.lineage_id = lineage_id
                         
                         # Apply automatic parent linking to error event
@@ -1156,7 +1271,7 @@ def emit_events(
                         
                         # Add timing information
                         if include_timing:
-                            error_event.duration_ms = (time.time() - start_time) * 1000
+                            error_event.duration_ms = (time.perf_counter() - start_time) * 1000
                         
                         await bus.emit(error_event)
                     raise
@@ -1172,7 +1287,17 @@ def emit_events(
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
                 bus = get_event_bus()
-                start_time = time.time()
+                start_time = time.perf_counter()
+                
+                # Fast path: nobody listens, skip event construction entirely
+                if not instrumentation_needed(bus):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        error_event = skipped_failure_event(bus, e, args, kwargs, start_time)
+                        if error_event is not None:
+                            bus.emit_sync(error_event)
+                        raise
                 
                 # Get current parent from context stack
                 parent_event = get_current_parent_event()
@@ -1181,6 +1306,7 @@ def emit_events(
                 start_event = None
                 if creating_factory:
                     start_event = creating_factory(*args, **kwargs)
+                    event_classes["creating"] = type(start_event)
                     
                     # Apply automatic parent linking
                     if parent_event:
@@ -1220,6 +1346,7 @@ def emit_events(
                     # Create completion event
                     if created_factory:
                         end_event = created_factory(result, *args, **kwargs)
+                        event_classes["created"] = type(end_event)
                         end_event.lineage_id = lineage_id
                         
                         # Apply automatic parent linking to completion event
@@ -1237,7 +1364,7 @@ def emit_events(
                         
                         # Add timing information
                         if include_timing:
-                            end_event.duration_ms = (time.time() - start_time) * 1000
+                            end_event.duration_ms = (time.perf_counter() - start_time) * 1000
                         
                         # Emit completion event
                         bus.emit_sync(end_event)
@@ -1248,6 +1375,7 @@ def emit_events(
                     # Create failure event
                     if failed_factory:
                         error_event = failed_factory(e, *args, **kwargs)
+                        event_classes["failed"] = type(error_event)
                         error_event.lineage_id = lineage_id
                         
                         # Apply automatic parent linking to error event
@@ -1265,7 +1393,7 @@ def emit_events(
                         
                         # Add timing information
                         if include_timing:
-                            error_event.duration_ms = (time.time() - start_time) * 1000
+                            error_event.duration_ms = (time.perf_counter() - start_time) * 1000
                         
                         # Emit error event
                         bus.emit_sync(error_event)
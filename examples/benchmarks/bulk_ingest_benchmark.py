@@ -0,0 +1,84 @@
+"""
+Benchmark: Bulk Ingest vs Per-Row Construction
+
+Creates and registers the same flat entities two ways:
+
+1. Per row: Student(**row) followed by promote_to_root() for every row
+2. Bulk: BulkEntityFactory.from_columns (one validation pass per column and
+   batched registration through EntityRegistry.register_entities_batch)
+
+Both paths are checked to produce equal field data and attribute_source, and
+to leave every entity registered as a root.
+
+Usage:
+    python examples/benchmarks/bulk_ingest_benchmark.py [rows]
+"""
+
+import sys
+import time
+from typing import Dict, List
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.bulk_ingest import BulkEntityFactory
+
+
+class IngestStudent(Entity):
+    name: str = ""
+    gpa: float = 0.0
+    credits: int = 0
+    tags: List[str] = []
+
+
+def make_columns(row_count: int) -> Dict[str, list]:
+    return {
+        "name": [f"student-{i}" for i in range(row_count)],
+        "gpa": [2.0 + (i % 20) / 10 for i in range(row_count)],
+        "credits": [i % 180 for i in range(row_count)],
+        "tags": [["cs", "y1"] if i % 2 else ["math"] for i in range(row_count)],
+    }
+
+
+def per_row(columns: Dict[str, list], row_count: int) -> List[IngestStudent]:
+    entities = []
+    for row in range(row_count):
+        entity = IngestStudent(**{name: values[row] for name, values in columns.items()})
+        entity.promote_to_root()
+        entities.append(entity)
+    return entities
+
+
+def bulk(columns: Dict[str, list], row_count: int) -> List[IngestStudent]:
+    return BulkEntityFactory.from_columns(IngestStudent, columns)
+
+
+def check_equivalent(expected: List[IngestStudent], actual: List[IngestStudent]) -> None:
+    data_fields = ["name", "gpa", "credits", "tags", "attribute_source"]
+    for left, right in zip(expected, actual):
+        assert left.model_dump(include=set(data_fields)) == right.model_dump(include=set(data_fields))
+        assert right.is_root_entity() and right.root_ecs_id in EntityRegistry.tree_registry
+
+
+def timed(function, *args) -> tuple:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print("=== Bulk Ingest Benchmark ===")
+    columns = make_columns(row_count)
+
+    per_row_seconds, expected = timed(per_row, columns, row_count)
+    bulk_seconds, actual = timed(bulk, columns, row_count)
+    check_equivalent(expected, actual)
+    print(f"✅ {row_count} rows: bulk ingest matches per-row construction")
+
+    print(f"\n  {'path':<28}{'total ms':>12}{'µs / row':>12}")
+    print(f"  {'constructor + promote':<28}{per_row_seconds * 1000:>12.1f}{per_row_seconds / row_count * 1e6:>12.1f}")
+    print(f"  {'BulkEntityFactory':<28}{bulk_seconds * 1000:>12.1f}{bulk_seconds / row_count * 1e6:>12.1f}")
+    print(f"  speedup: {per_row_seconds / bulk_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: Execution Log vs Registered FunctionExecution Entities
+
+Runs the same multi-output registered function with execution records kept as
+FunctionExecution entity trees (the default) and as rows of the columnar
+ExecutionLog, then prints per-call latency, registry growth and the cost of
+materializing one record from the log.
+
+Usage:
+    python examples/benchmarks/execution_log_benchmark.py [calls]
+"""
+
+import asyncio
+import sys
+import time
+from typing import Tuple
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.callable_registry import CallableRegistry
+
+
+class Reading(Entity):
+    sensor: str = ""
+    value: float = 0.0
+
+
+@CallableRegistry.register("log_bench_split", execution_target="inline")
+def log_bench_split(reading: Reading) -> Tuple[Reading, Reading]:
+    return Reading(sensor=reading.sensor, value=reading.value * 0.5), Reading(sensor=reading.sensor, value=reading.value * 2)
+
+
+async def run_calls(reading: Reading, calls: int) -> Tuple[float, int]:
+    trees_before = len(EntityRegistry.tree_registry)
+    start = time.perf_counter()
+    for _ in range(calls):
+        await CallableRegistry.aexecute("log_bench_split", reading=reading)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, len(EntityRegistry.tree_registry) - trees_before
+
+
+async def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    reading = Reading(sensor="s-1", value=4.0)
+    reading.promote_to_root()
+    await run_calls(reading, 10)  # Warm up signature and class caches
+
+    entity_ms, entity_trees = await run_calls(reading, calls)
+
+    log = CallableRegistry.enable_execution_log()
+    log_ms, log_trees = await run_calls(reading, calls)
+    CallableRegistry.disable_execution_log()
+
+    last_id = list(log.iter_rows())[-1]["ecs_id"]
+    start = time.perf_counter()
+    record = log.materialize(last_id)
+    materialize_ms = (time.perf_counter() - start) * 1000
+    assert record is not None and record.function_name == "log_bench_split"
+
+    print("=== Execution Log Benchmark ===")
+    print(f"{calls} calls of a two-output function")
+    print(f"  FunctionExecution entities: {entity_ms / calls:7.3f} ms/call, {entity_trees} new trees")
+    print(f"  execution log:              {log_ms / calls:7.3f} ms/call, {log_trees} new trees")
+    print(f"  log stats: {log.get_stats()}")
+    print(f"  materialize one record:     {materialize_ms:7.3f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Benchmark: Parallel Forest Versioning
+
+Versions a forest of independent roots (each with a list of child entities)
+serially and with ForestVersioner at increasing worker counts, after modifying a
+fraction of the roots. Prints throughput and speedup relative to the serial
+EntityRegistry.version_entity loop.
+
+Usage:
+    python examples/benchmarks/forest_versioning_benchmark.py [roots] [children]
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.forest import ForestVersioner
+
+
+class Reading(Entity):
+    sensor: str = ""
+    value: float = 0.0
+
+
+class Station(Entity):
+    name: str = ""
+    readings: List[Reading] = []
+
+
+def build_forest(root_count: int, child_count: int) -> List[Station]:
+    """Create, register and return isolated working copies of a forest."""
+    working_copies = []
+    for i in range(root_count):
+        station = Station(
+            name=f"station-{i}",
+            readings=[Reading(sensor=f"s{j}", value=float(j)) for j in range(child_count)]
+        )
+        station.promote_to_root()
+        working_copies.append(EntityRegistry.get_stored_entity(station.root_ecs_id, station.ecs_id))
+    return working_copies
+
+
+def modify_fraction(roots: List[Station], fraction: float) -> None:
+    step = max(1, int(1 / fraction))
+    for station in roots[::step]:
+        station.readings[0].value += 1.0
+
+
+def run_serial(roots: List[Station]) -> float:
+    start = time.perf_counter()
+    for station in roots:
+        EntityRegistry.version_entity(station)
+    return time.perf_counter() - start
+
+
+def run_parallel(roots: List[Station], workers: int) -> float:
+    with ForestVersioner(max_workers=workers, parallel_threshold=0) as versioner:
+        start = time.perf_counter()
+        result = versioner.version(roots)
+        elapsed = time.perf_counter() - start
+    assert not result.failed_roots, result.failed_roots
+    return elapsed
+
+
+def main():
+    root_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    child_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))) or [1]
+
+    print("=== Forest Versioning Benchmark ===")
+    print(f"roots={root_count} children/root={child_count} cores={cores}\n")
+
+    roots = build_forest(root_count, child_count)
+    modify_fraction(roots, 0.1)
+    serial = run_serial(roots)
+    print(f"serial version_entity loop: {serial:.3f}s ({root_count / serial:,.0f} roots/s)")
+
+    for workers in worker_counts:
+        roots = build_forest(root_count, child_count)
+        modify_fraction(roots, 0.1)
+        elapsed = run_parallel(roots, workers)
+        print(f"ForestVersioner workers={workers}: {elapsed:.3f}s "
+              f"({root_count / elapsed:,.0f} roots/s, speedup x{serial / elapsed:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: Streaming Async-Generator Functions vs List Returns
+
+Runs the same large fan-out as a function returning List[Entity] and as an
+async generator consumed with aexecute_stream, then prints the time until the
+caller holds the first output and the time until it holds all of them.
+
+Usage:
+    python examples/benchmarks/stream_benchmark.py [outputs]
+"""
+
+import asyncio
+import sys
+import time
+from typing import AsyncIterator, List, Tuple
+
+from abstractions.ecs.entity import Entity
+from abstractions.ecs.callable_registry import CallableRegistry
+
+
+class Order(Entity):
+    customer: str = ""
+    lines: int = 0
+
+
+class OrderLine(Entity):
+    customer: str = ""
+    line: int = 0
+
+
+@CallableRegistry.register("split_order_list", execution_target="inline")
+def split_order_list(order: Order) -> List[OrderLine]:
+    return [OrderLine(customer=order.customer, line=line) for line in range(order.lines)]
+
+
+@CallableRegistry.register("split_order_stream")
+async def split_order_stream(order: Order) -> AsyncIterator[OrderLine]:
+    for line in range(order.lines):
+        yield OrderLine(customer=order.customer, line=line)
+
+
+async def run_list(order: Order) -> Tuple[float, float]:
+    start = time.perf_counter()
+    result = await CallableRegistry.aexecute("split_order_list", order=order)
+    total_ms = (time.perf_counter() - start) * 1000
+    outputs = result if isinstance(result, list) else result.wrapped_value  # List returns may come back wrapped
+    assert len(outputs) == order.lines
+    return total_ms, total_ms  # Nothing is available before the whole list
+
+
+async def run_stream(order: Order) -> Tuple[float, float]:
+    start = time.perf_counter()
+    first_ms, count = 0.0, 0
+    async for _ in CallableRegistry.aexecute_stream("split_order_stream", order=order):
+        if count == 0:
+            first_ms = (time.perf_counter() - start) * 1000
+        count += 1
+    assert count == order.lines
+    return first_ms, (time.perf_counter() - start) * 1000
+
+
+async def main():
+    outputs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    order = Order(customer="acme", lines=outputs)
+    order.promote_to_root()
+    await run_list(Order(customer="warmup", lines=10))
+    await run_stream(Order(customer="warmup", lines=10))
+
+    list_first, list_total = await run_list(order)
+    stream_first, stream_total = await run_stream(order)
+
+    print("=== Streaming Benchmark ===")
+    print(f"{outputs} outputs per call")
+    print(f"  List[OrderLine] return:  first result {list_first:9.2f} ms, all results {list_total:9.2f} ms")
+    print(f"  AsyncIterator stream:    first result {stream_first:9.2f} ms, all results {stream_total:9.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -189,7 +189,8 @@ def test_sibling_relationship_tracking():
     from uuid import uuid4
     execution_id = uuid4()
     
-    # Set sibling metadata on entities (Phase 4 approach)
+    # Set sibling metadata on entities (Phase 4 approach); assigning
+    # sibling_output_entities records the execution's shared sibling group
     for i, entity in enumerate(entities):
         entity.derived_from_execution_id = execution_id
         entity.output_index = i
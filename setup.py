@@ -12,6 +12,9 @@ setup(
         "setuptools",
         # Add other dependencies here
     ],
+    extras_require={
+        "arrays": ["numpy"],
+    },
     include_package_data=True,
     entry_points={
         'console_scripts': [
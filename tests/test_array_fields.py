@@ -0,0 +1,72 @@
+"""Array field freezing: stored versions never share a buffer the caller can write."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abstractions.ecs.array_fields import NDArray, SharedArray, ensure_writable, freeze_array, freeze_array_fields
+from abstractions.ecs.entity import Entity, EntityRegistry
+
+
+class Embedding(Entity):
+    label: str = ""
+    vector: NDArray
+
+
+def test_caller_array_is_copied_and_stays_writable():
+    source = np.arange(4, dtype=float)
+    embedding = Embedding(vector=source)
+    source[0] = 99.0
+    assert embedding.vector[0] == 0.0
+    assert source.flags.writeable
+    assert not embedding.vector.flags.writeable
+
+
+def test_read_only_view_of_writable_base_is_copied():
+    base = np.arange(4, dtype=float)
+    view = base[:]
+    view.flags.writeable = False
+    frozen = freeze_array(view)
+    base[1] = 42.0
+    assert frozen[1] == 1.0
+
+
+def test_fully_frozen_array_is_shared():
+    frozen = freeze_array([1.0, 2.0, 3.0])
+    assert isinstance(frozen, SharedArray)
+    assert freeze_array(frozen) is frozen
+    base = np.arange(3, dtype=float)
+    base.flags.writeable = False
+    assert np.shares_memory(freeze_array(base), base)
+
+
+def test_stored_versions_share_one_buffer():
+    embedding = Embedding(vector=[1.0, 2.0])
+    embedding.promote_to_root()
+    stored = EntityRegistry.get_stored_entity(embedding.root_ecs_id, embedding.ecs_id)
+    assert stored.vector is embedding.vector
+
+
+def test_freeze_array_fields_does_not_freeze_caller_array():
+    embedding = Embedding(vector=[1.0, 2.0])
+    unvalidated = np.array([3.0, 4.0])
+    object.__setattr__(embedding, "vector", unvalidated)
+    freeze_array_fields(embedding)
+    assert unvalidated.flags.writeable
+    unvalidated[0] = 0.0
+    assert embedding.vector[0] == 3.0
+    assert not embedding.vector.flags.writeable
+
+
+def test_ensure_writable_array_stays_writable_after_registration():
+    original = Embedding(vector=[1.0, 2.0])
+    original.promote_to_root()
+    embedding = EntityRegistry.get_stored_entity(original.root_ecs_id, original.ecs_id)
+    vector = ensure_writable(embedding, "vector")
+    vector *= 2.0
+    EntityRegistry.version_entity(embedding)
+    assert embedding.ecs_id != original.ecs_id
+    vector[0] = -1.0  # Still the caller's buffer, no longer the stored one
+    stored = EntityRegistry.get_stored_entity(embedding.root_ecs_id, embedding.ecs_id)
+    assert list(stored.vector) == [2.0, 4.0]
+    assert list(original.vector) == [1.0, 2.0]
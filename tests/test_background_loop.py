@@ -0,0 +1,64 @@
+"""The background loop runs sync callers' coroutines without deadlocks, keeps their context and restarts after shutdown."""
+
+import asyncio
+import contextvars
+import threading
+
+from abstractions.events.background_loop import (
+    BackgroundEventLoop, get_background_loop, run_sync, shutdown_background_loop
+)
+
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+async def current_thread_name() -> str:
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+def test_run_from_loop_thread_falls_back_to_helper_thread():
+    loop = BackgroundEventLoop(name="test-fallback-loop")
+    try:
+        async def outer():
+            # A sync API called from code already running on the loop thread
+            return threading.current_thread().name, loop.run(current_thread_name(), timeout=5)
+
+        outer_thread, inner_thread = loop.run(outer(), timeout=5)
+
+        assert outer_thread == "test-fallback-loop"
+        assert inner_thread != "test-fallback-loop"
+    finally:
+        loop.shutdown()
+
+
+def test_submit_propagates_context_variables():
+    loop = BackgroundEventLoop(name="test-context-loop")
+    try:
+        async def read_and_overwrite():
+            seen = request_id.get()
+            request_id.set("changed-on-loop")
+            return seen
+
+        token = request_id.set("caller-value")
+        try:
+            assert loop.submit(read_and_overwrite()).result(5) == "caller-value"
+            assert request_id.get() == "caller-value"  # The coroutine ran in a copy
+        finally:
+            request_id.reset(token)
+        assert loop.submit(read_and_overwrite()).result(5) is None
+    finally:
+        loop.shutdown()
+
+
+def test_loop_restarts_after_shutdown():
+    assert run_sync(current_thread_name()) == get_background_loop().name
+    first_loop = get_background_loop().get_loop()
+
+    shutdown_background_loop()
+
+    assert not get_background_loop().is_running
+    assert first_loop.is_closed()
+    assert run_sync(current_thread_name()) == get_background_loop().name
+    assert get_background_loop().get_loop() is not first_loop
+    assert get_background_loop().is_running
@@ -0,0 +1,129 @@
+"""Binary codec round trips preserve ids, structure and field values."""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abstractions.ecs.array_fields import NDArray
+from abstractions.ecs.binary_codec import EntityTreeCodec
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity, EntityRegistry, build_entity_tree
+
+
+class CodecGrade(Entity):
+    course: str = ""
+    score: float = 0.0
+
+
+class CodecStudent(Entity):
+    name: str = ""
+    age: int = 0
+    nickname: Optional[str] = None
+    enrolled: Optional[datetime] = None
+    scores: List[int] = []
+    meta: Dict[str, int] = {}
+    grades: List[CodecGrade] = []
+
+
+class CodecSignal(Entity):
+    samples: NDArray
+
+
+@CallableRegistry.register("codec_split_student")
+def codec_split_student(student: CodecStudent) -> Tuple[CodecGrade, CodecGrade]:
+    return CodecGrade(course=f"{student.name}-a"), CodecGrade(course=f"{student.name}-b")
+
+
+def make_student(name: str = "ada") -> CodecStudent:
+    return CodecStudent(
+        name=name,
+        age=21,
+        enrolled=datetime(2024, 9, 1, 8, 30, tzinfo=timezone.utc),
+        scores=[3, -7, 12],
+        meta={"credits": 30, "year": 2},
+        grades=[CodecGrade(course="math", score=3.5), CodecGrade(course="art", score=2.0)],
+    )
+
+
+def test_entity_round_trip_preserves_values():
+    student = make_student()
+    restored = EntityTreeCodec.decode_entity(EntityTreeCodec.encode_entity(student))
+
+    assert restored.ecs_id == student.ecs_id
+    assert restored.model_dump() == student.model_dump()
+    assert restored.nickname is None
+    assert restored.enrolled == student.enrolled
+    assert [grade.course for grade in restored.grades] == ["math", "art"]
+
+
+def test_tree_round_trip_preserves_structure():
+    student = make_student()
+    student.promote_to_root()
+    tree = EntityRegistry.get_stored_tree(student.root_ecs_id)
+
+    decoded = EntityTreeCodec.decode_tree(EntityTreeCodec.encode_tree(tree))
+
+    assert set(decoded.nodes) == set(tree.nodes)
+    assert set(decoded.edges) == set(tree.edges)
+    assert decoded.lineage_id == tree.lineage_id
+    assert EntityTreeCodec.verify_round_trip(tree)
+
+
+def test_versioned_tree_round_trip():
+    student = make_student("versioned")
+    student.promote_to_root()
+    stored = EntityRegistry.get_stored_entity(student.root_ecs_id, student.ecs_id)
+    stored.grades[1].score = 4.0
+    stored.age = 22
+    EntityRegistry.version_entity(stored)
+
+    tree = build_entity_tree(stored)
+    assert EntityTreeCodec.verify_round_trip(tree)
+
+    decoded = EntityTreeCodec.decode_tree(EntityTreeCodec.encode_tree(tree))
+    for node_id, entity in tree.nodes.items():
+        # Per-row key order survives, not just the key set
+        assert list(decoded.nodes[node_id].attribute_source) == list(entity.attribute_source)
+
+
+def test_struct_column_with_mixed_key_order():
+    # Same key set, different order per row: encoded as one struct column
+    holder = CodecStudent(
+        name="holder",
+        grades=[CodecGrade(course="a"), CodecGrade(course="b"), CodecGrade(course="c")],
+    )
+    holder.grades[1].attribute_source = dict(reversed(list(holder.grades[1].attribute_source.items())))
+    holder.promote_to_root()
+    tree = EntityRegistry.get_stored_tree(holder.root_ecs_id)
+
+    decoded = EntityTreeCodec.decode_tree(EntityTreeCodec.encode_tree(tree))
+
+    for grade in holder.grades:
+        restored = decoded.nodes[grade.ecs_id]
+        assert list(restored.attribute_source) == list(grade.attribute_source)
+    assert EntityTreeCodec.verify_round_trip(tree)
+
+
+def test_array_field_round_trip():
+    signal = CodecSignal(samples=np.arange(6, dtype=np.float32).reshape(2, 3))
+    restored = EntityTreeCodec.decode_entity(EntityTreeCodec.encode_entity(signal))
+
+    assert restored.samples.dtype == np.float32
+    assert restored.samples.shape == (2, 3)
+    assert np.array_equal(restored.samples, signal.samples)
+
+
+def test_decoded_execution_record_restores_sibling_group():
+    first, second = CallableRegistry.execute("codec_split_student", student=make_student("split"))
+    execution_id = first.derived_from_execution_id
+    record_tree = EntityRegistry.tree_registry[EntityRegistry.ecs_id_to_root_id[execution_id]]
+    payload = EntityTreeCodec.encode_tree(record_tree)
+
+    EntityRegistry.unregister_tree(record_tree.root_ecs_id)
+    assert first.sibling_output_entities == []
+
+    EntityRegistry.register_entity_tree(EntityTreeCodec.decode_tree(payload))
+    assert first.sibling_output_entities == [second.ecs_id]
@@ -0,0 +1,82 @@
+"""Bulk ingest applies the same validation as constructing each entity."""
+
+import io
+from typing import List, Optional
+
+import pytest
+from pydantic import Field, ValidationError, field_validator, model_validator
+
+from abstractions.ecs.bulk_ingest import BulkEntityFactory
+from abstractions.ecs.entity import Entity, EntityRegistry
+
+
+class IngestStudent(Entity):
+    name: str = ""
+    gpa: float = Field(default=0.0, ge=0.0, le=4.0)
+    code: str = Field(default="aa", pattern=r"^[a-z]+$")
+    tags: List[str] = Field(default_factory=list)
+
+
+class ValidatedStudent(Entity):
+    name: str = ""
+    gpa: float = 0.0
+
+    @field_validator("name")
+    @classmethod
+    def name_is_capitalized(cls, value: str) -> str:
+        if value and not value[0].isupper():
+            raise ValueError("name must be capitalized")
+        return value
+
+
+class RangeEntity(Entity):
+    low: int = 0
+    high: int = 0
+    label: Optional[str] = None
+
+    @model_validator(mode="after")
+    def ordered(self):
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+
+def test_columns_match_constructor_values():
+    students = BulkEntityFactory.from_columns(IngestStudent, {"name": ["a", "b"], "gpa": [3.5, 2.0]})
+    assert [s.gpa for s in students] == [3.5, 2.0]
+    assert students[0].tags == [] and students[0].tags is not students[1].tags
+    assert students[0].attribute_source["name"] is None
+    assert students[0].ecs_id in EntityRegistry.ecs_id_to_root_id
+
+
+def test_field_constraints_are_enforced():
+    with pytest.raises(ValidationError):
+        IngestStudent(name="a", gpa=9)
+    with pytest.raises(ValueError, match="row 1"):
+        BulkEntityFactory.from_columns(IngestStudent, {"name": ["a", "b"], "gpa": [1.0, 9.0]})
+    with pytest.raises(ValueError, match="code"):
+        BulkEntityFactory.from_columns(IngestStudent, {"code": ["ok", "NOT OK"]})
+
+
+def test_field_validators_run():
+    assert BulkEntityFactory.has_custom_validators(ValidatedStudent)
+    assert not BulkEntityFactory.has_custom_validators(IngestStudent)
+    students = BulkEntityFactory.from_columns(ValidatedStudent, {"name": ["Ann"], "gpa": [3.0]})
+    assert students[0].name == "Ann"
+    with pytest.raises(ValueError, match="Row 1 .*capitalized"):
+        BulkEntityFactory.from_columns(ValidatedStudent, {"name": ["Ann", "bob"], "gpa": [3.0, 2.0]})
+
+
+def test_model_validators_run():
+    with pytest.raises(ValueError, match="low must not exceed high"):
+        BulkEntityFactory.from_records(RangeEntity, [{"low": 1, "high": 2}, {"low": 5, "high": 2}])
+
+
+def test_csv_and_jsonl_sources():
+    csv_source = io.StringIO('name,gpa,tags\nann,3.0,"[""x""]"\nbob,2.5,[]\n')
+    students = BulkEntityFactory.from_csv(IngestStudent, csv_source, register=False)
+    assert [(s.name, s.gpa, s.tags) for s in students] == [("ann", 3.0, ["x"]), ("bob", 2.5, [])]
+
+    jsonl_source = io.StringIO('{"low": 1, "high": 3, "label": null}\n\n{"low": 2, "high": 2, "label": "x"}\n')
+    ranges = BulkEntityFactory.from_jsonl(RangeEntity, jsonl_source, register=False)
+    assert [(r.low, r.high, r.label) for r in ranges] == [(1, 3, None), (2, 2, "x")]
@@ -0,0 +1,118 @@
+"""max_concurrency bounds: FIFO admission in ExecutionLimiter and the bounded workers of execute_batch."""
+
+import asyncio
+
+from abstractions.ecs.callable_registry import CallableRegistry, ExecutionLimiter
+from abstractions.ecs.entity import Entity
+from abstractions.events.background_loop import run_sync
+
+
+class LimitedScore(Entity):
+    value: int = 0
+
+
+running = {"limited_double": 0, "unlimited_double": 0}
+peak = {"limited_double": 0, "unlimited_double": 0}
+
+
+async def tracked_double(func_name: str, value: int) -> LimitedScore:
+    running[func_name] += 1
+    peak[func_name] = max(peak[func_name], running[func_name])
+    try:
+        await asyncio.sleep(0.01)
+        return LimitedScore(value=value * 2)
+    finally:
+        running[func_name] -= 1
+
+
+@CallableRegistry.register("limited_double", max_concurrency=2)
+async def limited_double(score: LimitedScore) -> LimitedScore:
+    return await tracked_double("limited_double", score.value)
+
+
+@CallableRegistry.register("unlimited_double")
+async def unlimited_double(score: LimitedScore) -> LimitedScore:
+    return await tracked_double("unlimited_double", score.value)
+
+
+def registered_scores(count: int) -> list:
+    scores = [LimitedScore(value=value) for value in range(count)]
+    for score in scores:
+        score.promote_to_root()
+    return scores
+
+
+def test_limiter_admits_waiters_in_arrival_order():
+    limiter = ExecutionLimiter(max_concurrency=2)
+    admitted = []
+
+    async def holder(index: int, release: asyncio.Event) -> None:
+        await limiter.acquire()
+        admitted.append(index)
+        assert limiter.active <= 2
+        await release.wait()
+        limiter.release()
+
+    async def scenario() -> None:
+        releases = [asyncio.Event() for _ in range(5)]
+        tasks = []
+        for index, release in enumerate(releases):
+            tasks.append(asyncio.ensure_future(holder(index, release)))
+            await asyncio.sleep(0)  # Arrive one after the other
+        await asyncio.sleep(0.01)
+        assert admitted == [0, 1] and limiter.queue_depth == 3
+
+        # Release out of order: the freed slots still go to the oldest waiters
+        for index in [1, 0, 3, 2, 4]:
+            releases[index].set()
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+
+    run_sync(scenario())
+
+    assert admitted == [0, 1, 2, 3, 4]
+    stats = limiter.get_stats()
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+    assert stats["admitted"] == 5 and stats["queued"] == 3 and stats["max_queue_depth"] == 3
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = ExecutionLimiter(max_concurrency=1)
+
+    async def scenario() -> None:
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limiter.release()
+
+    run_sync(scenario())
+
+    assert limiter.active == 0 and limiter.queue_depth == 0
+
+
+def test_registered_max_concurrency_bounds_a_batch():
+    scores = registered_scores(6)
+    peak["limited_double"] = 0
+
+    results = CallableRegistry.execute_batch_sync(
+        [{"func_name": "limited_double", "score": score} for score in scores], max_concurrency=6
+    )
+
+    assert [result.value for result in results] == [score.value * 2 for score in scores]
+    assert peak["limited_double"] == 2
+    stats = CallableRegistry.get_concurrency_stats("limited_double")
+    assert stats["max_concurrency"] == 2 and stats["active"] == 0
+
+
+def test_execute_batch_runs_at_most_max_concurrency_workers():
+    scores = registered_scores(7)
+    peak["unlimited_double"] = 0
+
+    results = CallableRegistry.execute_batch_sync(
+        [{"func_name": "unlimited_double", "score": score} for score in scores], max_concurrency=3
+    )
+
+    assert [result.value for result in results] == [score.value * 2 for score in scores]
+    assert peak["unlimited_double"] == 3
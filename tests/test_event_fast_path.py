@@ -0,0 +1,97 @@
+"""emit_events skips event construction when nobody listens, without losing events once someone does."""
+
+import pytest
+from pydantic import BaseModel
+
+from abstractions.events import events
+from abstractions.events.events import Event, EventBus, emit_events, events_disabled
+
+
+class ScoringEvent(Event[BaseModel]):
+    type: str = "test.scoring"
+
+
+class ScoredEvent(Event[BaseModel]):
+    type: str = "test.scored"
+
+
+class ScoringFailedEvent(Event[BaseModel]):
+    type: str = "test.scoring_failed"
+
+
+factory_calls = {"creating": 0, "created": 0, "failed": 0}
+
+
+def creating(value):
+    factory_calls["creating"] += 1
+    return ScoringEvent()
+
+
+def created(result, value):
+    factory_calls["created"] += 1
+    return ScoredEvent()
+
+
+def failed(error, value):
+    factory_calls["failed"] += 1
+    return ScoringFailedEvent()
+
+
+@emit_events(creating_factory=creating, created_factory=created, failed_factory=failed)
+def score(value: int) -> int:
+    if value < 0:
+        raise ValueError("negative score")
+    return value * 2
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    """A private bus so subscriptions made by other tests cannot match."""
+    fresh = EventBus()
+    monkeypatch.setattr(events, "_event_bus", fresh)
+    return fresh
+
+
+def test_subscriber_added_after_first_call_receives_events(bus):
+    assert score(1) == 2  # Learns the event classes (if no earlier call did)
+    before = dict(factory_calls)
+    assert score(2) == 4  # Fast path: nobody listens
+    assert factory_calls == before
+    assert not bus.could_match(ScoringEvent)
+
+    received = []
+    bus.subscribe(received.append, event_types=[ScoringEvent, ScoredEvent])
+
+    assert bus.could_match(ScoringEvent)
+    assert score(3) == 6
+    assert [type(event) for event in received] == [ScoringEvent, ScoredEvent]
+
+    bus.unsubscribe(bus._type_subscriptions[ScoringEvent][0])
+    assert not bus.could_match(ScoringEvent)
+
+
+def test_events_disabled_bypasses_instrumentation(bus):
+    received = []
+    bus.subscribe(received.append, event_types=[ScoringEvent, ScoredEvent])
+
+    before = dict(factory_calls)
+    with events_disabled():
+        assert score(5) == 10
+    assert factory_calls == before
+    assert received == []
+
+    assert score(5) == 10
+    assert len(received) == 2
+
+
+def test_failure_event_reaches_listener_on_fast_path(bus):
+    assert score(1) == 2  # Learns the creating/created classes; nobody listens to them
+    received = []
+    bus.subscribe(received.append, event_types=ScoringFailedEvent)
+    before = factory_calls["creating"]
+
+    with pytest.raises(ValueError):
+        score(-1)
+
+    assert factory_calls["creating"] == before  # The failing call took the fast path
+    assert [type(event) for event in received] == [ScoringFailedEvent]
@@ -0,0 +1,82 @@
+"""ExecutionLog rows survive spilling to segment files: lookups, filtered scans and materialization."""
+
+import os
+from uuid import uuid4
+
+from abstractions.ecs.entity import EntityRegistry, FunctionExecution
+from abstractions.ecs.execution_log import ExecutionLog
+
+
+def log_rows(log: ExecutionLog, count: int) -> list:
+    """Append count rows alternating two functions; every third row failed."""
+    rows = []
+    for index in range(count):
+        failed = index % 3 == 0
+        fields = {
+            "function_name": "log_even" if index % 2 == 0 else "log_odd",
+            "execution_status": "failed" if failed else "completed",
+            "succeeded": not failed,
+            "error_message": f"row {index} failed" if failed else None,
+            "input_entity_id": uuid4(),
+            "output_entity_ids": [] if failed else [uuid4(), uuid4()],
+            "execution_duration": index / 100,
+            "entity_count_output": 0 if failed else 2,
+            "was_unpacked": not failed,
+        }
+        rows.append(dict(fields, ecs_id=log.append(fields)))
+    return rows
+
+
+def test_spilled_rows_reload_from_segments(tmp_path):
+    log = ExecutionLog(segment_dir=str(tmp_path), batch_size=2, segment_rows=4)
+    rows = log_rows(log, 10)
+    log.flush()
+
+    stats = log.get_stats()
+    assert stats["segments"] == 2 and stats["segment_rows"] == 8 and stats["in_memory_rows"] == 2
+    assert sorted(os.listdir(tmp_path)) == ["segment-000000.json", "segment-000001.json"]
+    assert len(log) == 10
+
+    # Lookups jump between segments and the in-memory tail
+    for row in [rows[9], rows[0], rows[5], rows[1], rows[8]]:
+        fields = log.get(row["ecs_id"])
+        assert fields["function_name"] == row["function_name"]
+        assert fields["execution_status"] == row["execution_status"]
+        assert fields["error_message"] == row["error_message"]
+        assert fields["input_entity_id"] == row["input_entity_id"]
+        assert fields["output_entity_ids"] == row["output_entity_ids"]
+        assert fields["execution_duration"] == row["execution_duration"]
+        assert fields["entity_count_output"] == row["entity_count_output"]
+        assert fields["was_unpacked"] == row["was_unpacked"]
+    assert log.get(uuid4()) is None
+
+
+def test_filtered_scans_cover_segments_and_tail(tmp_path):
+    log = ExecutionLog(segment_dir=str(tmp_path), batch_size=3, segment_rows=4)
+    rows = log_rows(log, 11)
+
+    assert [row["ecs_id"] for row in log.iter_rows()] == [row["ecs_id"] for row in rows]
+    assert [row["ecs_id"] for row in log.iter_rows(function_name="log_odd")] == \
+        [row["ecs_id"] for row in rows if row["function_name"] == "log_odd"]
+    assert [row["ecs_id"] for row in log.iter_rows(function_name="log_even", status="failed")] == \
+        [row["ecs_id"] for row in rows if row["function_name"] == "log_even" and row["execution_status"] == "failed"]
+    assert list(log.iter_rows(function_name="never_logged")) == []
+
+
+def test_materialize_spilled_row(tmp_path):
+    log = ExecutionLog(segment_dir=str(tmp_path), batch_size=1, segment_rows=2)
+    rows = log_rows(log, 5)
+
+    execution = log.materialize(rows[1]["ecs_id"], register=True)
+
+    assert isinstance(execution, FunctionExecution)
+    assert execution.ecs_id == rows[1]["ecs_id"]
+    assert execution.function_name == "log_odd" and execution.succeeded
+    assert execution.output_entity_ids == rows[1]["output_entity_ids"]
+    assert execution.was_unpacked and execution.entity_count_output == 2
+    assert execution.root_ecs_id in EntityRegistry.tree_registry
+
+    failed = log.materialize(rows[0]["ecs_id"])
+    assert failed.execution_status == "failed" and not failed.succeeded
+    assert failed.error_message == "row 0 failed"
+    assert log.materialize(uuid4()) is None
@@ -0,0 +1,29 @@
+"""Per-shape dispatch tables: partial metadata is built once and never reuses a call's bound values."""
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity
+
+
+class PlanCounter(Entity):
+    count: int = 0
+
+
+@CallableRegistry.register("plan_add_to_counter")
+def plan_add_to_counter(counter: PlanCounter, amount: int) -> PlanCounter:
+    return PlanCounter(count=counter.count + amount)
+
+
+def test_partial_metadata_is_cached_per_shape():
+    plan = CallableRegistry.get_metadata("plan_add_to_counter").execution_plan
+    counter = PlanCounter(count=1)
+    counter.promote_to_root()
+
+    first = CallableRegistry.execute("plan_add_to_counter", counter=counter, amount=2)
+    cached = dict(plan.partial_metadata)
+    second = CallableRegistry.execute("plan_add_to_counter", counter=counter, amount=10)
+
+    assert (first.count, second.count) == (3, 11)
+    assert len(cached) == 1
+    assert plan.partial_metadata == cached
+    (partial_metadata,) = cached.values()
+    assert partial_metadata.original_function.keywords == {}
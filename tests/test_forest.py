@@ -0,0 +1,48 @@
+"""Forest versioning commits worker-built trees bound to the live entities."""
+
+from typing import List
+
+import pytest
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.forest import ForestVersioner
+
+
+class ForestReading(Entity):
+    value: float = 0.0
+
+
+class ForestStation(Entity):
+    name: str = ""
+    readings: List[ForestReading] = []
+
+
+def working_forest(count: int) -> List[ForestStation]:
+    roots = []
+    for i in range(count):
+        station = ForestStation(name=f"s{i}", readings=[ForestReading(value=float(j)) for j in range(3)])
+        station.promote_to_root()
+        roots.append(EntityRegistry.get_stored_entity(station.root_ecs_id, station.ecs_id))
+    return roots
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_commit_versions_modified_roots_with_live_nodes(workers):
+    roots = working_forest(4)
+    roots[1].readings[0].value = 100.0
+    old_root_id = roots[1].ecs_id
+
+    with ForestVersioner(max_workers=workers, parallel_threshold=0) as versioner:
+        change_sets = versioner.diff(roots)
+        result = versioner.commit(roots, change_sets)
+
+    assert not result.failed_roots
+    assert result.versioned_roots == 1 and result.unchanged_roots == 3
+    assert result.new_root_ecs_ids == {old_root_id: roots[1].ecs_id}
+    assert all(change_set.tree is None for change_set in change_sets)
+
+    tree = EntityRegistry.tree_registry[roots[1].ecs_id]
+    assert tree.nodes[roots[1].ecs_id] is roots[1]
+    assert tree.nodes[roots[1].readings[0].ecs_id] is roots[1].readings[0]
+    stored = EntityRegistry.get_stored_entity(roots[1].ecs_id, roots[1].ecs_id)
+    assert stored.readings[0].value == 100.0
@@ -0,0 +1,149 @@
+"""Lineage export/import round trips rebuild the registries from JSON Lines."""
+
+import io
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity, EntityRegistry, FunctionExecution
+from abstractions.ecs.lineage_io import export_lineages, import_lineages, iter_lineage_file
+
+REGISTRIES = ("tree_registry", "lineage_registry", "live_id_registry", "ecs_id_to_root_id", "type_registry", "sibling_groups")
+
+
+class LineageItem(Entity):
+    label: str = ""
+    weight: Optional[float] = None
+
+
+class LineageBasket(Entity):
+    owner: str = ""
+    items: List[LineageItem] = []
+    by_name: Dict[str, LineageItem] = {}
+    favourite: Optional[LineageItem] = None
+
+
+@CallableRegistry.register("split_basket")
+def split_basket(basket: LineageBasket) -> Tuple[LineageItem, LineageItem]:
+    return LineageItem(label=f"{basket.owner}-first"), LineageItem(label=f"{basket.owner}-second")
+
+
+@pytest.fixture
+def clear_registries():
+    """Yield a function emptying EntityRegistry; the previous contents are restored afterwards."""
+    saved = {name: dict(getattr(EntityRegistry, name)) for name in REGISTRIES}
+
+    def clear():
+        for name in REGISTRIES:
+            getattr(EntityRegistry, name).clear()
+
+    yield clear
+    for name, contents in saved.items():
+        registry = getattr(EntityRegistry, name)
+        registry.clear()
+        registry.update(contents)
+
+
+def make_basket() -> LineageBasket:
+    apple, pear = LineageItem(label="apple", weight=1.5), LineageItem(label="pear")
+    basket = LineageBasket(owner="ada", items=[apple, pear], by_name={"plum": LineageItem(label="plum")}, favourite=LineageItem(label="fig"))
+    basket.promote_to_root()
+    return basket
+
+
+def test_export_import_restores_every_version(clear_registries):
+    basket = make_basket()
+    stored = EntityRegistry.get_stored_entity(basket.root_ecs_id, basket.ecs_id)
+    stored.items[1].weight = 2.0
+    EntityRegistry.version_entity(stored)
+    versions = list(EntityRegistry.lineage_registry[basket.lineage_id])
+    expected = {root_id: EntityRegistry.tree_registry[root_id] for root_id in versions}
+
+    buffer = io.StringIO()
+    assert export_lineages(buffer, [basket.lineage_id]) == len(versions) == 2
+
+    clear_registries()
+    buffer.seek(0)
+    result = import_lineages(buffer)
+
+    assert result.trees_imported == 2
+    assert result.lineage_ids == [basket.lineage_id]
+    assert EntityRegistry.lineage_registry[basket.lineage_id] == versions
+    assert EntityRegistry.type_registry[LineageBasket].count(basket.lineage_id) == 2
+    for root_id, tree in expected.items():
+        imported = EntityRegistry.tree_registry[root_id]
+        assert set(imported.nodes) == set(tree.nodes)
+        assert set(imported.edges) == set(tree.edges)
+        for node_id, entity in tree.nodes.items():
+            # Importing validates, which refreshes attribute_source left stale by versioning
+            assert imported.nodes[node_id].model_dump() == type(entity).model_validate(entity.model_dump()).model_dump()
+            # Unchanged sub-entities are shared between versions and map to the latest one
+            assert EntityRegistry.ecs_id_to_root_id[node_id] in versions
+    assert EntityRegistry.ecs_id_to_root_id[basket.ecs_id] == basket.root_ecs_id
+
+
+def test_import_rebuilds_containers_from_edges():
+    basket = make_basket()
+    buffer = io.StringIO()
+    export_lineages(buffer, [basket.lineage_id])
+    buffer.seek(0)
+
+    (tree,) = list(iter_lineage_file(buffer))
+    root = tree.nodes[tree.root_ecs_id]
+
+    assert [item.label for item in root.items] == ["apple", "pear"]
+    assert root.by_name["plum"].label == "plum"
+    assert root.favourite.label == "fig"
+    assert root.items[1].weight is None
+
+
+def test_import_skips_or_rejects_existing_trees():
+    basket = make_basket()
+    buffer = io.StringIO()
+    export_lineages(buffer, [basket.lineage_id])
+
+    buffer.seek(0)
+    assert import_lineages(buffer).trees_skipped == 1
+    buffer.seek(0)
+    with pytest.raises(ValueError):
+        import_lineages(buffer, skip_existing=False)
+
+
+def test_sibling_outputs_resolve_after_import(clear_registries):
+    basket = make_basket()
+    first, second = CallableRegistry.execute("split_basket", basket=basket)
+    execution_id = first.derived_from_execution_id
+    record_root = EntityRegistry.ecs_id_to_root_id[execution_id]
+    assert first.sibling_output_entities == [second.ecs_id]
+
+    lineage_ids = [first.lineage_id, second.lineage_id, EntityRegistry.tree_registry[record_root].lineage_id]
+    buffer = io.StringIO()
+    export_lineages(buffer, lineage_ids)
+    clear_registries()
+    buffer.seek(0)
+    import_lineages(buffer)
+
+    imported_first = EntityRegistry.get_stored_entity(first.root_ecs_id, first.ecs_id)
+    imported_second = EntityRegistry.get_stored_entity(second.root_ecs_id, second.ecs_id)
+    assert imported_first.sibling_output_entities == [second.ecs_id]
+    assert imported_second.sibling_output_entities == [first.ecs_id]
+
+
+def test_unregister_drops_sibling_groups():
+    basket = make_basket()
+    first, second = CallableRegistry.execute("split_basket", basket=basket)
+    execution_id = first.derived_from_execution_id
+    assert execution_id in EntityRegistry.sibling_groups
+
+    # Outputs gone, record still registered: the group stays with its record
+    EntityRegistry.unregister_tree(first.root_ecs_id)
+    EntityRegistry.unregister_tree(second.root_ecs_id)
+    assert execution_id not in EntityRegistry.sibling_groups
+
+    first, _ = CallableRegistry.execute("split_basket", basket=basket)
+    execution_id = first.derived_from_execution_id
+    record = EntityRegistry.get_stored_entity(EntityRegistry.ecs_id_to_root_id[execution_id], execution_id)
+    assert isinstance(record, FunctionExecution)
+    EntityRegistry.unregister_tree(record.root_ecs_id)
+    assert execution_id not in EntityRegistry.sibling_groups
@@ -0,0 +1,157 @@
+"""Pipeline scheduling: output bindings, failure handling and critical-path timing."""
+
+import asyncio
+import time
+from typing import Tuple
+
+import pytest
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity
+from abstractions.ecs.pipeline import NodeResult, OutputRef, Pipeline, UpstreamFailure
+from abstractions.events.background_loop import run_sync
+
+
+class PipeScore(Entity):
+    value: int = 0
+
+
+slow_calls = {"started": 0, "finished": 0}
+
+
+@CallableRegistry.register("pipe_split")
+def pipe_split(score: PipeScore) -> Tuple[PipeScore, PipeScore]:
+    return PipeScore(value=score.value // 2), PipeScore(value=score.value - score.value // 2)
+
+
+@CallableRegistry.register("pipe_add")
+def pipe_add(score: PipeScore, bonus: int) -> PipeScore:
+    return PipeScore(value=score.value + bonus)
+
+
+@CallableRegistry.register("pipe_scale")
+def pipe_scale(value: int, factor: int) -> PipeScore:
+    return PipeScore(value=value * factor)
+
+
+@CallableRegistry.register("pipe_fail")
+async def pipe_fail(score: PipeScore) -> PipeScore:
+    await asyncio.sleep(0.01)
+    raise ValueError("pipeline node failed")
+
+
+@CallableRegistry.register("pipe_slow")
+async def pipe_slow(score: PipeScore) -> PipeScore:
+    slow_calls["started"] += 1
+    await asyncio.sleep(1.0)
+    slow_calls["finished"] += 1
+    return PipeScore(value=score.value)
+
+
+def registered_score(value: int) -> PipeScore:
+    score = PipeScore(value=value)
+    score.promote_to_root()
+    return score
+
+
+def test_index_and_field_bindings():
+    pipeline = Pipeline("bindings")
+    halves = pipeline.add("split", "pipe_split", score=registered_score(9))
+    pipeline.add("boosted", "pipe_add", score=halves[1], bonus=1)
+    pipeline.add("scaled", "pipe_scale", value=halves[0].field("value"), factor=3)
+
+    result = pipeline.run()
+
+    low, high = result["split"]
+    assert (low.value, high.value) == (4, 5)
+    assert result["boosted"].value == 6
+    assert result["scaled"].value == 12
+    assert result.results["scaled"].ready_ms >= result.results["split"].end_ms
+    assert result.critical_path[0] == "split"
+
+
+def test_bindings_cannot_be_narrowed_twice():
+    with pytest.raises(ValueError):
+        OutputRef("split")[0][1]
+    with pytest.raises(ValueError):
+        OutputRef("split").field("value").field("value")
+
+
+def test_fail_fast_cancels_running_nodes():
+    pipeline = Pipeline("fail_fast")
+    score = registered_score(1)
+    pipeline.add("slow", "pipe_slow", score=score)
+    pipeline.add("broken", "pipe_fail", score=score)
+    before = dict(slow_calls)
+
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="pipeline node failed"):
+        pipeline.run(fail_fast=True)
+
+    assert time.perf_counter() - started < 1.0
+    assert slow_calls["started"] == before["started"] + 1
+    assert slow_calls["finished"] == before["finished"]
+
+
+def test_dependents_of_failures_are_skipped_without_fail_fast():
+    pipeline = Pipeline("keep_going")
+    score = registered_score(6)
+    broken = pipeline.add("broken", "pipe_fail", score=score)
+    dependent = pipeline.add("dependent", "pipe_add", score=broken, bonus=1)
+    pipeline.add("grandchild", "pipe_add", score=dependent, bonus=1)
+    pipeline.add("independent", "pipe_add", score=score, bonus=2)
+
+    result = pipeline.run(fail_fast=False)
+
+    statuses = {name: node.status for name, node in result.results.items()}
+    assert statuses == {"broken": "failed", "dependent": "skipped", "grandchild": "skipped", "independent": "completed"}
+    assert isinstance(result.results["dependent"].error, UpstreamFailure)
+    assert isinstance(result.results["grandchild"].error, UpstreamFailure)
+    assert result["independent"].value == 8
+    assert not result.succeeded
+    assert result.outputs.keys() == {"independent"}
+    assert result.critical_path == ["independent"]
+
+
+def test_critical_path_follows_last_finishing_dependency():
+    pipeline = Pipeline("timing")
+    score = registered_score(2)
+    first = pipeline.add("first", "pipe_add", score=score, bonus=1)
+    fast = pipeline.add("fast", "pipe_add", score=score, bonus=1)
+    slow = pipeline.add("slow", "pipe_add", score=first, bonus=1)
+    pipeline.add("join", "pipe_add", score=slow, bonus=1, after=[fast])
+
+    def timed(name: str, start_ms: float, end_ms: float, status: str = "completed") -> NodeResult:
+        return NodeResult(name, "pipe_add", status, start_ms=start_ms, end_ms=end_ms)
+
+    results = {
+        "first": timed("first", 0.0, 10.0),
+        "fast": timed("fast", 0.0, 5.0),
+        "slow": timed("slow", 10.0, 40.0),
+        "join": timed("join", 40.0, 45.0),
+    }
+    assert pipeline._critical_path(results) == (["first", "slow", "join"], 45.0)
+
+    results["join"] = timed("join", 0.0, 0.0, status="skipped")
+    assert pipeline._critical_path(results) == (["first", "slow"], 40.0)
+    assert pipeline._critical_path({}) == ([], 0.0)
+
+
+def test_astream_yields_results_in_completion_order():
+    pipeline = Pipeline("stream")
+    score = registered_score(3)
+    pipeline.add("slow", "pipe_slow", score=score)
+    pipeline.add("quick", "pipe_add", score=score, bonus=1)
+    before = dict(slow_calls)
+
+    async def first_result() -> NodeResult:
+        stream = pipeline.astream()
+        try:
+            return await stream.__anext__()
+        finally:
+            await stream.aclose()  # Stopping early cancels the nodes still running
+
+    first = run_sync(first_result())
+
+    assert first.name == "quick" and first.output.value == 4
+    assert slow_calls["finished"] == before["finished"]
@@ -0,0 +1,56 @@
+"""Process-target functions register with the decorator and run in worker processes."""
+
+from typing import List
+
+import pytest
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity
+
+
+class ProcReading(Entity):
+    value: float = 0.0
+
+
+@CallableRegistry.register("proc_double_reading", execution_target="process")
+def proc_double_reading(reading: ProcReading) -> ProcReading:
+    return ProcReading(value=reading.value * 2)
+
+
+@CallableRegistry.register_batch("proc_double_readings", execution_target="process")
+def proc_double_readings(readings: List[ProcReading]) -> List[ProcReading]:
+    return [ProcReading(value=reading.value * 2) for reading in readings]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def process_pool():
+    yield
+    CallableRegistry.shutdown_process_pool()
+
+
+def test_decorated_function_runs_in_process():
+    reading = ProcReading(value=1.5)
+    reading.promote_to_root()
+    result = CallableRegistry.execute("proc_double_reading", reading=reading)
+    assert result.value == 3.0
+
+
+def test_decorated_batch_function_runs_in_process():
+    readings = [ProcReading(value=float(i)) for i in range(3)]
+    for reading in readings:
+        reading.promote_to_root()
+    results = CallableRegistry.map("proc_double_readings", readings)
+    assert [result.value for result in results] == [0.0, 2.0, 4.0]
+
+
+def test_nested_functions_are_rejected_at_registration():
+    def nested(reading: ProcReading) -> ProcReading:
+        return reading
+
+    def nested_batch(readings: List[ProcReading]) -> List[ProcReading]:
+        return readings
+
+    with pytest.raises(ValueError, match="module level"):
+        CallableRegistry.register("proc_nested", execution_target="process")(nested)
+    with pytest.raises(ValueError, match="module level"):
+        CallableRegistry.register_batch("proc_nested_batch", execution_target="process")(nested_batch)
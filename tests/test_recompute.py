@@ -0,0 +1,92 @@
+"""Incremental recomputation re-runs only the computations downstream of a changed input."""
+
+import pytest
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.ecs.recompute import RecomputeEngine
+
+
+class RecomputePrice(Entity):
+    amount: float = 0.0
+    note: str = ""
+
+
+class RecomputeTaxed(Entity):
+    amount: float = 0.0
+
+
+class RecomputeLabel(Entity):
+    text: str = ""
+
+
+@CallableRegistry.register("recompute_add_tax")
+def recompute_add_tax(price: RecomputePrice) -> RecomputeTaxed:
+    return RecomputeTaxed(amount=round(price.amount * 1.2, 2))
+
+
+@CallableRegistry.register("recompute_label")
+def recompute_label(taxed: RecomputeTaxed) -> RecomputeLabel:
+    return RecomputeLabel(text=f"{taxed.amount:.2f}")
+
+
+@pytest.fixture(autouse=True)
+def tracking():
+    RecomputeEngine.clear()
+    RecomputeEngine.enable()
+    yield
+    RecomputeEngine.disable()
+    RecomputeEngine.clear()
+
+
+def run_chain(amount: float):
+    price = RecomputePrice(amount=amount)
+    price.promote_to_root()
+    taxed = CallableRegistry.execute("recompute_add_tax", price=price)
+    label = CallableRegistry.execute("recompute_label", taxed=taxed)
+    return price, taxed, label
+
+
+def new_version(price: RecomputePrice, **changes) -> RecomputePrice:
+    stored = EntityRegistry.get_stored_entity(price.root_ecs_id, price.ecs_id)
+    for name, value in changes.items():
+        setattr(stored, name, value)
+    EntityRegistry.version_entity(stored)
+    return stored
+
+
+def test_change_recomputes_downstream_in_order():
+    price, taxed, label = run_chain(10.0)
+    assert [record.function_name for record in RecomputeEngine.affected_computations(new_version(price, amount=20.0))] == [
+        "recompute_add_tax", "recompute_label"
+    ]
+
+
+def test_recompute_threads_new_records_and_outputs():
+    price, taxed, label = run_chain(10.0)
+    (tax_record,) = RecomputeEngine.consumers_of(price.ecs_id)
+    (label_record,) = RecomputeEngine.consumers_of(taxed.ecs_id)
+
+    result = RecomputeEngine.recompute(new_version(price, amount=20.0))
+
+    assert [old for old, _ in result.recomputed] == [tax_record.record_id, label_record.record_id]
+    for old_id, new_id in result.recomputed:
+        old, new = RecomputeEngine.get_record(old_id), RecomputeEngine.get_record(new_id)
+        assert old.superseded_by == new_id
+        assert new.function_name == old.function_name
+    assert [type(output) for output in result.outputs] == [RecomputeTaxed, RecomputeLabel]
+    assert result.outputs[1].text == "24.00"
+    assert RecomputeEngine.consumers_of(price.ecs_id) == []
+
+
+def test_content_identical_version_is_skipped():
+    price, taxed, label = run_chain(5.0)
+    (tax_record,) = RecomputeEngine.consumers_of(price.ecs_id)
+    (label_record,) = RecomputeEngine.consumers_of(taxed.ecs_id)
+
+    current = new_version(new_version(price, note="x"), note="")  # two versions later, same content
+    result = RecomputeEngine.recompute(current)
+
+    assert result.recomputed == []
+    assert result.skipped == [tax_record.record_id, label_record.record_id]
+    assert RecomputeEngine.consumers_of(current.ecs_id) == [tax_record]
@@ -0,0 +1,109 @@
+"""Result cache keys follow entity content, and cached returns keep their shape through any backend."""
+
+import json
+from collections.abc import MutableMapping
+from typing import Tuple
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity, EntityRegistry
+from abstractions.events.background_loop import run_sync
+
+
+class CachedScore(Entity):
+    value: int = 0
+
+
+class JsonBackend(MutableMapping):
+    """Persistent-store stand-in: every entry is JSON-encoded on write and decoded on read."""
+
+    def __init__(self):
+        self.data = {}
+
+    def __getitem__(self, key):
+        return json.loads(self.data[key])
+
+    def __setitem__(self, key, value):
+        self.data[key] = json.dumps(value)
+
+    def __delitem__(self, key):
+        del self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+
+single_backend, list_backend = JsonBackend(), JsonBackend()
+
+
+@CallableRegistry.register("cached_double_score", cache=True, cache_backend=single_backend)
+def cached_double_score(score: CachedScore) -> CachedScore:
+    return CachedScore(value=score.value * 2)
+
+
+@CallableRegistry.register("cached_split_score", cache=True, cache_backend=list_backend)
+def cached_split_score(score: CachedScore) -> Tuple[CachedScore, CachedScore]:
+    return CachedScore(value=score.value // 2), CachedScore(value=score.value - score.value // 2)
+
+
+def registered_score(value: int) -> CachedScore:
+    score = CachedScore(value=value)
+    score.promote_to_root()
+    return score
+
+
+def forget_memory(func_name: str) -> None:
+    """Drop the in-memory entries so the next lookup reads the backend."""
+    CallableRegistry._result_caches[func_name]._entries.clear()
+
+
+def test_single_result_shape_survives_json_backend():
+    score = registered_score(4)
+    first = CallableRegistry.execute("cached_double_score", score=score)
+    forget_memory("cached_double_score")
+    outcome = run_sync(CallableRegistry.aexecute_detailed("cached_double_score", score=score))
+
+    assert outcome.cached
+    assert isinstance(outcome.result, CachedScore)
+    assert outcome.result.ecs_id == first.ecs_id
+
+
+def test_multi_output_result_stays_a_list():
+    score = registered_score(7)
+    first = CallableRegistry.execute("cached_split_score", score=score)
+    forget_memory("cached_split_score")
+    outcome = run_sync(CallableRegistry.aexecute_detailed("cached_split_score", score=score))
+
+    assert outcome.cached
+    assert isinstance(first, list) and isinstance(outcome.result, list)
+    assert [output.ecs_id for output in outcome.result] == [output.ecs_id for output in first]
+
+
+def test_cache_key_follows_content_not_live_identity():
+    score = registered_score(3)
+    copy = EntityRegistry.get_stored_entity(score.root_ecs_id, score.ecs_id)
+    key = CallableRegistry._result_cache_key
+
+    same = run_sync(key("cached_double_score", {"score": score}))
+    assert run_sync(key("cached_double_score", {"score": copy})) == same
+
+    copy.value = 30  # unversioned in-place edit
+    assert run_sync(key("cached_double_score", {"score": copy})) != same
+    assert copy.ecs_id == score.ecs_id  # key computation does not version the input
+
+
+def test_stale_entry_counts_as_one_miss():
+    score = registered_score(9)
+    first = CallableRegistry.execute("cached_double_score", score=score)
+    before = CallableRegistry.get_result_cache_stats("cached_double_score")
+    EntityRegistry.unregister_tree(first.root_ecs_id)
+
+    outcome = run_sync(CallableRegistry.aexecute_detailed("cached_double_score", score=score))
+
+    stats = CallableRegistry.get_result_cache_stats("cached_double_score")
+    assert not outcome.cached
+    assert outcome.result.value == 18
+    assert stats["hits"] == before["hits"]
+    assert stats["misses"] == before["misses"] + 1
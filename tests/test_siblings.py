@@ -0,0 +1,41 @@
+"""sibling_output_entities reads and writes the shared sibling group of an execution."""
+
+from uuid import uuid4
+
+import pytest
+
+from abstractions.ecs.entity import Entity, EntityRegistry
+
+
+class SiblingPart(Entity):
+    name: str = ""
+
+
+def test_assigning_siblings_records_one_shared_group():
+    parts = [SiblingPart(name=str(i)) for i in range(3)]
+    execution_id = uuid4()
+    for index, part in enumerate(parts):
+        part.derived_from_execution_id = execution_id
+        part.output_index = index
+        part.sibling_output_entities = [other.ecs_id for other in parts if other is not part]
+
+    assert EntityRegistry.sibling_groups[execution_id] == [part.ecs_id for part in parts]
+    for part in parts:
+        assert part.sibling_output_entities == [other.ecs_id for other in parts if other is not part]
+
+
+def test_siblings_without_index_exclude_self():
+    first, second = SiblingPart(name="a"), SiblingPart(name="b")
+    first.derived_from_execution_id = second.derived_from_execution_id = uuid4()
+    first.sibling_output_entities = [second.ecs_id]
+
+    assert first.sibling_output_entities == [second.ecs_id]
+    assert second.sibling_output_entities == [first.ecs_id]
+
+
+def test_siblings_are_not_serialized_and_need_an_execution():
+    part = SiblingPart(name="alone")
+    assert part.sibling_output_entities == []
+    assert "sibling_output_entities" not in part.model_dump()
+    with pytest.raises(ValueError):
+        part.sibling_output_entities = [uuid4()]
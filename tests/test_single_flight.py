@@ -0,0 +1,75 @@
+"""Single-flight functions run concurrent identical calls once and share the outcome with every caller."""
+
+import asyncio
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity
+from abstractions.events.background_loop import run_sync
+
+
+class FlightScore(Entity):
+    value: int = 0
+
+
+calls = {"flight_double": 0, "flight_fail": 0}
+
+
+@CallableRegistry.register("flight_double", single_flight=True)
+async def flight_double(score: FlightScore) -> FlightScore:
+    calls["flight_double"] += 1
+    await asyncio.sleep(0.05)
+    return FlightScore(value=score.value * 2)
+
+
+@CallableRegistry.register("flight_fail", single_flight=True)
+async def flight_fail(score: FlightScore) -> FlightScore:
+    calls["flight_fail"] += 1
+    await asyncio.sleep(0.05)
+    raise ValueError(f"cannot score {score.value}")
+
+
+def registered_score(value: int) -> FlightScore:
+    score = FlightScore(value=value)
+    score.promote_to_root()
+    return score
+
+
+def in_flight(func_name: str) -> list:
+    return [key for key in CallableRegistry._inflight if key[1] == func_name]
+
+
+async def call_concurrently(func_name: str, score: FlightScore, count: int) -> list:
+    return await asyncio.gather(
+        *(CallableRegistry.aexecute_detailed(func_name, score=score) for _ in range(count)),
+        return_exceptions=True
+    )
+
+
+def test_identical_concurrent_calls_run_once_and_share_the_result():
+    score = registered_score(5)
+    before = calls["flight_double"]
+
+    outcomes = run_sync(call_concurrently("flight_double", score, 3))
+
+    assert calls["flight_double"] == before + 1
+    assert len({outcome.result.ecs_id for outcome in outcomes}) == 1
+    assert outcomes[0].result.value == 10
+    assert sum(outcome.coalesced for outcome in outcomes) == 2
+    assert not in_flight("flight_double")
+
+
+def test_failure_reaches_every_waiter_and_clears_the_flight():
+    score = registered_score(3)
+    before = calls["flight_fail"]
+
+    results = run_sync(call_concurrently("flight_fail", score, 3))
+
+    assert calls["flight_fail"] == before + 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert {str(result) for result in results} == {"cannot score 3"}
+    assert not in_flight("flight_fail")
+
+    # Nothing is left behind: the next identical call runs again
+    retry = run_sync(call_concurrently("flight_fail", score, 1))
+    assert isinstance(retry[0], ValueError)
+    assert calls["flight_fail"] == before + 2
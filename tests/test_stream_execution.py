@@ -0,0 +1,96 @@
+"""Streaming executions register each output as it is yielded and clean up when the consumer stops early."""
+
+from typing import AsyncIterator
+
+from abstractions.ecs.callable_registry import CallableRegistry
+from abstractions.ecs.entity import Entity, EntityRegistry, FunctionExecution
+from abstractions.ecs.provenance_index import ProvenanceIndex
+from abstractions.events.background_loop import run_sync
+
+
+class StreamOrder(Entity):
+    lines: int = 0
+
+
+class StreamLine(Entity):
+    number: int = 0
+
+
+produced = {"stream_order_lines": 0}
+closed = {"stream_order_lines": 0}
+
+
+@CallableRegistry.register("stream_order_lines", max_concurrency=1)
+async def stream_order_lines(order: StreamOrder) -> AsyncIterator[StreamLine]:
+    try:
+        for number in range(order.lines):
+            produced["stream_order_lines"] += 1
+            yield StreamLine(number=number)
+    finally:
+        closed["stream_order_lines"] += 1
+
+
+def registered_order(lines: int) -> StreamOrder:
+    order = StreamOrder(lines=lines)
+    order.promote_to_root()
+    return order
+
+
+def execution_record(execution_id) -> FunctionExecution:
+    return EntityRegistry.get_stored_entity(execution_id, execution_id)
+
+
+def test_each_item_is_registered_with_provenance_before_the_next_is_produced():
+    order = registered_order(3)
+    before = produced["stream_order_lines"]
+
+    async def consume() -> list:
+        seen = []
+        async for line in CallableRegistry.aexecute_stream("stream_order_lines", order=order):
+            # The consumer holds this entity before the generator produced the next one
+            assert produced["stream_order_lines"] == before + len(seen) + 1
+            assert line.root_ecs_id in EntityRegistry.tree_registry
+            assert line.derived_from_function == "stream_order_lines"
+            assert line.output_index == len(seen)
+            assert order.ecs_id in ProvenanceIndex.dependencies_of(line.ecs_id)
+            seen.append(line)
+        return seen
+
+    lines = run_sync(consume())
+
+    assert [line.number for line in lines] == [0, 1, 2]
+    execution_id = lines[0].derived_from_execution_id
+    assert all(line.derived_from_execution_id == execution_id for line in lines)
+    record = execution_record(execution_id)
+    assert record.output_entity_ids == [line.ecs_id for line in lines]
+    assert record.input_entity_id == order.ecs_id
+    assert record.execution_pattern == "async_generator"
+    assert not record.execution_metadata["closed_early"]
+    assert lines[1].sibling_output_entities == [lines[0].ecs_id, lines[2].ecs_id]
+
+
+def test_stopping_early_closes_the_generator_and_records_what_was_produced():
+    order = registered_order(5)
+    before_produced, before_closed = produced["stream_order_lines"], closed["stream_order_lines"]
+
+    async def take_first() -> StreamLine:
+        stream = CallableRegistry.aexecute_stream("stream_order_lines", order=order)
+        try:
+            return await stream.__anext__()
+        finally:
+            await stream.aclose()
+
+    first = run_sync(take_first())
+
+    assert produced["stream_order_lines"] == before_produced + 1
+    assert closed["stream_order_lines"] == before_closed + 1
+    record = execution_record(first.derived_from_execution_id)
+    assert record.output_entity_ids == [first.ecs_id]
+    assert record.execution_metadata["closed_early"]
+    assert record.sibling_groups == []
+
+    # The concurrency slot was released, so the next stream is admitted at once
+    stats = CallableRegistry.get_concurrency_stats("stream_order_lines")
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+    again = run_sync(take_first())
+    assert again.number == 0
@@ -0,0 +1,56 @@
+"""Timed-out executions unregister the input entities they created and record a failure."""
+
+import asyncio
+
+import pytest
+
+from abstractions.ecs.callable_registry import CallableRegistry, ExecutionTimeoutError
+from abstractions.ecs.entity import Entity, EntityRegistry, FunctionExecution
+
+
+class TimedItem(Entity):
+    value: float = 0.0
+
+
+@CallableRegistry.register("slow_scale_item")
+async def slow_scale_item(item: TimedItem, factor: float) -> TimedItem:
+    await asyncio.sleep(5)
+    return TimedItem(value=item.value * factor)
+
+
+def test_timeout_rolls_back_execution_inputs():
+    item = TimedItem(value=2.0)
+    item.promote_to_root()
+    before = set(EntityRegistry.tree_registry)
+    stats_before = CallableRegistry.get_timeout_stats("slow_scale_item")
+
+    with pytest.raises(ExecutionTimeoutError):
+        asyncio.run(CallableRegistry.aexecute_with_timeout("slow_scale_item", 0.05, item=item, factor=3.0))
+
+    stats = CallableRegistry.get_timeout_stats("slow_scale_item")
+    assert stats["timeouts"] == stats_before["timeouts"] + 1
+    assert stats["rolled_back_entities"] > stats_before["rolled_back_entities"]
+    # Only the failed execution record remains; the caller's entity is untouched
+    added = [EntityRegistry.tree_registry[root_id] for root_id in set(EntityRegistry.tree_registry) - before]
+    assert [type(tree.nodes[tree.root_ecs_id]) for tree in added] == [FunctionExecution]
+    record = added[0].nodes[added[0].root_ecs_id]
+    assert record.succeeded is False and record.execution_pattern == "timeout"
+    assert item.root_ecs_id in EntityRegistry.tree_registry
+
+
+def test_unregister_keeps_lineage_while_versions_remain():
+    item = TimedItem(value=1.0)
+    item.promote_to_root()
+    stored = EntityRegistry.get_stored_entity(item.root_ecs_id, item.ecs_id)
+    stored.value = 2.0
+    EntityRegistry.version_entity(stored)
+    first, second = EntityRegistry.lineage_registry[item.lineage_id]
+
+    assert EntityRegistry.unregister_tree(second)
+    assert EntityRegistry.lineage_registry[item.lineage_id] == [first]
+    assert item.lineage_id in EntityRegistry.type_registry[TimedItem]
+
+    assert EntityRegistry.unregister_tree(first)
+    assert item.lineage_id not in EntityRegistry.lineage_registry
+    assert item.lineage_id not in EntityRegistry.type_registry[TimedItem]
+    assert not EntityRegistry.unregister_tree(first)